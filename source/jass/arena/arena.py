@@ -15,8 +15,10 @@ import numpy as np
 from jass.base.const import *
 from jass.base.round import Round
 from jass.base.round_factory import get_round
+from jass.base.deal import deal_seeds
 from jass.base.player_round import PlayerRound
 from jass.player.player import Player
+from jass.player.search_budget import SearchBudget
 from jass.arena.trump_selection_strategy import TrumpStrategy
 from jass.arena.play_game_strategy import PlayGameStrategy
 
@@ -32,10 +34,17 @@ class Arena:
     The class uses the strategy and template methods patterns. Most common behaviour can be modified by using the
     appropriate strategy, but there is currently no strategy to change how cards are dealt.
 
+    If a seed is given, the cards of each round are dealt from a seed drawn from a random generator initialized
+    with the seed (see jass.base.deal). The seed of the current deal is available as deal_seed, so that a
+    single round can be reproduced using Round.deal_cards(seed=deal_seed).
+
+    If a time budget is given, each card is requested with Player.play_card_with_budget and a deadline that many
+    seconds after the request, otherwise with Player.play_card.
     """
     def __init__(self, jass_type: str,
                  trump_strategy: TrumpStrategy, play_game_strategy: PlayGameStrategy,
-                 print_every_x_games: int = 1, check_move_validity=True):
+                 print_every_x_games: int = 1, check_move_validity=True, seed: int = None,
+                 time_budget: float = None):
         self._nr_games_to_play = 0
 
         # the jass type, used to get the correct round
@@ -51,6 +60,13 @@ class Arena:
         # the current round that is being played
         self._rnd = None                                # type: Round
 
+        # random generator for the seeds of the deals (if a seed was given) and the seed of the current deal
+        self._rng = np.random.default_rng(seed) if seed is not None else None
+        self._deal_seed = None                          # type: int
+
+        # time in seconds for each card played, or None to let the players decide
+        self._time_budget = time_budget                 # type: float
+
         # Statistics about the games played
         self._nr_wins_team_0 = 0                        # type: int
         self._nr_wins_team_1 = 0                        # type: int
@@ -71,6 +87,14 @@ class Arena:
     def nr_games_to_play(self, value):
         self._nr_games_to_play = value
 
+    @property
+    def time_budget(self) -> float or None:
+        return self._time_budget
+
+    @time_budget.setter
+    def time_budget(self, value: float or None):
+        self._time_budget = value
+
     # We define properties for the individual players to set/get them easily by name
     @property
     def north(self) -> Player:
@@ -112,6 +136,10 @@ class Arena:
     def current_rnd(self):
         return self._rnd
 
+    @property
+    def deal_seed(self) -> int or None:
+        return self._deal_seed
+
     # properties for the results (no setters as the values are set by the strategies using the add_win_team_x methods)
     @property
     def nr_games_played(self):
@@ -209,7 +237,9 @@ class Arena:
         Deal cards at the beginning of a round. Default is to deal the cards randomly using the method in
         Round, but the behaviour can be overridden in a derived class.
         """
-        self._rnd.deal_cards()
+        if self._rng is not None:
+            self._deal_seed = int(deal_seeds(1, self._rng)[0])
+        self._rnd.deal_cards(seed=self._deal_seed)
 
     def _play_card_unchecked(self, card_action: int) -> None:
         self._rnd.action_play_card(card_action)
@@ -228,10 +258,25 @@ class Arena:
         player_rnd = self.get_player_round()
         for cards in range(36):
             player_rnd.set_from_round(self._rnd)
-            card_action = self._players[player_rnd.player].play_card(player_rnd)
+            player = self._players[player_rnd.player]
+            if self._time_budget is not None:
+                card_action = player.play_card_with_budget(player_rnd, SearchBudget.from_time(self._time_budget))
+            else:
+                card_action = player.play_card(player_rnd)
             print(card_action)
             self._play_card_strat(card_action)
 
+    def close_players(self) -> None:
+        """
+        Close the players (see Player.close), for example to stop their worker processes after all games have
+        been played. Players that play more than one position are closed once.
+        """
+        closed = []
+        for player in self._players:
+            if player is not None and all(player is not other for other in closed):
+                player.close()
+                closed.append(player)
+
     def play_game(self):
         """
         Play one game.
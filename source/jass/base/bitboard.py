@@ -0,0 +1,109 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Tables and small utility functions to represent sets of cards as 36 bit python integers (bitboards).
+
+Bit i of a bitboard is set if card i (as defined in jass.base.const) is contained in the set, so the bitboard
+corresponds directly to the 1-hot encoded arrays used elsewhere. Operations on single hands are considerably
+faster using python integers than using small numpy arrays, as the overhead of the numpy calls dominates for
+arrays of length 36.
+"""
+
+import numpy as np
+
+from jass.base.const import higher_trump, lower_trump
+
+# all cards
+ALL_CARDS_BITS = (1 << 36) - 1          # type: int
+
+# mask of the 9 cards of one color, starting from bit 0
+COLOR_BITS = (1 << 9) - 1               # type: int
+
+# bit of each single card
+card_bits = [1 << card for card in range(36)]
+
+# bit offset of the cards of each color
+color_shift = [0, 9, 18, 27]
+
+# bitboard of the cards of each color, corresponds to const.color_masks
+color_masks_bits = [COLOR_BITS << shift for shift in color_shift]
+
+# the values of the bits of the cards, used to convert 1-hot encoded arrays to bitboards
+_card_bit_values = np.array(card_bits, dtype=np.int64)
+
+# shift to use to convert bitboards to 1-hot encoded arrays
+_card_shifts = np.arange(36, dtype=np.int64)
+
+
+def cards_to_bits(cards: np.ndarray) -> int:
+    """
+    Convert a 1-hot encoded array of cards to a bitboard.
+
+    Args:
+        cards: 1-hot encoded array of length 36
+
+    Returns:
+        the bitboard of the cards
+    """
+    return int(np.dot(cards, _card_bit_values))
+
+
+def bits_to_cards(bits: int) -> np.ndarray:
+    """
+    Convert a bitboard to a 1-hot encoded array of cards.
+
+    Args:
+        bits: the bitboard of the cards
+
+    Returns:
+        1-hot encoded array of length 36
+    """
+    return ((np.int64(bits) >> _card_shifts) & 1).astype(np.int32)
+
+
+def _mask_to_bits(mask: np.ndarray) -> int:
+    return sum(card_bits[card] for card in np.flatnonzero(mask))
+
+
+# bitboards of the rows of const.higher_trump and const.lower_trump
+higher_trump_bits = [_mask_to_bits(higher_trump[card, :]) for card in range(36)]
+lower_trump_bits = [_mask_to_bits(lower_trump[card, :]) for card in range(36)]
+
+# number of bits set in a 9 bit integer (i.e. the cards of one color)
+popcount_color = [bin(i).count('1') for i in range(1 << 9)]
+
+
+def popcount(bits: int) -> int:
+    """
+    Count the number of cards in a bitboard using the table for one color.
+
+    Args:
+        bits: the bitboard of the cards
+
+    Returns:
+        the number of cards in the bitboard
+    """
+    return popcount_color[bits & COLOR_BITS] + \
+        popcount_color[(bits >> 9) & COLOR_BITS] + \
+        popcount_color[(bits >> 18) & COLOR_BITS] + \
+        popcount_color[(bits >> 27) & COLOR_BITS]
+
+
+def bits_to_int_list(bits: int) -> list:
+    """
+    Get the cards in the bitboard as list of int encoded cards in increasing order.
+
+    Args:
+        bits: the bitboard of the cards
+
+    Returns:
+        list of the cards
+    """
+    result = []
+    while bits:
+        lowest = bits & -bits
+        result.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return result
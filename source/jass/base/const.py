@@ -298,6 +298,27 @@ lower_trump[9:18, 9:18] = lower_trump_card
 lower_trump[18:27, 18:27] = lower_trump_card
 lower_trump[27:36, 27:36] = lower_trump_card
 
+#
+# 2D array of the strength of the cards for each trump (rows) used to determine the winner of a trick: the winner
+# is the card with the highest strength among the cards that are trump or have the color of the first card. The
+# strength follows the card order within a color (A highest for obe and colors, 6 highest for une), trump cards
+# are ordered by the trump order (J, 9, A, K, Q, 10, 8, 7, 6) and are stronger than any other card.
+#
+card_strength = np.tile(9 - offset_of_card, (6, 1))
+card_strength[UNE_UFE, :] = 1 + offset_of_card
+for _color in range(4):
+    card_strength[_color, color_offset[_color]:color_offset[_color] + 9] = 18 - higher_trump_card.sum(axis=1)
+
+#
+# 3D array of the strength of the cards in a trick for each trump and color of the first card of the trick, which is
+# the value from card_strength if the card is trump or has the color of the first card and 0 otherwise. The winner
+# of a trick is the card with the highest value.
+#
+trick_card_strength = np.zeros([6, 4, 36], np.int32)
+for _color in range(4):
+    trick_card_strength[:, _color, :] = card_strength * ((color_of_card == _color) |
+                                                         (color_of_card[None, :] == np.arange(6)[:, None]))
+
 # next player of player with given index
 next_player = [3, 0, 1, 2]
 
@@ -0,0 +1,132 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Dealing of the cards for a large number of rounds at once.
+
+Every deal is determined by its own 64 bit seed, so that a single deal can be reproduced from its seed alone,
+independent of the number of deals that were created together or of the process that created them. The seeds
+are drawn from a numpy random generator and the cards are shuffled by sorting 36 pseudo random keys that are
+calculated from the seed with the splitmix64 function, which is done for all the deals using numpy operations.
+
+The deals are available as owners, i.e. a [N,36] array with the player that holds each card, or as one-hot encoded
+hands with the shape [N,4,36] as used in Round.
+"""
+import numpy as np
+
+# constants of the splitmix64 function
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+# increments of the state for the keys of the 36 cards
+_card_increments = np.arange(1, 37, dtype=np.uint64) * _GOLDEN_GAMMA
+
+# the player that receives the card at each position of the shuffled deck (the first 9 cards go to player 0 etc.)
+_owner_of_position = np.arange(36, dtype=np.int32) // 9
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """
+    Mix the bits of 64 bit unsigned integers using the finalizer of splitmix64. The calculations wrap around
+    as required.
+    """
+    x = (x ^ (x >> np.uint64(30))) * _MIX_1
+    x = (x ^ (x >> np.uint64(27))) * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def get_generator(rng: np.random.Generator or int or None = None) -> np.random.Generator:
+    """
+    Get a random generator from the argument.
+
+    Args:
+        rng: a generator that is returned unchanged, a seed for a new generator or None for a generator seeded
+        from the operating system
+
+    Returns:
+        the random generator
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def deal_seeds(nr_deals: int, rng: np.random.Generator or int or None = None) -> np.ndarray:
+    """
+    Draw the seeds for a number of deals.
+
+    Args:
+        nr_deals: the number N of deals
+        rng: the random generator (or a seed for it, see get_generator)
+
+    Returns:
+        [N] array of seeds (uint64)
+    """
+    return get_generator(rng).integers(0, np.iinfo(np.uint64).max, size=nr_deals, dtype=np.uint64,
+                                       endpoint=True)
+
+
+def owners_from_seeds(seeds: np.ndarray or int) -> np.ndarray:
+    """
+    Calculate the deals for the given seeds as owners of the cards.
+
+    Args:
+        seeds: [N] array of seeds of the deals (or a single seed)
+
+    Returns:
+        [N,36] array with the player that holds each card (or [36] array for a single seed)
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        keys = _splitmix64(seeds[..., None] + _card_increments)
+    # the cards in the order of the shuffled deck
+    cards = np.argsort(keys, axis=-1)
+    owners = np.empty(cards.shape, dtype=np.int32)
+    np.put_along_axis(owners, cards, np.broadcast_to(_owner_of_position, cards.shape), axis=-1)
+    return owners
+
+
+def hands_from_owners(owners: np.ndarray) -> np.ndarray:
+    """
+    Convert the owners of the cards to one-hot encoded hands.
+
+    Args:
+        owners: [N,36] array with the player that holds each card (or [36] for a single deal)
+
+    Returns:
+        [N,4,36] array of one-hot encoded hands (or [4,36] for a single deal)
+    """
+    owners = np.asarray(owners)
+    return (owners[..., None, :] == np.arange(4)[:, None]).astype(np.int32)
+
+
+def deal_owners(nr_deals: int, rng: np.random.Generator or int or None = None) -> (np.ndarray, np.ndarray):
+    """
+    Deal the cards for a number of rounds and return them as owners of the cards.
+
+    Args:
+        nr_deals: the number N of deals
+        rng: the random generator (or a seed for it, see get_generator)
+
+    Returns:
+        [N,36] array with the player that holds each card and [N] array with the seed of each deal
+    """
+    seeds = deal_seeds(nr_deals, rng)
+    return owners_from_seeds(seeds), seeds
+
+
+def deal_hands(nr_deals: int, rng: np.random.Generator or int or None = None) -> (np.ndarray, np.ndarray):
+    """
+    Deal the cards for a number of rounds and return them as one-hot encoded hands.
+
+    Args:
+        nr_deals: the number N of deals
+        rng: the random generator (or a seed for it, see get_generator)
+
+    Returns:
+        [N,4,36] array of one-hot encoded hands and [N] array with the seed of each deal
+    """
+    owners, seeds = deal_owners(nr_deals, rng)
+    return hands_from_owners(owners), seeds
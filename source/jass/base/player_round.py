@@ -6,7 +6,7 @@
 from typing import List
 import numpy as np
 
-from jass.base.const import next_player, partner_player
+from jass.base.const import next_player, partner_player, color_masks
 from jass.base.round import Round
 import jass.base.rule_factory
 
@@ -77,6 +77,10 @@ class PlayerRound:
         # the current hands of the player
         self.hand = np.zeros(shape=36, dtype=np.int32)
 
+        # the number of cards of each color in the hand, None if they have not been calculated (for example if the
+        # hand is set directly), in which case the rule counts the cards itself
+        self.color_counts = None
+
         # the tricks played so far, with the cards of the tricks int encoded in the order they are played
         # a value of -1 indicates that the card has not been played yet
         self.tricks = np.full(shape=[9, 4], fill_value=-1, dtype=np.int32)
@@ -191,6 +195,7 @@ class PlayerRound:
 
         if rnd.nr_played_cards < 36:
             self.hand[:] = rnd.hands[self.player, :]
+            self.color_counts = rnd.color_counts[self.player, :].copy()
         self.tricks[:, :] = rnd.tricks[:, :]
         self.trick_winner[:] = rnd.trick_winner[:]
         self.trick_points[:] = rnd.trick_points[:]
@@ -227,6 +232,7 @@ class PlayerRound:
 
         if rnd.nr_played_cards < 36:
             self.hand[:] = rnd.hands[player, :]
+            self.color_counts = rnd.color_counts[player, :].copy()
         self.tricks[:, :] = rnd.tricks[:, :]
         self.trick_winner[:] = rnd.trick_winner[:]
         self.trick_points[:] = rnd.trick_points[:]
@@ -261,6 +267,7 @@ class PlayerRound:
         self.forehand = rnd.forehand
         self.declared_trump = rnd.declared_trump
         self.hand = rnd.hands[self.player, :]
+        self.color_counts = rnd.color_counts[self.player, :] if rnd.nr_played_cards < 36 else None
         self.tricks = rnd.tricks
         self.trick_winner = rnd.trick_winner
         self.trick_points = rnd.trick_points
@@ -286,6 +293,13 @@ class PlayerRound:
             else:
                 self.points_team_1 += self.trick_points[trick]
 
+    def update_color_counts(self) -> None:
+        """
+        Calculate the number of cards of each color from the hand. Must be called again if the hand is changed
+        after the counts have been calculated.
+        """
+        self.color_counts = np.dot(color_masks, self.hand)
+
     def get_valid_cards(self):
         """
         Get the valid cards for the player. Delegated to the rule
@@ -295,7 +309,8 @@ class PlayerRound:
         return self.rule.get_valid_cards(self.hand,
                                          self.current_trick,
                                          self.nr_cards_in_trick,
-                                         self.trump)
+                                         self.trump,
+                                         self.color_counts)
 
     @staticmethod
     def from_complete_round(rnd: Round, cards_played: int) -> 'PlayerRound':
@@ -375,6 +390,7 @@ class PlayerRound:
             index = (rnd.trick_first_player[i] - player_rnd.player) % 4
             card_played = rnd.tricks[i, index]
             player_rnd.hand[card_played] = 1
+        player_rnd.update_color_counts()
         return player_rnd
 
     @staticmethod
@@ -421,6 +437,7 @@ class PlayerRound:
             index = (rnd.trick_first_player[i] - player_rnd.player) % 4
             card_played = rnd.tricks[i, index]
             player_rnd.hand[card_played] = 1
+        player_rnd.update_color_counts()
         return player_rnd
 
     @staticmethod
@@ -455,6 +472,7 @@ class PlayerRound:
             index = (rnd.trick_first_player[i] - player_rnd.player) % 4
             card_played = rnd.tricks[i, index]
             player_rnd.hand[card_played] = 1
+        player_rnd.update_color_counts()
         return player_rnd
 
     def assert_invariants(self) -> None:
@@ -486,6 +504,10 @@ class PlayerRound:
         assert self.hand.size == 36
         assert self.hand.sum() == 9-self.nr_tricks
 
+        # number of cards of each color, if they have been calculated
+        if self.color_counts is not None:
+            assert (self.color_counts == np.dot(color_masks, self.hand)).all()
+
         # check current trick
         if self.nr_played_cards == 36:
             assert self.current_trick is None
@@ -6,7 +6,7 @@
 from typing import List
 import numpy as np
 
-from jass.base.const import next_player, partner_player
+from jass.base.const import next_player, partner_player, color_masks
 from jass.base.round import Round
 from jass.base.player_round import PlayerRound
 
@@ -184,6 +184,7 @@ class PlayerRoundCheating(PlayerRound):
                 player = next_player[player]
 
         player_rnd.hand = player_rnd.hands[player_rnd.player, :]
+        player_rnd.update_color_counts()
 
         return player_rnd
 
@@ -234,6 +235,7 @@ class PlayerRoundCheating(PlayerRound):
 
         # copy hand of the player
         player_rnd.hand = player_rnd.hands[player_rnd.player, :]
+        player_rnd.update_color_counts()
 
         return player_rnd
 
@@ -265,6 +267,10 @@ class PlayerRoundCheating(PlayerRound):
         # print(self.hand.sum())
         assert self.hand.sum() == 9 - self.nr_tricks
 
+        # number of cards of each color, if they have been calculated
+        if self.color_counts is not None:
+            assert (self.color_counts == np.dot(color_masks, self.hand)).all()
+
         # check current trick
         if self.nr_played_cards == 36:
             assert self.current_trick is None
@@ -3,6 +3,8 @@
 # Created by Thomas Koller on 24.07.18
 #
 from jass.base.const import *
+from jass.base.deal import owners_from_seeds, hands_from_owners
+from jass.base.zobrist import zobrist_hand, zobrist_trick, zobrist_player, zobrist_points, zobrist_trump_key
 
 
 class Round:
@@ -22,10 +24,19 @@ class Round:
 
     The member variables can be set directly or using methods. The methods will ensure the internal
     consistency of the variables, the method assert_invariants can be used during development to verify the
-    consistency for the cases when the member variables are set directly.
+    consistency for the cases when the member variables are set directly. The number of cards of each color in the
+    hands is derived from the hands and used by the rules, so update_color_counts must be called after the hands
+    have been changed directly.
 
     This is a base class that allows for implementations of different variants of the game.
+
+    The members are declared as __slots__, as a large number of round objects are created during simulations.
+    Derived classes must declare __slots__ as well (empty if they do not add members).
     """
+    __slots__ = ('dealer', 'player', 'trump', 'forehand', 'declared_trump',
+                 'hands', 'color_counts', 'tricks', 'trick_winner', 'trick_points', 'trick_first_player', 'current_trick',
+                 'nr_tricks', 'nr_cards_in_trick', 'nr_played_cards', 'points_team_0', 'points_team_1',
+                 'rule', 'jass_type', 'zobrist_key')
 
     def __init__(self, dealer=None) -> None:
         """
@@ -62,24 +73,10 @@ class Round:
         self.declared_trump = None  # type: int
 
         #
-        # information about held and played cards
+        # information about held and played cards (hands, tricks, trick_winner, trick_points, trick_first_player)
         #
+        self._init_arrays()
 
-        # the current hands of all the players, 1-hot encoded
-        self.hands = np.zeros(shape=[4, 36], dtype=np.int32)
-
-        # the tricks played so far, with the cards of the tricks int encoded in the order they are played
-        # a value of -1 indicates that the card has not been played yet
-        self.tricks = np.full(shape=[9, 4], fill_value=-1, dtype=np.int32)
-
-        # the winner of the tricks
-        self.trick_winner = np.full(shape=9, fill_value=-1, dtype=np.int32)
-
-        # the points made in the tricks
-        self.trick_points = np.zeros(shape=9, dtype=np.int32)
-
-        # the first player of the trick (derived)
-        self.trick_first_player = np.full(shape=9, fill_value=-1, dtype=np.int32)
         # if the dealer is defined, the first player of the first trick is usually the next player
         if dealer is not None:
             self.trick_first_player[0] = next_player[self.dealer]
@@ -104,6 +101,10 @@ class Round:
         # the jass_type (as used by the round_factory to create this type of round)
         self.jass_type = None
 
+        # zobrist key of the state (see jass.base.zobrist), or None if hashing is not enabled. It is enabled by
+        # update_hash and then updated incrementally when cards are played
+        self.zobrist_key = None
+
     def __eq__(self, other: 'Round'):
         """
         Compare two instances. Useful for tests when the representations are encoded and decoded. The objects are
@@ -146,7 +147,32 @@ class Round:
         Returns:
             String describing the round
         """
-        return str(self.__dict__)
+        return str({name: getattr(self, name) for name in Round.__slots__})
+
+    def _init_arrays(self) -> None:
+        """
+        Allocate the arrays for the information about held and played cards. Can be overridden in derived classes
+        that use a different storage for the arrays.
+        """
+        # the current hands of all the players, 1-hot encoded
+        self.hands = np.zeros(shape=[4, 36], dtype=np.int32)
+
+        # the number of cards of each color in the hands of the players (derived from hands and updated
+        # incrementally, so that the rules do not need to count the cards)
+        self.color_counts = np.zeros(shape=[4, 4], dtype=np.int32)
+
+        # the tricks played so far, with the cards of the tricks int encoded in the order they are played
+        # a value of -1 indicates that the card has not been played yet
+        self.tricks = np.full(shape=[9, 4], fill_value=-1, dtype=np.int32)
+
+        # the winner of the tricks
+        self.trick_winner = np.full(shape=9, fill_value=-1, dtype=np.int32)
+
+        # the points made in the tricks
+        self.trick_points = np.zeros(shape=9, dtype=np.int32)
+
+        # the first player of the trick (derived)
+        self.trick_first_player = np.full(shape=9, fill_value=-1, dtype=np.int32)
 
     def get_points_for_player(self, player: int):
         """
@@ -159,10 +185,18 @@ class Round:
         else:
             return self.points_team_1
 
-    def deal_cards(self) -> None:
+    def deal_cards(self, seed: int = None) -> None:
         """
         Deal cards randomly at beginning of the game.
+
+        Args:
+            seed: if given, the cards are dealt as determined by the seed (see jass.base.deal), otherwise they are
+            shuffled using np.random
         """
+        if seed is not None:
+            self.set_hands(hands_from_owners(owners_from_seeds(seed)))
+            return
+
         cards = np.arange(0, 36, dtype=np.int32)
         np.random.shuffle(cards)
 
@@ -171,6 +205,9 @@ class Round:
         self.hands[1, cards[9:18]] = 1
         self.hands[2, cards[18:27]] = 1
         self.hands[3, cards[27:39]] = 1
+        self.update_color_counts()
+        if self.zobrist_key is not None:
+            self.update_hash()
 
     def set_hands(self, hands: np.array) -> None:
         """
@@ -179,6 +216,45 @@ class Round:
             hands: The hands
         """
         self.hands[:, :] = hands[:, :]
+        self.update_color_counts()
+        if self.zobrist_key is not None:
+            self.update_hash()
+
+    def update_color_counts(self) -> None:
+        """
+        Calculate the number of cards of each color from the hands. The counts are updated by the methods of the
+        class, this method must be called if the hands are changed directly.
+        """
+        self.color_counts[:, :] = np.dot(self.hands, color_masks.T)
+
+    def update_hash(self) -> None:
+        """
+        Calculate the zobrist key of the state (see calc_hash) and maintain it from now on. Hashing is only needed
+        by searches that play and undo cards on the round, so the key is not maintained until this method has been
+        called for the first time, afterwards it is updated by the methods of the class. The method must be called
+        again if the members are changed directly.
+        """
+        self.zobrist_key = self.calc_hash()
+
+    def calc_hash(self) -> int:
+        """
+        Calculate the zobrist key of the state from the hands, the current trick, the player, the trump and the
+        points, without changing the round.
+
+        Returns:
+            the zobrist key
+        """
+        key = zobrist_trump_key(self.trump) ^ zobrist_points(0, self.points_team_0) ^ \
+            zobrist_points(1, self.points_team_1)
+        if self.player is not None:
+            key ^= zobrist_player[self.player]
+        players, cards = np.nonzero(self.hands)
+        for player, card in zip(players.tolist(), cards.tolist()):
+            key ^= zobrist_hand[player][card]
+        if self.current_trick is not None:
+            for i in range(self.nr_cards_in_trick):
+                key ^= zobrist_trick[i][self.current_trick[i]]
+        return key
 
     def action_trump(self, action: int) -> None:
         """
@@ -209,6 +285,10 @@ class Round:
         """
         # remove card from player
         self.hands[self.player, card] = 0
+        self.color_counts[self.player, color_of_card[card]] -= 1
+        if self.zobrist_key is not None:
+            self.zobrist_key ^= zobrist_hand[self.player][card] ^ zobrist_trick[self.nr_cards_in_trick][card] ^ \
+                zobrist_player[self.player]
 
         # place in trick
         self.current_trick[self.nr_cards_in_trick] = card
@@ -222,10 +302,108 @@ class Round:
             # trick is not yet finished
             self.nr_cards_in_trick += 1
             self.player = next_player[self.player]
+            if self.zobrist_key is not None:
+                self.zobrist_key ^= zobrist_player[self.player]
         else:
             # finish current trick
             self._end_trick()
 
+    def undo_play_card(self) -> int:
+        """
+        Undo the last card played, i.e. the reverse of action_play_card, including the bookkeeping at the end of a
+        trick. This allows search algorithms to make and unmake moves on the same object.
+
+        Preconditions:
+            self.nr_played_cards > 0
+
+        Postconditions:
+            see assert_invariants
+
+        Returns:
+            the card that was taken back
+        """
+        hashed = self.zobrist_key is not None
+        if hashed and self.player is not None:
+            self.zobrist_key ^= zobrist_player[self.player]
+        if self.nr_cards_in_trick == 0:
+            # the card completed a trick, so reverse _end_trick
+            self.nr_tricks -= 1
+            points = int(self.trick_points[self.nr_tricks])
+            winner = self.trick_winner[self.nr_tricks]
+            if hashed:
+                self.zobrist_key ^= zobrist_points(0, self.points_team_0) ^ zobrist_points(1, self.points_team_1)
+            if winner == NORTH or winner == SOUTH:
+                self.points_team_0 -= points
+            else:
+                self.points_team_1 -= points
+            if hashed:
+                self.zobrist_key ^= zobrist_points(0, self.points_team_0) ^ zobrist_points(1, self.points_team_1)
+            self.trick_points[self.nr_tricks] = 0
+            self.trick_winner[self.nr_tricks] = -1
+            if self.nr_tricks < 8:
+                self.trick_first_player[self.nr_tricks + 1] = -1
+            self.current_trick = self.tricks[self.nr_tricks, :]
+            self.nr_cards_in_trick = 3
+            if hashed:
+                for i in range(4):
+                    self.zobrist_key ^= zobrist_trick[i][self.current_trick[i]]
+        else:
+            self.nr_cards_in_trick -= 1
+
+        # remove card from trick and give it back to the player
+        card = int(self.current_trick[self.nr_cards_in_trick])
+        self.current_trick[self.nr_cards_in_trick] = -1
+        self.player = int(self.trick_first_player[self.nr_tricks] - self.nr_cards_in_trick) % 4
+        self.hands[self.player, card] = 1
+        self.color_counts[self.player, color_of_card[card]] += 1
+        if hashed:
+            self.zobrist_key ^= zobrist_hand[self.player][card] ^ zobrist_trick[self.nr_cards_in_trick][card] ^ \
+                zobrist_player[self.player]
+        self.nr_played_cards -= 1
+        return card
+
+    def clone(self) -> 'Round':
+        """
+        Create a copy of the round. Only the arrays are copied, the rule object is shared. This is considerably
+        faster than copy.deepcopy. Derived classes that add members must override the method.
+
+        Returns:
+            a copy of the round
+        """
+        rnd = object.__new__(type(self))
+        rnd.dealer = self.dealer
+        rnd.player = self.player
+        rnd.trump = self.trump
+        rnd.forehand = self.forehand
+        rnd.declared_trump = self.declared_trump
+        rnd.nr_tricks = self.nr_tricks
+        rnd.nr_cards_in_trick = self.nr_cards_in_trick
+        rnd.nr_played_cards = self.nr_played_cards
+        rnd.points_team_0 = self.points_team_0
+        rnd.points_team_1 = self.points_team_1
+        rnd.rule = self.rule
+        rnd.jass_type = self.jass_type
+        rnd.zobrist_key = self.zobrist_key
+        self._clone_arrays(rnd)
+        # the current trick is a view onto the tricks of the copy
+        rnd.current_trick = None if self.current_trick is None else rnd.tricks[rnd.nr_tricks, :]
+        return rnd
+
+    def _clone_arrays(self, rnd: 'Round') -> None:
+        """
+        Copy the arrays to the round created by clone. Must be overridden in derived classes that override
+        _init_arrays.
+
+        Args:
+            rnd: the round that receives the copies of the arrays
+        """
+        rnd.hands = self.hands.copy()
+        rnd.color_counts = self.color_counts.copy()
+        rnd.tricks = self.tricks.copy()
+        rnd.trick_winner = self.trick_winner.copy()
+        rnd.trick_points = self.trick_points.copy()
+        rnd.trick_first_player = self.trick_first_player.copy()
+
     def get_valid_cards(self):
         """
         Get the valid cards for the current player.
@@ -237,7 +415,7 @@ class Round:
             return None
         else:
             return self.rule.get_valid_cards(self.hands[self.player, :], self.current_trick,
-                                             self.nr_cards_in_trick, self.trump)
+                                             self.nr_cards_in_trick, self.trump, self.color_counts[self.player])
 
     def get_card_played(self, move: int):
         """
@@ -264,10 +442,18 @@ class Round:
         winner = self.rule.calc_winner(self.current_trick, self.trick_first_player[self.nr_tricks], self.trump)
         self.trick_winner[self.nr_tricks] = winner
 
+        key = self.zobrist_key
+        if key is not None:
+            # the cards of the trick are removed from the key, they are now implied by not being in any hand
+            key ^= zobrist_points(0, self.points_team_0) ^ zobrist_points(1, self.points_team_1)
+            for i in range(4):
+                key ^= zobrist_trick[i][self.current_trick[i]]
         if winner == NORTH or winner == SOUTH:
             self.points_team_0 += points
         else:
             self.points_team_1 += points
+        if key is not None:
+            key ^= zobrist_points(0, self.points_team_0) ^ zobrist_points(1, self.points_team_1)
         self.nr_tricks += 1
         self.nr_cards_in_trick = 0
 
@@ -277,10 +463,13 @@ class Round:
             self.trick_first_player[self.nr_tricks] = winner
             self.player = winner
             self.current_trick = self.tricks[self.nr_tricks, :]
+            if key is not None:
+                key ^= zobrist_player[winner]
         else:
             # end of round
             self.player = None
             self.current_trick = None
+        self.zobrist_key = key
 
     def assert_invariants(self) -> None:
         """
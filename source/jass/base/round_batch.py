@@ -0,0 +1,263 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Batch of rounds that are played in lockstep, i.e. all the rounds of the batch have the same number of cards played
+and a card is played in all the rounds at the same time using numpy operations on the whole batch.
+"""
+import numpy as np
+
+from jass.base.const import next_player, NORTH, SOUTH
+from jass.base.deal import deal_hands
+from jass.base.round import Round
+from jass.base.rule import Rule
+from jass.base.rule_schieber import RuleSchieber
+
+# next player as array, so that it can be indexed by the array of players
+_next_player = np.array(next_player, dtype=np.int32)
+
+
+class RoundBatch:
+    """
+    Class for a batch of N rounds after trump has been selected (if the variant uses trump). The information is
+    stored in the same way as in Round, but with an additional first dimension for the rounds in the batch. The
+    number of played cards (and therefore the number of tricks and the number of cards in the current trick) is the
+    same for all rounds, while the cards, the players, the trumps and the results differ.
+
+    The intended use are simulations of a large number of rounds, for example random rollouts from a position in
+    a search or the bulk simulation of rounds with random players, where the cards of all rounds are played with
+    one call to play_cards instead of calling Round.action_play_card for every round.
+
+    The valid cards, the winner and the points of the tricks are determined by the batch methods of the rule
+    (get_valid_cards_batch, calc_winner_batch and calc_points_batch).
+    """
+
+    def __init__(self, nr_rounds: int, rule: Rule = None) -> None:
+        """
+        Initialize the batch with empty hands and no cards played. The hands and trumps must be set (by deal_cards
+        or set_hands and set_trump) before cards can be played.
+
+        Args:
+            nr_rounds: the number N of rounds in the batch
+            rule: the rule to use for all the rounds, RuleSchieber if None
+        """
+        self.nr_rounds = nr_rounds
+
+        # the rule must implement the batch methods
+        self.rule = rule if rule is not None else RuleSchieber()
+
+        # trump of each round
+        self.trump = np.full(shape=nr_rounds, fill_value=-1, dtype=np.int32)
+
+        # player to play the next card in each round, -1 at the end of the rounds
+        self.player = np.full(shape=nr_rounds, fill_value=-1, dtype=np.int32)
+
+        # the current hands of all the players of each round, 1-hot encoded
+        self.hands = np.zeros(shape=[nr_rounds, 4, 36], dtype=np.int32)
+
+        # the tricks played so far in each round, -1 for cards not played yet
+        self.tricks = np.full(shape=[nr_rounds, 9, 4], fill_value=-1, dtype=np.int32)
+
+        # the winner, points and first player of the tricks of each round
+        self.trick_winner = np.full(shape=[nr_rounds, 9], fill_value=-1, dtype=np.int32)
+        self.trick_points = np.zeros(shape=[nr_rounds, 9], dtype=np.int32)
+        self.trick_first_player = np.full(shape=[nr_rounds, 9], fill_value=-1, dtype=np.int32)
+
+        # the points of the teams in each round
+        self.points_team_0 = np.zeros(shape=nr_rounds, dtype=np.int32)
+        self.points_team_1 = np.zeros(shape=nr_rounds, dtype=np.int32)
+
+        # the number of completed tricks, cards in the current trick and played cards (the same for all rounds)
+        self.nr_tricks = 0
+        self.nr_cards_in_trick = 0
+        self.nr_played_cards = 0
+
+        # index array for the rounds, used for advanced indexing
+        self._index = np.arange(nr_rounds)
+
+    @classmethod
+    def from_rounds(cls, rounds: [Round], rule: Rule = None) -> 'RoundBatch':
+        """
+        Create a batch from the state of a number of rounds. The rounds must have the same number of cards played and
+        trump selected. The trump of rounds without trump (hearts) is set to -1.
+
+        Args:
+            rounds: the rounds to copy into the batch
+            rule: the rule to use, the rule of the first round if None
+
+        Returns:
+            the batch containing the rounds
+        """
+        nr_played_cards = rounds[0].nr_played_cards
+        if any(rnd.nr_played_cards != nr_played_cards for rnd in rounds):
+            raise ValueError('All rounds of a batch must have the same number of played cards')
+
+        batch = cls(len(rounds), rule if rule is not None else rounds[0].rule)
+        batch.trump[:] = [rnd.trump if rnd.trump is not None else -1 for rnd in rounds]
+        batch.player[:] = [rnd.player if rnd.player is not None else -1 for rnd in rounds]
+        batch.hands[:] = [rnd.hands for rnd in rounds]
+        batch.tricks[:] = [rnd.tricks for rnd in rounds]
+        batch.trick_winner[:] = [rnd.trick_winner for rnd in rounds]
+        batch.trick_points[:] = [rnd.trick_points for rnd in rounds]
+        batch.trick_first_player[:] = [rnd.trick_first_player for rnd in rounds]
+        batch.points_team_0[:] = [rnd.points_team_0 for rnd in rounds]
+        batch.points_team_1[:] = [rnd.points_team_1 for rnd in rounds]
+        batch.nr_tricks = rounds[0].nr_tricks
+        batch.nr_cards_in_trick = rounds[0].nr_cards_in_trick
+        batch.nr_played_cards = nr_played_cards
+        return batch
+
+    @property
+    def current_trick(self) -> np.ndarray or None:
+        """
+        The current tricks of all the rounds as [N,4] view onto the tricks, None at the end of the rounds.
+        """
+        if self.nr_tricks == 9:
+            return None
+        return self.tricks[:, self.nr_tricks, :]
+
+    def deal_cards(self, rng: np.random.Generator or int or None = None) -> np.ndarray:
+        """
+        Deal the cards randomly for all the rounds at the beginning of the game (see jass.base.deal).
+
+        Args:
+            rng: the random generator to draw the seeds of the deals (or a seed for it)
+
+        Returns:
+            [N] the seeds of the deals, which can be used to deal the cards of a round again
+        """
+        hands, seeds = deal_hands(self.nr_rounds, rng)
+        self.hands[:] = hands
+        return seeds
+
+    def set_hands(self, hands: np.ndarray) -> None:
+        """
+        Set the hands of all rounds (instead of dealing the cards). The used array is copied.
+
+        Args:
+            hands: [N,4,36] the hands
+        """
+        self.hands[:] = hands
+
+    def set_trump(self, trump: np.ndarray or int, first_player: np.ndarray or int) -> None:
+        """
+        Set the trump and the player that plays the first card in all the rounds. For the selection of trump
+        according to the rules of the variant, the rounds can be played to that point using Round and the batch
+        created with from_rounds.
+
+        Precondition:
+            self.nr_played_cards == 0
+
+        Args:
+            trump: [N] trump for each round (or one trump for all rounds)
+            first_player: [N] the player of the first card (or one player for all rounds)
+        """
+        self.trump[:] = trump
+        self.player[:] = first_player
+        self.trick_first_player[:, 0] = first_player
+
+    def valid_cards(self) -> np.ndarray:
+        """
+        Get the valid cards for the current player of all the rounds.
+
+        Precondition:
+            self.nr_played_cards < 36
+
+        Returns:
+            [N,36] one-hot encoded arrays of the valid cards
+        """
+        return self.rule.get_valid_cards_batch(self.hands[self._index, self.player, :],
+                                               self.tricks[:, self.nr_tricks, :],
+                                               np.full(self.nr_rounds, self.nr_cards_in_trick),
+                                               self.trump)
+
+    def play_cards(self, cards: np.ndarray) -> None:
+        """
+        Play one card as the current player in each of the rounds and update the state of the rounds. The winner
+        and points of the tricks are calculated for all the rounds when the trick is complete.
+
+        Preconditions:
+            self.nr_played_cards < 36
+            self.hands[i, self.player[i], cards[i]] == 1, for all i
+
+        Args:
+            cards: [N] the card to play in each round
+        """
+        self.hands[self._index, self.player, cards] = 0
+        self.tricks[:, self.nr_tricks, self.nr_cards_in_trick] = cards
+        self.nr_played_cards += 1
+
+        if self.nr_cards_in_trick < 3:
+            self.nr_cards_in_trick += 1
+            self.player = _next_player[self.player]
+        else:
+            self._end_trick()
+
+    def random_valid_cards(self) -> np.ndarray:
+        """
+        Choose a random card from the valid cards of the current player in each round, with equal probability
+        for each valid card.
+
+        Returns:
+            [N] the chosen cards
+        """
+        return np.argmax(np.random.random_sample((self.nr_rounds, 36)) * self.valid_cards(), axis=1)
+
+    def play_random_until_end(self) -> None:
+        """
+        Play random valid cards in all the rounds until the rounds are complete.
+        """
+        while self.nr_played_cards < 36:
+            self.play_cards(self.random_valid_cards())
+
+    def get_round(self, index: int, rnd: Round) -> Round:
+        """
+        Copy the state of one round of the batch to a round object, for example to use a round with the existing
+        players or to validate it.
+
+        Args:
+            index: the index of the round in the batch
+            rnd: the round to set, that must have been created for the same variant (for example by get_round in
+            round_factory) with the dealer and trump set
+
+        Returns:
+            the round that was set
+        """
+        rnd.player = int(self.player[index]) if self.nr_played_cards < 36 else None
+        rnd.set_hands(self.hands[index])
+        rnd.tricks[:, :] = self.tricks[index]
+        rnd.trick_winner[:] = self.trick_winner[index]
+        rnd.trick_points[:] = self.trick_points[index]
+        rnd.trick_first_player[:] = self.trick_first_player[index]
+        rnd.nr_tricks = self.nr_tricks
+        rnd.nr_cards_in_trick = self.nr_cards_in_trick
+        rnd.nr_played_cards = self.nr_played_cards
+        rnd.current_trick = rnd.tricks[rnd.nr_tricks, :] if rnd.nr_tricks < 9 else None
+        rnd.points_team_0 = int(self.points_team_0[index])
+        rnd.points_team_1 = int(self.points_team_1[index])
+        return rnd
+
+    def _end_trick(self) -> None:
+        """
+        End the current trick in all the rounds and update the results.
+        """
+        trick = self.tricks[:, self.nr_tricks, :]
+        is_last = np.full(self.nr_rounds, self.nr_tricks == 8)
+        points = self.rule.calc_points_batch(trick, is_last, self.trump)
+        winner = self.rule.calc_winner_batch(trick, self.trick_first_player[:, self.nr_tricks], self.trump)
+        self.trick_points[:, self.nr_tricks] = points
+        self.trick_winner[:, self.nr_tricks] = winner
+
+        team_0 = (winner == NORTH) | (winner == SOUTH)
+        self.points_team_0 += np.where(team_0, points, 0)
+        self.points_team_1 += np.where(team_0, 0, points)
+
+        self.nr_tricks += 1
+        self.nr_cards_in_trick = 0
+
+        if self.nr_tricks < 9:
+            self.trick_first_player[:, self.nr_tricks] = winner
+            self.player = winner.astype(np.int32)
+        else:
+            self.player = np.full(self.nr_rounds, -1, dtype=np.int32)
@@ -0,0 +1,100 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Compact variants of the round classes, that keep all the arrays of the round in one contiguous buffer.
+"""
+import numpy as np
+
+from jass.base.round_hearts import RoundHeartsTeam
+from jass.base.round_schieber import RoundSchieber
+
+# layout of the buffer: offsets and shapes of the arrays
+_HANDS = 0
+_TRICKS = _HANDS + 4 * 36
+_TRICK_WINNER = _TRICKS + 9 * 4
+_TRICK_POINTS = _TRICK_WINNER + 9
+_TRICK_FIRST_PLAYER = _TRICK_POINTS + 9
+_COLOR_COUNTS = _TRICK_FIRST_PLAYER + 9
+_BUFFER_SIZE = _COLOR_COUNTS + 4 * 4
+
+# initial values of the buffer for a new round
+_initial_buffer = np.zeros(_BUFFER_SIZE, dtype=np.int16)
+_initial_buffer[_TRICKS:_TRICK_WINNER] = -1
+_initial_buffer[_TRICK_WINNER:_TRICK_POINTS] = -1
+_initial_buffer[_TRICK_FIRST_PLAYER:_COLOR_COUNTS] = -1
+
+# members of the round, that are not views into the buffer (current_trick is recreated from tricks)
+_scalar_slots = ('dealer', 'player', 'trump', 'forehand', 'declared_trump',
+                 'nr_tricks', 'nr_cards_in_trick', 'nr_played_cards', 'points_team_0', 'points_team_1',
+                 'rule', 'jass_type', 'zobrist_key')
+
+
+class RoundCompact:
+    """
+    Mixin for the round classes that stores the arrays hands, tricks, trick_winner, trick_points,
+    trick_first_player and color_counts as views into a single int16 buffer. Allocating, copying and pickling a
+    round then only needs one array instead of six. The arrays should only be changed in place (as is done in
+    Round), as assigning a new array to them would detach it from the buffer.
+
+    The mixin must be used together with a subclass of Round that declares the slot _buffer.
+    """
+    __slots__ = ()
+
+    def _init_arrays(self) -> None:
+        """
+        Allocate the buffer and create the arrays as views into it.
+        """
+        self._buffer = _initial_buffer.copy()
+        self._init_views()
+
+    def _init_views(self) -> None:
+        """
+        Create the arrays as views into the buffer.
+        """
+        buffer = self._buffer
+        self.hands = buffer[_HANDS:_TRICKS].reshape(4, 36)
+        self.tricks = buffer[_TRICKS:_TRICK_WINNER].reshape(9, 4)
+        self.trick_winner = buffer[_TRICK_WINNER:_TRICK_POINTS]
+        self.trick_points = buffer[_TRICK_POINTS:_TRICK_FIRST_PLAYER]
+        self.trick_first_player = buffer[_TRICK_FIRST_PLAYER:_COLOR_COUNTS]
+        self.color_counts = buffer[_COLOR_COUNTS:_BUFFER_SIZE].reshape(4, 4)
+
+    def _clone_arrays(self, rnd: 'RoundCompact') -> None:
+        """
+        Copy the buffer to the round created by clone and create the views into it.
+        """
+        rnd._buffer = self._buffer.copy()
+        rnd._init_views()
+
+    def __getstate__(self) -> tuple:
+        """
+        Get the state for pickling (and copying), which consists of the buffer and the values of the other
+        members, without the arrays that are views into the buffer.
+        """
+        return self._buffer, tuple(getattr(self, name) for name in _scalar_slots)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restore the state from pickling (and copying) and recreate the views into the buffer.
+        """
+        self._buffer, values = state
+        for name, value in zip(_scalar_slots, values):
+            setattr(self, name, value)
+        self._init_views()
+        self.current_trick = self.tricks[self.nr_tricks, :] if self.nr_tricks < 9 else None
+
+
+class RoundSchieberCompact(RoundCompact, RoundSchieber):
+    """
+    Round of Schieber with the arrays stored in one buffer (see RoundCompact).
+    """
+    __slots__ = ('_buffer',)
+
+
+class RoundHeartsTeamCompact(RoundCompact, RoundHeartsTeam):
+    """
+    Round of hearts with the arrays stored in one buffer (see RoundCompact).
+    """
+    __slots__ = ('_buffer',)
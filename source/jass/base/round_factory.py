@@ -9,27 +9,35 @@ from jass.base.const import JASS_SCHIEBER_1000, JASS_SCHIEBER_2500, JASS_HEARTS
 from jass.base.round import Round
 from jass.base.round_schieber import RoundSchieber
 from jass.base.round_hearts import RoundHeartsTeam
+from jass.base.round_compact import RoundSchieberCompact, RoundHeartsTeamCompact
 from jass.base.player_round import PlayerRound
+from jass.base.rule_factory import get_rule, RULE_IMPL_ARRAY
 
 
-def get_round(jass_type: str, dealer: int or None = None) -> Round:
+def get_round(jass_type: str, dealer: int or None = None, rule_impl: str = RULE_IMPL_ARRAY,
+              compact: bool = False) -> Round:
     """
     Get the correct round object depending on the jass type
     Args:
         jass_type: the jass type
         dealer: dealer of the round
+        rule_impl: the implementation of the rules to use (see rule_factory), PlayerRound objects created from
+        the round will use the same rule object
+        compact: true if the round should keep its arrays in one buffer (see round_compact)
 
     Returns:
         the appropriate Round object for the type
     """
-    if jass_type == JASS_SCHIEBER_1000:
-        return RoundSchieber(dealer=dealer)
-    elif jass_type == JASS_SCHIEBER_2500:
-        return RoundSchieber(dealer=dealer, jass_type=jass_type)
+    if jass_type == JASS_SCHIEBER_1000 or jass_type == JASS_SCHIEBER_2500:
+        round_class = RoundSchieberCompact if compact else RoundSchieber
+        rnd = round_class(dealer=dealer, jass_type=jass_type)
     elif jass_type == JASS_HEARTS:
-        return RoundHeartsTeam(dealer=dealer)
+        rnd = RoundHeartsTeamCompact(dealer=dealer) if compact else RoundHeartsTeam(dealer=dealer)
     else:
         raise ValueError('Type of jass unknown: {}'.format(jass_type))
+    if rule_impl != RULE_IMPL_ARRAY:
+        rnd.rule = get_rule(jass_type, rule_impl)
+    return rnd
 
 
 def get_round_from_player_round(player_rnd: PlayerRound, hands: np.ndarray):
@@ -50,7 +58,7 @@ def get_round_from_player_round(player_rnd: PlayerRound, hands: np.ndarray):
     rnd.declared_trump = player_rnd.declared_trump
     rnd.forehand = player_rnd.forehand
     rnd.player = player_rnd.player
-    rnd.hands[:, :] = hands[:, :]
+    rnd.set_hands(hands)
     rnd.tricks[:, :] = player_rnd.tricks[:, :]
     rnd.trick_winner[:] = player_rnd.trick_winner[:]
     rnd.trick_points[:] = player_rnd.trick_points[:]
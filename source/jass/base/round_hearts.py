@@ -19,6 +19,7 @@ class RoundHeartsTeam(Round):
     points is omitted)
 
     """
+    __slots__ = ()
 
     def __init__(self, dealer=None) -> None:
         """
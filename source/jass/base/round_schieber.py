@@ -3,7 +3,7 @@
 # Created by Thomas Koller on 24.07.18
 #
 import numpy as np
-from jass.base.const import JASS_SCHIEBER_1000, next_player, partner_player, PUSH
+from jass.base.const import JASS_SCHIEBER_1000, next_player, partner_player, PUSH, color_masks
 from jass.base.round import Round
 from jass.base.rule_schieber import RuleSchieber
 
@@ -15,6 +15,7 @@ class RoundSchieber(Round):
     pass to the partner player, which then has to select trump
     - The possible trump values are any of the 4 colors and 'obe' and 'une'
     """
+    __slots__ = ()
 
     def __init__(self, dealer=None, jass_type=JASS_SCHIEBER_1000) -> None:
         """
@@ -67,6 +68,8 @@ class RoundSchieber(Round):
             self.trick_first_player[0] = self.player
         else:
             raise ValueError('Unexpected value')
+        if self.zobrist_key is not None:
+            self.update_hash()
 
     def assert_invariants(self)->None:
         """
@@ -97,6 +100,9 @@ class RoundSchieber(Round):
         nr_cards_in_hand = self.hands.flatten().sum()
         assert nr_played_cards + nr_cards_in_hand == 36
 
+        # number of cards of each color
+        assert (self.color_counts == np.dot(self.hands, color_masks.T)).all()
+
         # number of points
         points_team_0 = 0
         points_team_1 = 0
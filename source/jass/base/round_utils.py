@@ -7,6 +7,7 @@ import numpy as np
 from jass.base.const import next_player
 from jass.base.player_round import PlayerRound
 from jass.base.round import Round
+from jass.base.rule import Rule
 
 
 def calculate_starting_hands_from_round(rnd: Round) -> np.ndarray:
@@ -48,3 +49,60 @@ def calculate_hands_from_starting_hands(player_rnd: PlayerRound, starting_hands:
     assert hands.sum() == 36 - player_rnd.nr_played_cards
 
     return hands
+
+
+def calculate_positions_from_round(rnd: Round) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Calculate the hand of the player to move, the current trick and the move number in the trick for all 36 moves
+    of a complete round. The arrays can be used to evaluate all positions of the round at once, for example with
+    Rule.get_valid_cards_batch.
+
+    Args:
+        rnd: a complete round
+
+    Returns:
+        hands[36,36] the hands of the player to move for each move,
+        tricks[36,4] the current trick before each move (with -1 for cards not played yet),
+        move_nr[36] the move number in the trick for each move
+    """
+    moves = np.arange(36)
+    nr_trick, move_nr = np.divmod(moves, 4)
+
+    # player of each move
+    players = (rnd.trick_first_player[nr_trick] - move_nr) % 4
+
+    # the hand of the player to move consists of the cards the player will play in this or later moves
+    cards_played = rnd.tricks.reshape(-1)
+    move_of_card = np.empty(36, dtype=np.int32)
+    move_of_card[cards_played] = moves
+    starting_hands = calculate_starting_hands_from_round(rnd)
+    hands = starting_hands[players, :] * (move_of_card[None, :] >= moves[:, None])
+
+    # the current tricks contain the cards played before the move in the trick
+    tricks = np.where(np.arange(4)[None, :] < move_nr[:, None], rnd.tricks[nr_trick, :], -1)
+
+    return hands, tricks, move_nr
+
+
+def calculate_trick_results_from_tricks(rule: Rule, tricks: np.ndarray, trick_first_player: np.ndarray,
+                                        trump: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Calculate the winners and the points of all the tricks of a number of complete rounds in one call, for example
+    to check or complete the information from logs.
+
+    Args:
+        rule: the rule to use
+        tricks: [N,9,4] the tricks of the rounds
+        trick_first_player: [N,9] the first player of each trick
+        trump: [N] the trump of each round
+
+    Returns:
+        trick_winner[N,9] and trick_points[N,9] of the rounds
+    """
+    nr_rounds = tricks.shape[0]
+    trump_per_trick = np.repeat(np.asarray(trump), 9)
+    is_last = np.tile(np.arange(9) == 8, nr_rounds)
+    flat_tricks = tricks.reshape(-1, 4)
+    winner = rule.calc_winner_batch(flat_tricks, trick_first_player.reshape(-1), trump_per_trick)
+    points = rule.calc_points_batch(flat_tricks, is_last, trump_per_trick)
+    return winner.reshape(nr_rounds, 9), points.reshape(nr_rounds, 9)
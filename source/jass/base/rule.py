@@ -19,7 +19,8 @@ class Rule:
     def get_valid_cards(self, hand: np.array,
                         current_trick: np.ndarray or list,
                         move_nr: int,
-                        trump: int or None) -> np.array:
+                        trump: int or None,
+                        color_counts: np.ndarray or list = None) -> np.array:
         """
         Get the valid cards that can be played by the current player.
 
@@ -28,12 +29,31 @@ class Rule:
             current_trick: array with the indices of the cards for the previous moves in the current trick
             move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
             trump: trump color (if used by the rule)
+            color_counts: number of cards of each color in the hand (optional), allows the rule to skip counting the cards
 
         Returns:
             one-hot encoded array of valid moves
         """
         raise NotImplementedError()
 
+    def get_valid_cards_batch(self, hands: np.ndarray,
+                              tricks: np.ndarray,
+                              move_nr: np.ndarray,
+                              trump: np.ndarray) -> np.ndarray:
+        """
+        Get the valid cards for a number of independent positions at once. Must be implemented in subclass.
+
+        Args:
+            hands: [N,36] one-hot encoded arrays of the hands of the players to move
+            tricks: [N,4] arrays with the indices of the cards of the current tricks (-1 for cards not played yet)
+            move_nr: [N] the number of the move in the current trick, 0 for first move, 1 for second and so on
+            trump: [N] trump color (if used by the rule)
+
+        Returns:
+            [N,36] one-hot encoded arrays of the valid moves
+        """
+        raise NotImplementedError()
+
     def calc_points(self, trick: np.ndarray, is_last: bool, trump: int = -1) -> int:
         """
         Calculate the points from the cards in the trick. Must be implemented in subclass
@@ -61,5 +81,32 @@ class Rule:
         """
         raise NotImplementedError
 
+    def calc_points_batch(self, tricks: np.ndarray, is_last: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the points of a number of tricks at once. Must be implemented in subclass.
+
+        Args:
+            tricks: [N,4] the tricks
+            is_last: [N] true if the trick is the last trick of its round
+            trump: [N] the trump for the round of each trick (if needed by the rules)
+
+        Returns:
+            [N] the points of the tricks
+        """
+        raise NotImplementedError()
 
+    def calc_winner_batch(self, tricks: np.ndarray, first_player: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the winners of a number of completed tricks at once. Must be implemented in subclass.
 
+        Precondition:
+            0 <= tricks[:, i] <= 35, for i = 0..3
+        Args:
+            tricks: [N,4] the completed tricks
+            first_player: [N] the first player of each trick
+            trump: [N] the trump for the round of each trick (if needed by the rules)
+
+        Returns:
+            [N] the players who won the tricks
+        """
+        raise NotImplementedError()
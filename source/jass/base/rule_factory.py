@@ -5,23 +5,40 @@
 
 from jass.base.const import JASS_SCHIEBER_1000, JASS_SCHIEBER_2500, JASS_HEARTS
 from jass.base.rule_hearts import RuleHearts
+from jass.base.rule_hearts_bitboard import RuleHeartsBitboard
 from jass.base.rule_schieber import RuleSchieber
+from jass.base.rule_schieber_bitboard import RuleSchieberBitboard
+from jass.base.rule_schieber_table import RuleSchieberTable
 
+# Implementations of the rules that can be selected, all implementations of a jass type give identical results
+RULE_IMPL_ARRAY = 'ARRAY'           # rules calculated on 1-hot encoded numpy arrays
+RULE_IMPL_BITBOARD = 'BITBOARD'     # rules calculated on hands represented as 36 bit integers (for cross-checks,
+                                    # not faster in a Round, as the hands are converted on every call)
+RULE_IMPL_TABLE = 'TABLE'           # valid cards from precomputed tables (hearts uses the bitboard rules)
+RULE_IMPL_ALL = [RULE_IMPL_ARRAY, RULE_IMPL_BITBOARD, RULE_IMPL_TABLE]
 
-def get_rule(jass_type: str):
+
+def get_rule(jass_type: str, rule_impl: str = RULE_IMPL_ARRAY):
     """
     Get the correct rule object depending on the jass type.
 
     Args:
         jass_type: the jass type
+        rule_impl: the implementation of the rules to use
     Returns:
         the appropriate Rule object for the type
     """
-    if jass_type == JASS_SCHIEBER_1000:
-        return RuleSchieber()
-    elif jass_type == JASS_SCHIEBER_2500:
-        return RuleSchieber()
+    if rule_impl not in RULE_IMPL_ALL:
+        raise ValueError('Rule implementation unknown: {}'.format(rule_impl))
+
+    if jass_type == JASS_SCHIEBER_1000 or jass_type == JASS_SCHIEBER_2500:
+        if rule_impl == RULE_IMPL_TABLE:
+            return RuleSchieberTable()
+        elif rule_impl == RULE_IMPL_BITBOARD:
+            return RuleSchieberBitboard()
+        else:
+            return RuleSchieber()
     elif jass_type == JASS_HEARTS:
-        return RuleHearts()
+        return RuleHearts() if rule_impl == RULE_IMPL_ARRAY else RuleHeartsBitboard()
     else:
         raise ValueError('Type of jass unknown: {}'.format(jass_type))
@@ -3,7 +3,7 @@
 # Created by Thomas Koller on 05.09.2018
 
 import numpy as np
-from jass.base.const import color_of_card, color_masks, HEARTS, SQ
+from jass.base.const import color_of_card, color_masks, card_strength, HEARTS, SQ, OBE_ABE
 from jass.base.rule import Rule
 
 
@@ -20,7 +20,8 @@ class RuleHearts(Rule):
     def get_valid_cards(self, hand: np.array,
                         current_trick: np.ndarray or list,
                         move_nr: int,
-                        trump: int or None) -> np.array:
+                        trump: int or None,
+                        color_counts: np.ndarray or list = None) -> np.array:
         """
         Get the valid cards that can be played by the current player.
 
@@ -29,6 +30,7 @@ class RuleHearts(Rule):
             current_trick: array with the indices of the cards for the previous moves in the current trick
             move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
             trump: not used for hearts
+            color_counts: number of cards of each color in the hand (optional), the cards are counted if None
 
         Returns:
             one-hot encoded array of valid moves
@@ -39,7 +41,10 @@ class RuleHearts(Rule):
 
         # get the color of the first played card and check if we have that color
         color_played = color_of_card[current_trick[0]]
-        have_color_played = (np.sum(hand * color_masks[color_played, :]) > 0)
+        if color_counts is None:
+            have_color_played = (np.sum(hand * color_masks[color_played, :]) > 0)
+        else:
+            have_color_played = color_counts[color_played] > 0
 
         if have_color_played:
             # must give the correct color
@@ -48,6 +53,36 @@ class RuleHearts(Rule):
             # play anything, if we don't have the color
             return hand
 
+    def get_valid_cards_batch(self, hands: np.ndarray,
+                              tricks: np.ndarray,
+                              move_nr: np.ndarray,
+                              trump: np.ndarray) -> np.ndarray:
+        """
+        Get the valid cards for a number of independent positions at once. The result is the same as calling
+        get_valid_cards for each position, but is calculated using operations on the whole arrays.
+
+        Args:
+            hands: [N,36] one-hot encoded arrays of the hands of the players to move
+            tricks: [N,4] arrays with the indices of the cards of the current tricks (-1 for cards not played yet)
+            move_nr: [N] the number of the move in the current trick, 0 for first move, 1 for second and so on
+            trump: not used for hearts
+
+        Returns:
+            [N,36] one-hot encoded arrays of the valid moves
+        """
+        hands = np.asarray(hands)
+        tricks = np.asarray(tricks)
+        move_nr = np.asarray(move_nr)
+
+        # color of the first card (unplayed cards are replaced by 0, they are only used if the move_nr is 0)
+        color_played = color_of_card[np.maximum(tricks[:, 0], 0)]
+        color_cards = hands * color_masks[color_played, :]
+        have_color_played = (np.sum(color_cards, axis=1) > 0)
+
+        # must give the correct color if we have it, and play anything on the first move
+        must_give_color = (have_color_played & (move_nr > 0))[:, None]
+        return np.where(must_give_color, color_cards, hands)
+
     def calc_points(self, trick: np.ndarray, is_last: bool, trump: int = -1) -> int:
         """
         Calculate the points from the cards in the trick. In hearts these are penalty points, in order to be able
@@ -86,3 +121,39 @@ class RuleHearts(Rule):
                 highest_card = trick[i]
                 winner = i
         return (first_player - winner) % 4
+
+    def calc_points_batch(self, tricks: np.ndarray, is_last: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the (negative) penalty points of a number of tricks at once.
+
+        Args:
+            tricks: [N,4] the tricks
+            is_last: ignored for hearts
+            trump: not used for hearts
+
+        Returns:
+            [N] the points of the tricks
+        """
+        tricks = np.asarray(tricks)
+        return -np.sum(color_masks[HEARTS, tricks], axis=1) - 9 * np.any(tricks == SQ, axis=1)
+
+    def calc_winner_batch(self, tricks: np.ndarray, first_player: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the winners of a number of completed tricks at once, the highest card of the color of the first
+        card wins.
+
+        Precondition:
+            0 <= tricks[:, i] <= 35, for i = 0..3
+        Args:
+            tricks: [N,4] the completed tricks
+            first_player: [N] the first player of each trick
+            trump: not used for hearts
+
+        Returns:
+            [N] the players who won the tricks
+        """
+        tricks = np.asarray(tricks)
+        colors = color_of_card[tricks]
+        strength = np.where(colors == colors[:, 0:1], card_strength[OBE_ABE, tricks], 0)
+        winner = np.argmax(strength, axis=1)
+        return (np.asarray(first_player) - winner) % 4
@@ -0,0 +1,69 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+
+""" Implementation of rules of jass game for hearts using bitboards"""
+
+import numpy as np
+
+from jass.base.const import color_of_card
+from jass.base.bitboard import color_masks_bits, cards_to_bits, bits_to_cards
+from jass.base.rule_hearts import RuleHearts
+
+# python list versions of the tables (indexing lists with python ints is faster than indexing numpy arrays)
+_color_of_card = color_of_card.tolist()
+
+
+class RuleHeartsBitboard(RuleHearts):
+    """
+    Rules for hearts where the valid cards are calculated on hands represented as 36 bit integers
+    (see jass.base.bitboard). The results are identical to the ones of RuleHearts.
+    """
+
+    def get_valid_cards(self, hand: np.array,
+                        current_trick: np.ndarray or list,
+                        move_nr: int,
+                        trump: int or None,
+                        color_counts: np.ndarray or list = None) -> np.array:
+        """
+        Get the valid cards that can be played by the current player.
+
+        Args:
+            hand: one-hot encoded array of hands owned by the player
+            current_trick: array with the indices of the cards for the previous moves in the current trick
+            move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
+            trump: not used for hearts
+            color_counts: not used, as the cards are counted on the bitboard
+
+        Returns:
+            one-hot encoded array of valid moves
+        """
+        # play anything on the first move
+        if move_nr == 0:
+            return hand
+        return bits_to_cards(self.get_valid_cards_bits(cards_to_bits(hand), current_trick, move_nr, trump))
+
+    def get_valid_cards_bits(self, hand: int,
+                             current_trick: np.ndarray or list,
+                             move_nr: int,
+                             trump: int or None) -> int:
+        """
+        Get the valid cards that can be played by the current player, using bitboards for the hand and result.
+
+        Args:
+            hand: bitboard of the cards owned by the player
+            current_trick: array with the indices of the cards for the previous moves in the current trick
+            move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
+            trump: not used for hearts
+
+        Returns:
+            bitboard of the valid moves
+        """
+        # play anything on the first move
+        if move_nr == 0:
+            return hand
+
+        # must give the correct color if we have it
+        color_cards = hand & color_masks_bits[_color_of_card[current_trick[0]]]
+        return color_cards if color_cards else hand
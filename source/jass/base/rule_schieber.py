@@ -7,6 +7,12 @@
 from jass.base.const import *
 from jass.base.rule import Rule
 
+# python list versions of the tables for the calculations on single tricks (indexing lists with python ints is
+# faster than indexing numpy arrays)
+_color_of_card = color_of_card.tolist()
+_card_values = card_values.tolist()
+_trick_card_strength = trick_card_strength.tolist()
+
 
 class RuleSchieber(Rule):
     """
@@ -18,7 +24,8 @@ class RuleSchieber(Rule):
     def get_valid_cards(self, hand: np.array,
                         current_trick: np.ndarray or list,
                         move_nr: int,
-                        trump: int or None) -> np.array:
+                        trump: int or None,
+                        color_counts: np.ndarray or list = None) -> np.array:
         """
         Get the valid cards that can be played by the current player. (It is implemented as one long function
         in order to take advantage of intermediate results of calculation.)
@@ -28,6 +35,7 @@ class RuleSchieber(Rule):
             current_trick: array with the indices of the cards for the previous moves in the current trick
             move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
             trump: trump color (or 'obe', 'une')
+            color_counts: number of cards of each color in the hand (optional), the cards are counted if None
 
         Returns:
             one-hot encoded array of valid moves
@@ -38,7 +46,10 @@ class RuleSchieber(Rule):
 
         # get the color of the first played card and check if we have that color
         color_played = color_of_card[current_trick[0]]
-        have_color_played = (np.sum(hand * color_masks[color_played, :]) > 0)
+        if color_counts is None:
+            have_color_played = (np.sum(hand * color_masks[color_played, :]) > 0)
+        else:
+            have_color_played = color_counts[color_played] > 0
 
         if trump >= 4:
             # obe or une declared
@@ -54,8 +65,12 @@ class RuleSchieber(Rule):
             #
 
             # check number of trumps we have and number of cards left, in order to simplify some of the conditions
-            number_of_trumps = np.sum(hand * color_masks[trump, :])
-            number_of_cards = np.sum(hand)
+            if color_counts is None:
+                number_of_trumps = np.sum(hand * color_masks[trump, :])
+                number_of_cards = np.sum(hand)
+            else:
+                number_of_trumps = color_counts[trump]
+                number_of_cards = color_counts[0] + color_counts[1] + color_counts[2] + color_counts[3]
 
             #
             # the played color was trump
@@ -144,6 +159,81 @@ class RuleSchieber(Rule):
                         not_lower_trump_cards = 1 - lower_trump_cards
                         return hand * not_lower_trump_cards
 
+    def get_valid_cards_batch(self, hands: np.ndarray,
+                              tricks: np.ndarray,
+                              move_nr: np.ndarray,
+                              trump: np.ndarray) -> np.ndarray:
+        """
+        Get the valid cards for a number of independent positions at once. The result is the same as calling
+        get_valid_cards for each position, but is calculated using operations on the whole arrays.
+
+        Args:
+            hands: [N,36] one-hot encoded arrays of the hands of the players to move
+            tricks: [N,4] arrays with the indices of the cards of the current tricks (-1 for cards not played yet)
+            move_nr: [N] the number of the move in the current trick, 0 for first move, 1 for second and so on
+            trump: [N] trump color (or 'obe', 'une')
+
+        Returns:
+            [N,36] one-hot encoded arrays of the valid moves
+        """
+        hands = np.asarray(hands)
+        tricks = np.asarray(tricks)
+        move_nr = np.asarray(move_nr)
+        trump = np.asarray(trump)
+        nr_hands = hands.shape[0]
+
+        # color of the first card (unplayed cards are replaced by 0, they are only used if the move_nr is 0)
+        color_played = color_of_card[np.maximum(tricks[:, 0], 0)]
+        color_cards = hands * color_masks[color_played, :]
+        have_color_played = (np.sum(color_cards, axis=1) > 0)[:, None]
+
+        #
+        # obe or une declared: give the color if we have it
+        #
+        valid_obe_une = np.where(have_color_played, color_cards, hands)
+
+        #
+        # round with trumps declared (the values are ignored for obe and une)
+        #
+        trump_color = np.where(trump < 4, trump, 0)
+        trump_cards = hands * color_masks[trump_color, :]
+        number_of_trumps = np.sum(trump_cards, axis=1)
+        number_of_cards = np.sum(hands, axis=1)
+
+        # the played color was trump: must give trump, unless we have none or only the trump jack
+        only_jack = (number_of_trumps == 1) & (hands[np.arange(nr_hands), trump_color * 9 + J_offset] == 1)
+        must_give_trump = ((number_of_trumps > 0) & ~only_jack)[:, None]
+        valid_trump_played_first = np.where(must_give_trump, trump_cards, hands)
+
+        # the played color was not trump, so find the trumps of player 1 and player 2 in the trick, as in
+        # get_valid_cards the card with the highest index is the lowest trump played
+        other_cards = tricks[:, 1:3]
+        other_cards_played = (other_cards >= 0) & (np.arange(1, 3)[None, :] < move_nr[:, None])
+        other_trumps = other_cards_played & \
+            (color_of_card[np.maximum(other_cards, 0)] == trump_color[:, None])
+        lowest_trump_played = np.max(np.where(other_trumps, other_cards, -1), axis=1)
+        trump_played = (lowest_trump_played >= 0)[:, None]
+        lowest_trump_played = np.maximum(lowest_trump_played, 0)
+
+        # nobody played a trump: must give a color or can give any trump
+        valid_no_trump_played = np.where(have_color_played, color_cards + trump_cards, hands)
+
+        # somebody played a trump: must give a color or a higher trump, or anything except a lower trump if we
+        # do not have the color, unless we have only trumps left
+        higher_trump_cards = trump_cards * higher_trump[lowest_trump_played, :]
+        lower_trump_cards = trump_cards * lower_trump[lowest_trump_played, :]
+        valid_trump_played = np.where(have_color_played, color_cards + higher_trump_cards,
+                                      hands * (1 - lower_trump_cards))
+        valid_trump_played = np.where((number_of_trumps == number_of_cards)[:, None], hands, valid_trump_played)
+
+        valid_other_color = np.where(trump_played, valid_trump_played, valid_no_trump_played)
+        valid_trump = np.where((color_played == trump_color)[:, None], valid_trump_played_first, valid_other_color)
+
+        valid = np.where((trump < 4)[:, None], valid_trump, valid_obe_une)
+
+        # play anything on the first move
+        return np.where((move_nr == 0)[:, None], hands, valid)
+
     def calc_points(self, trick: np.ndarray, is_last: bool, trump: int = -1) -> int:
         """
         Calculate the points from the cards in the trick according to the given trump
@@ -153,14 +243,41 @@ class RuleSchieber(Rule):
             is_last: true if this is the last trick
             trump: trump for the round
         """
-        return int(np.sum(card_values[trump, trick])) + (5 if is_last else 0)
+        values = _card_values[trump]
+        return values[trick[0]] + values[trick[1]] + values[trick[2]] + values[trick[3]] + (5 if is_last else 0)
 
     def calc_winner(self, trick: np.ndarray, first_player: int, trump: int = -1) -> int:
         """
         Calculate the winner of a completed trick.
 
-        Second implementation in an attempt to be more efficient, while the implementation is somewhat longer
-        and more complicated it is about 3 times faster than the previous method.
+        The winner is determined using the precomputed strength of the cards for the trump and the color of
+        the first card (const.trick_card_strength), so no distinction between the trump modes is necessary.
+        The result is the same as the one of calc_winner_by_rules, also for a trick without trump (trump < 0), in
+        which the highest card of the color of the first card wins as for obe.
+
+        Precondition:
+            0 <= trick[i] <= 35, for i = 0..3
+        Args:
+            trick: the completed trick
+            first_player: the first player of the trick
+            trump: trump for the round
+        Returns:
+            the player who won this trick
+        """
+        strength = _trick_card_strength[trump if trump >= 0 else OBE_ABE][_color_of_card[trick[0]]]
+        winner = 0
+        highest_strength = strength[trick[0]]
+        for i in range(1, 4):
+            if strength[trick[i]] > highest_strength:
+                highest_strength = strength[trick[i]]
+                winner = i
+        # adjust actual winner by first player
+        return (first_player - winner) % 4
+
+    def calc_winner_by_rules(self, trick: np.ndarray, first_player: int, trump: int = -1) -> int:
+        """
+        Calculate the winner of a completed trick by evaluating the rules for the different trump modes. This was
+        the implementation of calc_winner before the table based implementation and is kept as reference.
 
         Precondition:
             0 <= trick[i] <= 35, for i = 0..3
@@ -227,4 +344,43 @@ class RuleSchieber(Rule):
                         highest_card = trick[i]
                         winner = i
         # adjust actual winner by first player
-        return (first_player - winner) % 4
\ No newline at end of file
+        return (first_player - winner) % 4
+
+    def calc_points_batch(self, tricks: np.ndarray, is_last: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the points of a number of tricks at once according to the given trumps
+
+        Args:
+            tricks: [N,4] the tricks
+            is_last: [N] true if the trick is the last trick of its round
+            trump: [N] trump for the round of each trick
+
+        Returns:
+            [N] the points of the tricks
+        """
+        tricks = np.asarray(tricks)
+        trump = np.asarray(trump)
+        return np.sum(card_values[trump[:, None], tricks], axis=1) + np.where(is_last, 5, 0)
+
+    def calc_winner_batch(self, tricks: np.ndarray, first_player: np.ndarray, trump: np.ndarray) -> np.ndarray:
+        """
+        Calculate the winners of a number of completed tricks at once. The winner of each trick is the card with the
+        highest strength for the trump and the color of the first card (see const.trick_card_strength), tricks
+        without trump (trump < 0) are won as for obe.
+
+        Precondition:
+            0 <= tricks[:, i] <= 35, for i = 0..3
+        Args:
+            tricks: [N,4] the completed tricks
+            first_player: [N] the first player of each trick
+            trump: [N] trump for the round of each trick
+
+        Returns:
+            [N] the players who won the tricks
+        """
+        tricks = np.asarray(tricks)
+        trump = np.asarray(trump)
+        trump = np.where(trump < 0, OBE_ABE, trump)
+        color_of_first_card = color_of_card[tricks[:, 0:1]]
+        winner = np.argmax(trick_card_strength[trump[:, None], color_of_first_card, tricks], axis=1)
+        return (np.asarray(first_player) - winner) % 4
@@ -0,0 +1,113 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+
+""" Implementation of rules of jass game for schieber using bitboards"""
+
+import numpy as np
+
+from jass.base.const import color_of_card, J_offset
+from jass.base.bitboard import card_bits, color_masks_bits, higher_trump_bits, lower_trump_bits, \
+    cards_to_bits, bits_to_cards
+from jass.base.rule_schieber import RuleSchieber
+
+# python list versions of the tables (indexing lists with python ints is faster than indexing numpy arrays)
+_color_of_card = color_of_card.tolist()
+
+
+class RuleSchieberBitboard(RuleSchieber):
+    """
+    Rules for 'Schieber' where the valid cards are calculated on hands represented as 36 bit integers
+    (see jass.base.bitboard). The results are identical to the ones of RuleSchieber.
+
+    The method get_valid_cards_bits is meant to be used directly by code that keeps the hands as bitboards (see
+    DoubleDummySolver and rollout), where it is an order of magnitude faster than the array rule. The method
+    get_valid_cards converts the hand from and to 1-hot encoded arrays on every call, so when the class is used as
+    the rule of a Round (RULE_IMPL_BITBOARD), it is not faster than RuleSchieber. It serves to cross-check the
+    bitboard calculation against the array rule in the rounds and tests.
+    """
+
+    def get_valid_cards(self, hand: np.array,
+                        current_trick: np.ndarray or list,
+                        move_nr: int,
+                        trump: int or None,
+                        color_counts: np.ndarray or list = None) -> np.array:
+        """
+        Get the valid cards that can be played by the current player.
+
+        Args:
+            hand: one-hot encoded array of hands owned by the player
+            current_trick: array with the indices of the cards for the previous moves in the current trick
+            move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
+            trump: trump color (or 'obe', 'une')
+            color_counts: not used, as the cards are counted on the bitboard
+
+        Returns:
+            one-hot encoded array of valid moves
+        """
+        # play anything on the first move
+        if move_nr == 0:
+            return hand
+        return bits_to_cards(self.get_valid_cards_bits(cards_to_bits(hand), current_trick, move_nr, trump))
+
+    def get_valid_cards_bits(self, hand: int,
+                             current_trick: np.ndarray or list,
+                             move_nr: int,
+                             trump: int) -> int:
+        """
+        Get the valid cards that can be played by the current player, using bitboards for the hand and result.
+
+        Args:
+            hand: bitboard of the cards owned by the player
+            current_trick: array with the indices of the cards for the previous moves in the current trick
+            move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
+            trump: trump color (or 'obe', 'une')
+
+        Returns:
+            bitboard of the valid moves
+        """
+        # play anything on the first move
+        if move_nr == 0:
+            return hand
+
+        # get the color of the first played card and check if we have that color
+        color_played = _color_of_card[current_trick[0]]
+        color_cards = hand & color_masks_bits[color_played]
+
+        if trump >= 4:
+            # obe or une declared, must give the correct color if we have it
+            return color_cards if color_cards else hand
+
+        trump_cards = hand & color_masks_bits[trump]
+
+        if color_played == trump:
+            # must give trump, unless we have none or just the trump jack
+            if trump_cards == 0 or trump_cards == card_bits[trump * 9 + J_offset]:
+                return hand
+            return trump_cards
+
+        # check if anybody else (player 1 or player 2) played a trump, as in RuleSchieber the card with the
+        # highest index is used as the lowest trump
+        lowest_trump_played = -1
+        if move_nr > 1:
+            if _color_of_card[current_trick[1]] == trump:
+                lowest_trump_played = current_trick[1]
+            if move_nr == 3 and _color_of_card[current_trick[2]] == trump and \
+                    current_trick[2] > lowest_trump_played:
+                lowest_trump_played = current_trick[2]
+
+        if lowest_trump_played < 0:
+            # nobody played a trump, must give a color or can give any trump
+            return color_cards | trump_cards if color_cards else hand
+
+        if trump_cards == hand:
+            # we have only trump left, so we can give any of them
+            return hand
+
+        if color_cards:
+            # must give a color or a higher trump
+            return color_cards | (trump_cards & higher_trump_bits[lowest_trump_played])
+        else:
+            # play anything except a lower trump
+            return hand & ~(trump_cards & lower_trump_bits[lowest_trump_played])
@@ -0,0 +1,135 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+
+""" Implementation of rules of jass game for schieber using precomputed tables"""
+
+import numpy as np
+
+from jass.base.const import color_of_card, offset_of_card, higher_trump_card, J_offset
+from jass.base.bitboard import color_shift, color_masks_bits
+from jass.base.rule_schieber_bitboard import RuleSchieberBitboard
+
+#
+# The valid cards in schieber only depend on the cards held in the color played and in trump, on whether the
+# hand contains other cards, on the color played, the trump and the lowest trump in the trick. The tables below
+# are indexed by the cards of one color as 9 bit integer (the holding) and are the same for all colors.
+#
+
+# number of different holdings in one color
+_NR_HOLDINGS = 1 << 9
+
+
+def _offsets_to_holding(offsets) -> int:
+    return sum(1 << offset for offset in offsets)
+
+
+def _build_trump_lead_table() -> list:
+    """
+    Build the table for the case that trump was played as first card.
+
+    Returns:
+        list indexed by the trump holding, True if any card of the hand can be played (no trump or only the jack),
+        False if one of the trumps must be played
+    """
+    return [holding == 0 or holding == (1 << J_offset) for holding in range(_NR_HOLDINGS)]
+
+
+def _build_valid_trump_table() -> list:
+    """
+    Build the table for the valid trumps if a color other than trump was played as first card. The table is indexed
+    by [lowest_trump_offset + 1][only_trumps][holding], where lowest_trump_offset is the offset of the lowest trump
+    in the trick or -1 if no trump was played and only_trumps is 1 if the hand contains only trumps.
+
+    Returns:
+        nested lists of the valid trumps as 9 bit integer
+    """
+    higher_holdings = [_offsets_to_holding(np.flatnonzero(higher_trump_card[offset, :])) for offset in range(9)]
+    table = []
+    for lowest_trump_offset in range(-1, 9):
+        table_lowest = []
+        for only_trumps in range(2):
+            if lowest_trump_offset < 0 or only_trumps:
+                # all trumps can be played
+                table_lowest.append(list(range(_NR_HOLDINGS)))
+            else:
+                # no lower trump can be played
+                table_lowest.append([holding & higher_holdings[lowest_trump_offset]
+                                     for holding in range(_NR_HOLDINGS)])
+        table.append(table_lowest)
+    return table
+
+
+def _build_trump_offset_table() -> list:
+    """
+    Build the table for the offset of a card in the trick, if the card is trump.
+
+    Returns:
+        list indexed by [trump][card] with the offset of the card if it is a trump and -1 otherwise
+    """
+    return [[int(offset_of_card[card]) if color_of_card[card] == trump else -1 for card in range(36)]
+            for trump in range(4)]
+
+
+_trump_lead_any = _build_trump_lead_table()
+_valid_trump = _build_valid_trump_table()
+_trump_offset = _build_trump_offset_table()
+_color_of_card = color_of_card.tolist()
+
+
+class RuleSchieberTable(RuleSchieberBitboard):
+    """
+    Rules for 'Schieber' where the valid cards are determined by lookups in tables indexed by the holdings in the
+    color played and in trump instead of evaluating the rules. The tables are built when the module is imported.
+    The results are identical to the ones of RuleSchieber.
+    """
+
+    def get_valid_cards_bits(self, hand: int,
+                             current_trick: np.ndarray or list,
+                             move_nr: int,
+                             trump: int) -> int:
+        """
+        Get the valid cards that can be played by the current player, using bitboards for the hand and result.
+
+        Args:
+            hand: bitboard of the cards owned by the player
+            current_trick: array with the indices of the cards for the previous moves in the current trick
+            move_nr: which move the player has to make in the current trick, 0 for first move, 1 for second and so on
+            trump: trump color (or 'obe', 'une')
+
+        Returns:
+            bitboard of the valid moves
+        """
+        if move_nr == 0:
+            return hand
+
+        color_played = _color_of_card[current_trick[0]]
+        color_cards = hand & color_masks_bits[color_played]
+
+        if trump >= 4:
+            return color_cards if color_cards else hand
+
+        trump_shift = color_shift[trump]
+        trump_cards = hand & color_masks_bits[trump]
+        trump_holding = trump_cards >> trump_shift
+
+        if color_played == trump:
+            return hand if _trump_lead_any[trump_holding] else trump_cards
+
+        # the lowest trump is the one with the highest index (see RuleSchieber)
+        lowest_trump_offset = -1
+        if move_nr > 1:
+            trump_offset = _trump_offset[trump]
+            lowest_trump_offset = trump_offset[current_trick[1]]
+            if move_nr == 3:
+                offset = trump_offset[current_trick[2]]
+                if offset > lowest_trump_offset:
+                    lowest_trump_offset = offset
+
+        valid_trumps = _valid_trump[lowest_trump_offset + 1][hand == trump_cards][trump_holding] << trump_shift
+
+        if color_cards:
+            return color_cards | valid_trumps
+        else:
+            return (hand ^ trump_cards) | valid_trumps
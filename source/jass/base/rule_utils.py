@@ -3,8 +3,11 @@
 # Created by Thomas Koller on 06.09.18
 #
 
+import numpy as np
+
 from jass.base.player_round import PlayerRound
 from jass.base.round import Round
+from jass.base.round_utils import calculate_positions_from_round
 
 
 def validate_round(rnd: Round):
@@ -14,11 +17,11 @@ def validate_round(rnd: Round):
     Args:
         rnd: a complete round
     """
-    player_rnds = PlayerRound.all_from_complete_round(rnd)
-    for i, player_rnd in enumerate(player_rnds):
-        nr_trick, move_in_trick = divmod(i, 4)
-        card_played = rnd.tricks[nr_trick, move_in_trick]
-        validate_player_round(player_rnd, card_played)
+    hands, tricks, move_nr = calculate_positions_from_round(rnd)
+    trump = np.full(36, -1 if rnd.trump is None else rnd.trump)
+    valid_cards = rnd.rule.get_valid_cards_batch(hands, tricks, move_nr, trump)
+    cards_played = rnd.tricks.reshape(-1)
+    assert np.all(valid_cards[np.arange(36), cards_played] == 1)
 
 
 def validate_player_round(player_rnd: PlayerRound, card_played: int) -> None:
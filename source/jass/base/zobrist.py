@@ -0,0 +1,62 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Zobrist keys for the states of a round.
+
+The key of a state is the xor of random 64 bit numbers for the components of the state: the owner of each card
+that is still held, the card at each position of the current trick, the player to move, the trump and the points
+of both teams. As xor is its own inverse, the key can be updated incrementally when a card is played or taken
+back (see Round.action_play_card and Round.undo_play_card), and states that are reached by playing the same
+cards in a different order get the same key, so that they can be found in a transposition table.
+
+The numbers are generated from a fixed seed, so the keys are the same in all processes. The tables are python
+lists of python ints, which are faster to index and to xor than numpy arrays for single values.
+"""
+import numpy as np
+
+from jass.base.const import MAX_TRUMP
+
+_rng = np.random.default_rng(0x5A0B2157)
+
+# key of a card in the hand of a player, indexed by player and card
+zobrist_hand = _rng.integers(0, 2**64, size=(4, 36), dtype=np.uint64, endpoint=False).tolist()
+
+# key of a card at a position of the current trick, indexed by position and card
+zobrist_trick = _rng.integers(0, 2**64, size=(4, 36), dtype=np.uint64, endpoint=False).tolist()
+
+# key of the player to move
+zobrist_player = _rng.integers(0, 2**64, size=4, dtype=np.uint64, endpoint=False).tolist()
+
+# key of the trump
+zobrist_trump = _rng.integers(0, 2**64, size=MAX_TRUMP + 1, dtype=np.uint64, endpoint=False).tolist()
+
+# multipliers for the keys of the points of the teams (odd, so that different points give different keys)
+_points_multiplier = [int(m) | 1 for m in _rng.integers(0, 2**64, size=2, dtype=np.uint64, endpoint=False)]
+
+_MASK_64 = 2**64 - 1
+
+
+def zobrist_points(team: int, points: int) -> int:
+    """
+    Get the key of the points of a team. The key is calculated instead of looked up, as the points can be
+    negative for some variants (for example hearts).
+
+    Args:
+        team: the team, 0 or 1
+        points: the points of the team
+
+    Returns:
+        the key of the points
+    """
+    return ((int(points) + 1) * _points_multiplier[team]) & _MASK_64
+
+
+def zobrist_trump_key(trump: int or None) -> int:
+    """
+    Get the key of the trump, which is 0 if no trump has been declared.
+    """
+    if trump is None or not 0 <= trump <= MAX_TRUMP:
+        return 0
+    return zobrist_trump[trump]
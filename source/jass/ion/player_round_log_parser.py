@@ -92,6 +92,7 @@ class PlayerRoundLogParser:
         rnd.nr_tricks = len(tricks)
         for card_constant in round_dict['hand']:
             rnd.hand[card_ids[card_constant]] = 1
+        rnd.update_color_counts()
 
         return rnd
 
@@ -106,5 +107,6 @@ class PlayerRoundLogParser:
         for i, hand in enumerate(round_dict['hands']):
             for card_constant in hand:
                 rnd.hands[i][card_ids[card_constant]] = 1
+        rnd.update_color_counts()
 
         return rnd
@@ -166,6 +166,7 @@ class PlayerRoundSerializer:
                 for card_constant in hand:
                     rnd.hand[card_ids[card_constant]] = 1
 
+        rnd.update_color_counts()
         rnd.calculate_points_from_tricks()
         return rnd
 
@@ -412,6 +413,7 @@ class PlayerRoundCheatingSerializer:
                 for card_constant in hand:
                     rnd.hand[card_ids[card_constant]] = 1
 
+        rnd.update_color_counts()
         rnd.calculate_points_from_tricks()
         return rnd
 
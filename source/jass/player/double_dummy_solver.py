@@ -0,0 +1,265 @@
+from jass.base.bitboard import card_bits, cards_to_bits, bits_to_int_list
+from jass.base.const import card_values, card_strength, color_of_card, next_player, trick_card_strength
+from jass.base.round import Round
+from jass.base.rule_schieber_bitboard import RuleSchieberBitboard
+from jass.base.zobrist import zobrist_hand, zobrist_player, zobrist_trump_key
+from jass.player.transposition_table import TranspositionTable
+
+# python list versions of the tables (indexing lists with python ints is faster than indexing numpy arrays)
+_color_of_card = color_of_card.tolist()
+_card_values = card_values.tolist()
+_card_strength = card_strength.tolist()
+_trick_card_strength = trick_card_strength.tolist()
+
+_get_valid_cards_bits = RuleSchieberBitboard().get_valid_cards_bits
+
+# values larger than any number of points
+_INFINITY = 1000
+
+# constants xored to the keys of the entries of the solver, to separate them from other entries of a shared table:
+# the bounds of the search at the start of a trick and the results of solve for the zobrist key of a round
+_SEARCH_KEY = 0x6A09E667F3BCC908
+_SOLVE_KEY = 0xBB67AE8584CAA73B
+
+
+class DoubleDummySolver:
+    """
+    Exact solver for the remaining tricks of a round of Schieber with known hands (double dummy): the team of
+    players 0 and 2 maximizes its points and the other team minimizes them.
+
+    The solver uses alpha-beta search on bitboards of the hands with
+        - a transposition table of the value of the remaining tricks for the hands and the first player at the
+          start of each trick (stored as lower and upper bound together with the best card), the zobrist key of
+          the hands is updated incrementally during the search,
+        - move ordering, trying the best card from the transposition table and then the stronger cards first,
+        - pruning of equivalent cards: cards of the same color and value in one hand, between which there is no
+          card of another hand or of the current trick in the order of the cards, lead to the same result, so only
+          one of them is searched.
+
+    As the keys of the transposition table contain all the hands and the trump, the table can be shared by
+    solvers for different rounds, for example for the sampled worlds of the searches of a worker process. The
+    results of solve are stored in the table as well, for the zobrist key of the round (the key maintained by the
+    round if hashing is enabled, see Round.update_hash, otherwise it is calculated without changing the round).
+    """
+
+    def __init__(self, trump: int, table: TranspositionTable = None):
+        self.trump = trump
+        self.table = table if table is not None else TranspositionTable()
+        self.nr_nodes = 0
+        self._key_offset = zobrist_trump_key(trump) ^ _SEARCH_KEY
+        self._values = _card_values[trump]
+        self._strength = _card_strength[trump]
+        self._strength_by_color = _trick_card_strength[trump]
+        # the cards of each color, from the strongest to the weakest
+        self._cards_by_rank = [sorted(range(color * 9, color * 9 + 9), key=lambda card: -self._strength[card])
+                               for color in range(4)]
+
+    def solve(self, rnd) -> (int, int):
+        """
+        Calculate the points of both teams at the end of the round if all players play optimally.
+
+        Args:
+            rnd: the round (Round or PlayerRoundCheating) with the hands of all players, in which trump has been
+            declared
+
+        Returns:
+            the points of team 0 and team 1
+        """
+        if rnd.nr_tricks == 9:
+            return rnd.points_team_0, rnd.points_team_1
+        solve_key = None
+        if isinstance(rnd, Round):
+            key = rnd.zobrist_key if rnd.zobrist_key is not None else rnd.calc_hash()
+            solve_key = key ^ _SOLVE_KEY
+            result = self.table.get(solve_key)
+            if result is not None:
+                return result
+        hands, key, trick, first_player = self._get_state(rnd)
+        points = self._search(hands, key, trick, rnd.nr_cards_in_trick, rnd.player, first_player,
+                              -_INFINITY, _INFINITY)
+        result = self._to_team_points(rnd, points)
+        if solve_key is not None:
+            self.table.put(solve_key, result, 36 - rnd.nr_played_cards)
+        return result
+
+    def solve_cards(self, rnd) -> dict:
+        """
+        Calculate the points of both teams at the end of the round for each valid card of the player to move, if
+        all players play optimally afterwards.
+
+        Args:
+            rnd: the round (Round or PlayerRoundCheating) with the hands of all players, in which trump has been
+            declared and that is not finished
+
+        Returns:
+            dict of the points of team 0 and team 1 by card
+        """
+        hands, key, trick, first_player = self._get_state(rnd)
+        player = rnd.player
+        nr_cards_in_trick = rnd.nr_cards_in_trick
+        result = {}
+        for card in bits_to_int_list(_get_valid_cards_bits(hands[player], trick, nr_cards_in_trick, self.trump)):
+            hands[player] ^= card_bits[card]
+            trick[nr_cards_in_trick] = card
+            points = self._play(hands, key ^ zobrist_hand[player][card], trick, nr_cards_in_trick, player,
+                                first_player, -_INFINITY, _INFINITY)
+            hands[player] ^= card_bits[card]
+            result[card] = self._to_team_points(rnd, points)
+        return result
+
+    def best_card(self, rnd) -> int:
+        """
+        Get the best card for the player to move.
+        """
+        team = rnd.player % 2
+        points_by_card = self.solve_cards(rnd)
+        return max(points_by_card, key=lambda card: points_by_card[card][team])
+
+    def _get_state(self, rnd) -> (list, int, list, int):
+        hands = [cards_to_bits(hand) for hand in rnd.hands]
+        key = 0
+        for player in range(4):
+            for card in bits_to_int_list(hands[player]):
+                key ^= zobrist_hand[player][card]
+        trick = rnd.current_trick.tolist()
+        first_player = int(rnd.trick_first_player[rnd.nr_tricks]) if rnd.nr_cards_in_trick > 0 else rnd.player
+        return hands, key, trick, first_player
+
+    @staticmethod
+    def _to_team_points(rnd, points: int) -> (int, int):
+        # the points of the remaining tricks are distributed among the teams, team 0 got the given points
+        remaining = 157 - rnd.points_team_0 - rnd.points_team_1
+        return rnd.points_team_0 + points, rnd.points_team_1 + remaining - points
+
+    def _search(self, hands: list, key: int, trick: list, nr_cards_in_trick: int, player: int, first_player: int,
+                alpha: int, beta: int) -> int:
+        """
+        Search the position with the player to move, key is the zobrist key of the hands.
+
+        Returns:
+            the points of team 0 in the rest of the round (including the current trick)
+        """
+        self.nr_nodes += 1
+        tt_card = -1
+        tt_key = None
+        if nr_cards_in_trick == 0:
+            tt_key = key ^ zobrist_player[player] ^ self._key_offset
+            entry = self.table.get(tt_key)
+            if entry is not None:
+                lower, upper, tt_card = entry
+                if lower >= beta or lower == upper:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+        alpha_start = alpha
+        beta_start = beta
+
+        maximize = player % 2 == 0
+        best_points = -_INFINITY if maximize else _INFINITY
+        best_card = -1
+        for card in self._get_moves(hands, trick, nr_cards_in_trick, player, tt_card):
+            hands[player] ^= card_bits[card]
+            trick[nr_cards_in_trick] = card
+            points = self._play(hands, key ^ zobrist_hand[player][card], trick, nr_cards_in_trick, player,
+                                first_player, alpha, beta)
+            hands[player] ^= card_bits[card]
+            if maximize:
+                if points > best_points:
+                    best_points = points
+                    best_card = card
+                    if points > alpha:
+                        alpha = points
+            else:
+                if points < best_points:
+                    best_points = points
+                    best_card = card
+                    if points < beta:
+                        beta = points
+            if alpha >= beta:
+                break
+
+        if tt_key is not None:
+            lower, upper = -_INFINITY, _INFINITY
+            if entry is not None:
+                lower, upper = entry[0], entry[1]
+            if best_points <= alpha_start:
+                upper = min(upper, best_points)
+            elif best_points >= beta_start:
+                lower = max(lower, best_points)
+            else:
+                lower = upper = best_points
+            # the number of remaining cards as priority, as the entries close to the root save the most work
+            self.table.put(tt_key, (lower, upper, best_card), 4 * bin(hands[player]).count('1'))
+        return best_points
+
+    def _play(self, hands: list, key: int, trick: list, nr_cards_in_trick: int, player: int, first_player: int,
+              alpha: int, beta: int) -> int:
+        """
+        Continue the search after the player has played the card trick[nr_cards_in_trick].
+
+        Returns:
+            the points of team 0 in the rest of the round (including the current trick)
+        """
+        if nr_cards_in_trick < 3:
+            return self._search(hands, key, trick, nr_cards_in_trick + 1, next_player[player], first_player,
+                                alpha, beta)
+
+        # end of the trick, the winner is the player of the strongest card (see RuleSchieber.calc_winner)
+        strength = self._strength_by_color[_color_of_card[trick[0]]]
+        winner = 0
+        highest_strength = strength[trick[0]]
+        for i in range(1, 4):
+            if strength[trick[i]] > highest_strength:
+                highest_strength = strength[trick[i]]
+                winner = i
+        winner = (first_player - winner) % 4
+        values = self._values
+        points = values[trick[0]] + values[trick[1]] + values[trick[2]] + values[trick[3]]
+        if hands[winner] == 0:
+            # last trick
+            points += 5
+            return points if winner % 2 == 0 else 0
+        if winner % 2 == 0:
+            return points + self._search(hands, key, [-1, -1, -1, -1], 0, winner, winner,
+                                         alpha - points, beta - points)
+        return self._search(hands, key, [-1, -1, -1, -1], 0, winner, winner, alpha, beta)
+
+    def _get_moves(self, hands: list, trick: list, nr_cards_in_trick: int, player: int, tt_card: int) -> list:
+        """
+        Get the valid cards of the player without equivalent cards, ordered by the expected quality.
+        """
+        hand = hands[player]
+        valid = _get_valid_cards_bits(hand, trick, nr_cards_in_trick, self.trump)
+
+        # cards that separate the cards of the player in the order of a color
+        others = 0
+        for other_player in range(4):
+            if other_player != player:
+                others |= hands[other_player]
+        for i in range(nr_cards_in_trick):
+            others |= card_bits[trick[i]]
+
+        values = self._values
+        moves = []
+        for color in range(4):
+            if not (valid >> (color * 9)) & 0x1ff:
+                continue
+            run_values = []
+            for card in self._cards_by_rank[color]:
+                bit = card_bits[card]
+                if others & bit:
+                    run_values = []
+                elif valid & bit:
+                    if values[card] not in run_values:
+                        run_values.append(values[card])
+                        moves.append(card)
+
+        # stronger cards first, the card from the transposition table before all others
+        strength = self._strength
+        moves.sort(key=lambda card: -strength[card] * 32 - values[card])
+        if tt_card in moves:
+            moves.remove(tt_card)
+            moves.insert(0, tt_card)
+        return moves
@@ -0,0 +1,76 @@
+import numpy as np
+
+from jass.player.search_budget import SearchBudget
+
+
+class EarlyStopping:
+    """
+    Rule to end a search before its budget is exhausted, once the decision at the root is settled. The rule is
+    checked every check_interval iterations, when the cards at the root have at least min_visits visits in total.
+    The search stops if
+
+    - the most visited card can not be overtaken: its lead in visits over the second card is larger than the
+      number of iterations that remain in the budget, or
+    - a confidence bound separates it from all the other cards: the lower bound of its mean reward is above the
+      upper bound of the mean reward of every other card. The bounds are z standard errors from the mean, with the
+      variance estimated as in MCTSParallel.standard_errors. Unvisited cards have a standard error of 1, so they
+      are never separated.
+
+    The rule does not keep any state, so the same rule can be sent to several worker processes.
+    """
+
+    def __init__(self, check_interval: int = 256, min_visits: int = 1000, z: float = 2.58):
+        self.check_interval = check_interval
+        self.min_visits = min_visits
+        self.z = z
+
+    @staticmethod
+    def remaining_iterations(budget: SearchBudget, nr_iterations: int, elapsed_seconds: float) -> float:
+        """
+        Estimate the number of iterations that remain in the budget, from the rate of the iterations so far.
+
+        Args:
+            budget: the budget of the search
+            nr_iterations: the number of iterations done so far
+            elapsed_seconds: the time since the start of the search
+
+        Returns:
+            the estimated number of remaining iterations
+        """
+        remaining = np.inf
+        if budget.max_iterations is not None:
+            remaining = budget.max_iterations - nr_iterations
+        if budget.deadline is not None and elapsed_seconds > 0:
+            remaining = min(remaining, nr_iterations / elapsed_seconds * max(budget.remaining_seconds, 0.0))
+        return remaining
+
+    def is_decided(self, valid_cards: np.ndarray, visit_counts: np.ndarray, reward_sums: np.ndarray,
+                   remaining_iterations: float) -> bool:
+        """
+        Check if the search can stop.
+
+        Args:
+            valid_cards: the valid cards at the root, as indices
+            visit_counts: the visit counts of the cards at the root, as array of size 36
+            reward_sums: the sums of the rewards (between 0 and 1) of the cards at the root, as array of size 36
+            remaining_iterations: the (estimated) number of iterations that remain in the budget
+
+        Returns:
+            True if the best card can not change anymore (or only with a small probability)
+        """
+        visit_counts = visit_counts[valid_cards]
+        if len(valid_cards) < 2 or np.sum(visit_counts) < self.min_visits:
+            return len(valid_cards) < 2
+        second, best = np.argsort(visit_counts)[-2:]
+        if visit_counts[best] - visit_counts[second] > remaining_iterations:
+            return True
+
+        means = reward_sums[valid_cards] / np.maximum(visit_counts, 1)
+        errors = np.where(visit_counts > 0, np.sqrt(means * (1 - means) / np.maximum(visit_counts, 1)), 1.0)
+        upper_bounds = means + self.z * errors
+        upper_bounds[best] = -np.inf
+        return bool(means[best] - self.z * errors[best] > np.max(upper_bounds))
+
+    def __repr__(self):
+        return 'EarlyStopping(check_interval={}, min_visits={}, z={})'.format(self.check_interval, self.min_visits,
+                                                                               self.z)
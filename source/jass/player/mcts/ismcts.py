@@ -0,0 +1,303 @@
+import math
+
+import numpy as np
+
+from jass.base.player_round import PlayerRound
+from jass.base.round import Round
+from jass.base.round_factory import get_round_from_player_round
+from jass.player.double_dummy_solver import DoubleDummySolver
+from jass.player.mcts.rollout import rollout
+from jass.player.mcts.sampler import Sampler
+from jass.player.search_budget import SearchBudget
+from jass.player.transposition_table import TranspositionTable
+
+# number of worlds that are sampled at once
+_SAMPLE_BATCH_SIZE = 256
+
+# approximate memory of a node with its dict of children (measured with tracemalloc on CPython 3.11)
+_NODE_NBYTES = 240
+
+# share of the maximal number of nodes that is freed when the tree is recycled
+_RECYCLE_SHARE = 0.25
+
+
+class ISMCTSNode:
+    """
+    Node of the tree of the information set MCTS. A node represents the information set reached by playing the
+    cards on the path from the root and is reached by playing the card of the node. The children are stored in a
+    dict by their card.
+    """
+    __slots__ = ('parent', 'card', 'player', 'childs', 'visit_count', 'availability_count', 'total_reward')
+
+    def __init__(self, parent: 'ISMCTSNode' = None, card: int = None, player: int = None) -> None:
+        self.parent = parent
+        # the card played to reach the node and the player who played it
+        self.card = card
+        self.player = player
+        self.childs = {}
+        self.visit_count = 0
+        # number of times the node was available (its card was valid) when its parent was visited
+        self.availability_count = 0
+        # sum of the rewards for the player of the node
+        self.total_reward = 0.0
+
+
+class ISMCTSTree:
+    """
+    Tree of an information set search, together with the state of the round at the root and the player and hand
+    of the search. The state is used to decide if the tree can be reused for a later state of the same round by
+    the same player.
+
+    The tree keeps the largest number of nodes it had, so that its peak memory can be estimated, as the number of
+    nodes decreases when the tree is recycled.
+    """
+
+    def __init__(self, rnd: PlayerRound) -> None:
+        self.root = ISMCTSNode()
+        self.dealer = rnd.dealer
+        self.trump = rnd.trump
+        self.nr_played_cards = rnd.nr_played_cards
+        self.played_cards = rnd.tricks.reshape(-1)[:rnd.nr_played_cards].copy()
+        self.player = rnd.player
+        self.hand = rnd.hand.copy()
+        self.nr_nodes = 1
+        self.peak_nr_nodes = 1
+
+    @property
+    def peak_nbytes(self) -> int:
+        """
+        Estimated peak memory of the nodes of the tree.
+        """
+        return max(self.peak_nr_nodes, self.nr_nodes) * _NODE_NBYTES
+
+
+class ISMCTS:
+    """
+    Single observer information set MCTS. In contrast to MCTS, which searches one sampled world, a new world
+    (determinization) is sampled for every iteration and all iterations use the same tree. In each iteration, only
+    the cards that are valid in the sampled world are considered for the selection and expansion, and the UCB value
+    uses the number of times a card was available instead of the number of visits of the parent.
+
+    The reward of a simulation is the share of the points made by the team of the player of a node.
+    """
+
+    @staticmethod
+    def search(rnd: PlayerRound, budget: SearchBudget, ucb_c: float = 1, tree: ISMCTSTree = None,
+               max_nodes: int = None, solver_threshold: int = 0, table: TranspositionTable = None,
+               recycle: bool = False) -> ISMCTSTree:
+        """
+        Search the best card for the player round, until the budget is exhausted.
+
+        When the tree reaches max_nodes, it is either no longer expanded or, if recycle is set, a quarter of its
+        nodes is freed by removing the subtrees of the least visited nodes (see recycle).
+
+        Args:
+            rnd: the round from the view of the player to move
+            budget: the budget of the search, an iteration of the budget is one iteration of the search
+            ucb_c: exploration constant of UCB
+            tree: a tree for the current state from a previous search (see find_subtree), whose search is
+            continued, or None to start with a new tree
+            max_nodes: maximal number of nodes in the tree, when it is reached the tree is no longer expanded
+            solver_threshold: if at most this number of cards remain at the end of the expansion, the points of the
+            sampled world are calculated exactly by the double dummy solver instead of a random rollout
+            table: transposition table for the solver, or None to use a new table
+            recycle: true if the least visited subtrees should be removed when the tree is full
+
+        Returns:
+            the tree of the search
+        """
+        if tree is None:
+            tree = ISMCTSTree(rnd)
+        nr_iterations = 0
+        solver = DoubleDummySolver(rnd.trump, table) if solver_threshold > 0 else None
+        while not budget.is_exhausted(nr_iterations):
+            for hands in Sampler.sample_hands(rnd, _SAMPLE_BATCH_SIZE):
+                if recycle and max_nodes is not None and tree.nr_nodes >= max_nodes:
+                    ISMCTS.recycle(tree, max(int(max_nodes * _RECYCLE_SHARE), 1))
+                ISMCTS.iterate(tree, get_round_from_player_round(rnd, hands), ucb_c, max_nodes,
+                               solver, solver_threshold)
+                nr_iterations += 1
+                if budget.is_exhausted(nr_iterations):
+                    break
+        return tree
+
+    @staticmethod
+    def iterate(tree: ISMCTSTree, world: Round, ucb_c: float = 1, max_nodes: int = None,
+                solver: DoubleDummySolver = None, solver_threshold: int = 0) -> None:
+        """
+        Run one iteration of the search in the given world: select and expand a node, simulate the rest of the
+        round randomly and update the statistics of the nodes on the path.
+
+        Args:
+            tree: the tree of the search
+            world: the sampled world, which is changed by the iteration
+            ucb_c: exploration constant of UCB
+            max_nodes: maximal number of nodes in the tree
+            solver: solver to use instead of the random simulation, or None
+            solver_threshold: maximal number of remaining cards for which the solver is used
+        """
+        node = tree.root
+        # selection and expansion
+        while world.nr_played_cards < 36:
+            valid_cards = np.flatnonzero(world.get_valid_cards())
+            untried_cards = [card for card in valid_cards if card not in node.childs]
+            if untried_cards:
+                if max_nodes is not None and tree.nr_nodes >= max_nodes:
+                    break
+                card = int(untried_cards[np.random.randint(len(untried_cards))])
+                child = ISMCTSNode(node, card, world.player)
+                node.childs[card] = child
+                tree.nr_nodes += 1
+                for valid_card in valid_cards:
+                    if valid_card in node.childs:
+                        node.childs[valid_card].availability_count += 1
+                world.action_play_card(card)
+                node = child
+                break
+            node = ISMCTS._select_child(node, valid_cards, ucb_c)
+            world.action_play_card(node.card)
+
+        # simulation
+        if solver is not None and 36 - world.nr_played_cards <= solver_threshold:
+            points = solver.solve(world)
+        else:
+            points = rollout(world)
+
+        # back propagation
+        total_points = points[0] + points[1]
+        while node is not None:
+            node.visit_count += 1
+            if node.player is not None:
+                node.total_reward += points[node.player % 2] / total_points
+            node = node.parent
+
+    @staticmethod
+    def _select_child(node: ISMCTSNode, valid_cards: np.ndarray, ucb_c: float) -> ISMCTSNode:
+        best_child = None
+        best_score = -1.0
+        for card in valid_cards:
+            child = node.childs[card]
+            child.availability_count += 1
+            score = child.total_reward / child.visit_count + \
+                ucb_c * math.sqrt(math.log(child.availability_count) / child.visit_count)
+            if score > best_score:
+                best_child = child
+                best_score = score
+        return best_child
+
+    @staticmethod
+    def get_visit_counts(tree: ISMCTSTree) -> np.ndarray:
+        """
+        Get the number of visits of the cards at the root.
+
+        Returns:
+            array of size 36 with the visit count of each card
+        """
+        visit_counts = np.zeros(36, dtype=np.int64)
+        for card, child in tree.root.childs.items():
+            visit_counts[card] = child.visit_count
+        return visit_counts
+
+    @staticmethod
+    def get_reward_sums(tree: ISMCTSTree) -> np.ndarray:
+        """
+        Get the sum of the rewards of the cards at the root, for the player to move.
+
+        Returns:
+            array of size 36 with the sum of the rewards of each card
+        """
+        reward_sums = np.zeros(36, dtype=np.float64)
+        for card, child in tree.root.childs.items():
+            reward_sums[card] = child.total_reward
+        return reward_sums
+
+    @staticmethod
+    def find_subtree(tree: ISMCTSTree, rnd: PlayerRound) -> ISMCTSTree or None:
+        """
+        Find the subtree for the current state of the round by following the cards played since the search of
+        the tree. As the nodes represent information sets, this is possible as long as the nodes for the cards
+        have been expanded.
+
+        Args:
+            tree: the tree of a previous search
+            rnd: the current round from the view of the player to move
+
+        Returns:
+            the tree with the root at the node for the current state, or None if the tree can not be reused,
+            for example because the round is a different one
+        """
+        if tree.nr_played_cards > rnd.nr_played_cards or tree.trump != rnd.trump or tree.dealer != rnd.dealer or \
+                tree.player != rnd.player:
+            return None
+        played_cards = rnd.tricks.reshape(-1)
+        if not np.array_equal(played_cards[:tree.nr_played_cards], tree.played_cards):
+            return None
+        # the hand of the player must be the hand of the search without the cards played since, otherwise the
+        # tree is from another round with the same cards played so far
+        hand = tree.hand.copy()
+        hand[played_cards[tree.nr_played_cards:rnd.nr_played_cards]] = 0
+        if not np.array_equal(hand, rnd.hand):
+            return None
+        node = tree.root
+        for card in played_cards[tree.nr_played_cards:rnd.nr_played_cards]:
+            node = node.childs.get(int(card))
+            if node is None:
+                return None
+        node.parent = None
+        subtree = ISMCTSTree(rnd)
+        subtree.root = node
+        subtree.nr_nodes = ISMCTS.count_nodes(node)
+        return subtree
+
+    @staticmethod
+    def recycle(tree: ISMCTSTree, nr_nodes: int) -> int:
+        """
+        Free at least nr_nodes nodes (if the tree has enough nodes besides the root and its children) by removing
+        the children of the least visited nodes, which keep their statistics and are expanded again when they are
+        reached. As a node has at least as many visits as each of its children, removing the children of all the
+        nodes with less than a threshold of visits removes all the nodes whose parent has less visits than the
+        threshold.
+
+        Args:
+            tree: the tree of the search
+            nr_nodes: the number of nodes to free
+
+        Returns:
+            the number of nodes removed
+        """
+        nr_nodes = min(nr_nodes, tree.nr_nodes - 1)
+        if nr_nodes <= 0:
+            return 0
+        parent_visits = []
+        nodes = [tree.root]
+        while nodes:
+            node = nodes.pop()
+            parent_visits.extend([node.visit_count] * len(node.childs))
+            nodes.extend(node.childs.values())
+        threshold = np.partition(parent_visits, nr_nodes - 1)[nr_nodes - 1] + 1
+
+        nodes = list(tree.root.childs.values())
+        while nodes:
+            node = nodes.pop()
+            if node.visit_count < threshold:
+                node.childs = {}
+            else:
+                nodes.extend(node.childs.values())
+
+        nr_nodes_before = tree.nr_nodes
+        tree.peak_nr_nodes = max(tree.peak_nr_nodes, nr_nodes_before)
+        tree.nr_nodes = ISMCTS.count_nodes(tree.root)
+        return nr_nodes_before - tree.nr_nodes
+
+    @staticmethod
+    def count_nodes(root: ISMCTSNode) -> int:
+        """
+        Count the nodes of a tree.
+        """
+        nr_nodes = 0
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            nr_nodes += 1
+            nodes.extend(node.childs.values())
+        return nr_nodes
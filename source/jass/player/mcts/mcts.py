@@ -1,92 +1,197 @@
 from jass.base.const import *
 from jass.base.player_round import PlayerRound
-from jass.base.round_factory import get_round_from_player_round
+from jass.base.round import Round
 from jass.player.mcts.sampler import Sampler
-from jass.player.mcts.node import Node
-from jass.player.mcts.UCB import UCB
-from jass.player.random_player_schieber import RandomPlayerSchieber
-import time
-import copy
+from jass.player.mcts.node_store import NodeStore, NO_NODE
+from jass.player.mcts.rollout import rollout, rollout_batch
+from jass.player.double_dummy_solver import DoubleDummySolver
+from jass.player.search_budget import SearchBudget
+from jass.player.transposition_table import TranspositionTable
+
+# maximal number of children of a node, as a player has at most 9 cards
+_MAX_CHILDS = 9
+
+# share of the maximal number of nodes that is freed when the tree is recycled
+_RECYCLE_SHARE = 0.25
 
 
 class MCTS:
+    """
+    MCTS on one sampled world (determinization) of the hidden cards. A simulation is won for a node if the team of
+    the player who played the card of the node makes more points than the other team.
+    """
+
     @staticmethod
-    def monte_carlo_tree_search(rnd: PlayerRound, run_time_seconds=9) -> (Node, int):
-        end_time = time.time() + run_time_seconds
-
-        sampled_round = Sampler.sample(rnd)
-        root_node = Node()
-        root_node.player_nr = rnd.player
-        root_node.round = sampled_round
-        simulated_rounds = 0
-
-        while time.time() < end_time:
-            promising_node, depth = MCTS._select_promising_node(root_node)
-            valid_cards = np.flatnonzero(promising_node.round.get_valid_cards())
-
-            for card in valid_cards:
-                win, played_round = MCTS._simulate_round(sampled_round, card, (((depth + sampled_round.player) % 2) == 0))
-                new_node = Node()
-                new_node.parent = promising_node
-                new_node.round = played_round
-                new_node.player_nr = ((promising_node.player_nr + 1) % 4)
-                new_node.card = card
-                promising_node.add_child(new_node)
-                MCTS._back_propagation(new_node, win)
-            simulated_rounds += 1
-
-        return root_node
+    def monte_carlo_tree_search(rnd: PlayerRound, budget: SearchBudget, ucb_c=1, tree: NodeStore = None,
+                                max_nodes: int = None, solver_threshold: int = 0,
+                                table: TranspositionTable = None, rollouts_per_child: int = 1,
+                                recycle: bool = False) -> NodeStore:
+        """
+        Search the best card for the player round. The search is stopped when the budget is exhausted, an
+        iteration of the budget is one simulation.
+
+        If rollouts_per_child is larger than 1, the children of an expanded node are evaluated together by that
+        number of random rollouts each, which are played at once by rollout_batch and back propagated in bulk.
+        The budget is then checked before each expansion, so it can be exceeded by the rollouts of one expansion.
+
+        When the tree reaches max_nodes, it is either no longer expanded or, if recycle is set, a quarter of its
+        nodes is freed by removing the subtrees of the least visited nodes (see NodeStore.recycle).
+
+        Args:
+            rnd: the round from the view of the player to move
+            budget: the budget of the search
+            ucb_c: exploration constant of UCB
+            tree: the tree from a previous search for the same state (see find_subtree), whose search is
+            continued, or None to start with a new sample
+            max_nodes: maximal number of nodes in the tree, when it is reached the tree is no longer expanded and
+            only simulations are run from its leaves
+            solver_threshold: if at most this number of cards remain after the card of a simulation, the points are
+            calculated exactly by the double dummy solver instead of a random rollout (as the sampled world is
+            known, this is exact for the world)
+            table: transposition table for the solver, or None to use a new table
+            rollouts_per_child: the number of random rollouts of each child of an expanded node
+            recycle: true if the least visited subtrees should be removed when the tree is full
+
+        Returns:
+            the tree of the search, with the root at node 0
+        """
+        if tree is None:
+            tree = NodeStore()
+            tree.round = Sampler.sample(rnd)
+            tree.add_root(rnd.player)
+        else:
+            tree.player[0] = rnd.player
+        sampled_round = tree.round
+        nr_simulations = 0
+        solver = DoubleDummySolver(sampled_round.trump, table) if solver_threshold > 0 else None
+
+        while not budget.is_exhausted(nr_simulations):
+            if recycle and max_nodes is not None and tree.nr_nodes + _MAX_CHILDS > max_nodes:
+                tree.recycle(max(int(max_nodes * _RECYCLE_SHARE), _MAX_CHILDS))
+            path, promising_round = MCTS._select_promising_node(tree, ucb_c)
+            promising_node = path[-1]
+            if promising_round.nr_played_cards == 36:
+                # the round is finished at the leaf, so its result is known
+                tree.back_propagate(path, MCTS._get_winning_team(promising_round.points_team_0,
+                                                                 promising_round.points_team_1))
+                nr_simulations += 1
+                continue
+            valid_cards = np.flatnonzero(promising_round.get_valid_cards())
+
+            if max_nodes is not None and tree.nr_nodes + len(valid_cards) > max_nodes:
+                # memory limit reached, simulate from the leaf without adding nodes
+                winning_team = MCTS._simulate_round(promising_round, np.random.choice(valid_cards),
+                                                    solver, solver_threshold)
+                tree.back_propagate(path, winning_team)
+                nr_simulations += 1
+                continue
+
+            first = tree.add_childs(promising_node, valid_cards, promising_round.player)
+            use_solver = solver is not None and 36 - (promising_round.nr_played_cards + 1) <= solver_threshold
+            if rollouts_per_child > 1 and not use_solver:
+                nr_simulations += MCTS._simulate_childs(tree, path, first, promising_round, rollouts_per_child)
+                continue
+            for i, card in enumerate(valid_cards):
+                # children that are not simulated before the budget is exhausted remain unvisited
+                if budget.is_exhausted(nr_simulations):
+                    break
+                winning_team = MCTS._simulate_round(promising_round, card, solver, solver_threshold)
+                tree.back_propagate(path + [first + i], winning_team)
+                nr_simulations += 1
+
+        return tree
 
     @staticmethod
-    def _select_promising_node(root_node: Node) -> (Node, int):
-        node = root_node
-        depth = 0
-        while len(node.childs) != 0:
-            ucb = UCB()
-            node = ucb.find_best_node_ucb(node)
-            depth += 1
-        return node, depth
+    def find_subtree(tree: NodeStore, rnd: PlayerRound) -> NodeStore or None:
+        """
+        Find the node of a tree from a previous search that corresponds to the current state of the round, by
+        following the cards that have been played since the search. The world sampled for the tree is only
+        consistent with the round if it contains the nodes for all these cards, otherwise the tree can not be
+        used. This is also the case if the round is a different (new) round.
+
+        Args:
+            tree: the tree of the previous search
+            rnd: the current round from the view of the player to move
+
+        Returns:
+            a new tree with the subtree of the node for the current state, or None if the tree can not be reused
+        """
+        tree_round = tree.round
+        if tree_round.nr_played_cards > rnd.nr_played_cards or tree_round.trump != rnd.trump or \
+                tree_round.dealer != rnd.dealer:
+            return None
+        played_cards = rnd.tricks.reshape(-1)
+        tree_played_cards = tree_round.tricks.reshape(-1)
+        if not np.array_equal(played_cards[:tree_round.nr_played_cards],
+                              tree_played_cards[:tree_round.nr_played_cards]):
+            return None
+
+        node = 0
+        node_round = tree_round.clone()
+        for card in played_cards[tree_round.nr_played_cards:rnd.nr_played_cards]:
+            node = tree.find_child(node, card)
+            if node == NO_NODE:
+                return None
+            node_round.action_play_card(int(card))
+        if not np.array_equal(node_round.hands[rnd.player], rnd.hand):
+            return None
+        return tree.extract_subtree(node, node_round)
 
     @staticmethod
-    def _expand_node(node: Node, round: PlayerRound):
-        valid_cards = np.flatnonzero(round.get_valid_cards())
-        for card in valid_cards:
-            new_node = Node()
-            new_node.parent = node
-            new_node.round = round
-            new_node.player_nr = node.player_nr
-            new_node.card = card
-            node.add_child(new_node)
+    def _select_promising_node(tree: NodeStore, ucb_c=1) -> (list, Round):
+        """
+        Select a leaf of the tree by UCB.
+
+        Returns:
+            the indices of the nodes on the path from the root to the leaf and the round at the leaf
+        """
+        node = 0
+        path = [node]
+        rnd = tree.round.clone()
+        while tree.nr_childs[node] != 0:
+            node = tree.select_child_ucb(node, ucb_c)
+            rnd.action_play_card(int(tree.card[node]))
+            path.append(node)
+        return path, rnd
 
     @staticmethod
-    def _simulate_round(round: PlayerRound, card, my_play) -> (bool, PlayerRound):
-        rnd = get_round_from_player_round(round, round.hands)
-        player = rnd.player
-        rnd.action_play_card(card)
-        played_round = copy.deepcopy(rnd)
-        cards = rnd.nr_played_cards
-        random_player = RandomPlayerSchieber()
-        while cards < 36:
-            player_rnd = PlayerRound()
-            player_rnd.set_from_round(rnd)
-            card_action = random_player.play_card(player_rnd)
-            rnd.action_play_card(card_action)
-            cards += 1
-
-        max_points = rnd.points_team_0 + rnd.points_team_1
-        my_points = rnd.get_points_for_player(player)
-        enemy_points = max_points - my_points
-
-        win = (my_points > enemy_points and my_play) or (enemy_points > my_points and not my_play)
-        return win, played_round
+    def _simulate_round(round: Round, card, solver: DoubleDummySolver = None, solver_threshold: int = 0) -> int:
+        """
+        Play the card and simulate the rest of the round, by random play or by the solver if at most
+        solver_threshold cards remain.
+
+        Returns:
+            the team that made more points
+        """
+        round.action_play_card(card)
+        if solver is not None and 36 - round.nr_played_cards <= solver_threshold:
+            points_team_0, points_team_1 = solver.solve(round)
+        else:
+            points_team_0, points_team_1 = rollout(round)
+        round.undo_play_card()
+        return MCTS._get_winning_team(points_team_0, points_team_1)
+
+    @staticmethod
+    def _simulate_childs(tree: NodeStore, path: list, first: int, round: Round, rollouts_per_child: int) -> int:
+        """
+        Simulate all the children of the node at the end of the path with a batch of random rollouts each, and
+        update the statistics of the children and of the path.
+
+        Returns:
+            the number of simulations
+        """
+        nr_childs = int(tree.nr_childs[path[-1]])
+        child_rounds = []
+        for card in tree.card[first:first + nr_childs]:
+            child_round = round.clone()
+            child_round.action_play_card(int(card))
+            child_rounds.append(child_round)
+        points_team_0, points_team_1 = rollout_batch(child_rounds, rollouts_per_child)
+        wins_team_0 = np.sum(points_team_0 > points_team_1, axis=1)
+        tree.back_propagate_results(np.arange(first, first + nr_childs), rollouts_per_child, wins_team_0)
+        tree.back_propagate_results(path, nr_childs * rollouts_per_child, int(np.sum(wins_team_0)))
+        return nr_childs * rollouts_per_child
 
     @staticmethod
-    def _back_propagation(node: Node, win: bool):
-        temp_node = node
-        while temp_node:
-            temp_node.increment_visit()
-            if win:
-                temp_node.win_count += 1
-            else:
-                temp_node.lose_count += 1
-            temp_node = temp_node.parent
+    def _get_winning_team(points_team_0: int, points_team_1: int) -> int:
+        return 0 if points_team_0 > points_team_1 else 1
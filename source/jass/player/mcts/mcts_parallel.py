@@ -0,0 +1,252 @@
+import logging
+import os
+import random
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+
+from jass.base.player_round import PlayerRound
+from jass.player.mcts.early_stopping import EarlyStopping
+from jass.player.mcts.ismcts import ISMCTS, ISMCTSTree
+from jass.player.mcts.mcts import MCTS
+from jass.player.mcts.node_store import NodeStore
+from jass.player.search_budget import SearchBudget
+from jass.player.transposition_table import TranspositionTable
+
+# the search algorithms: MCTS on one sampled world per search or information set MCTS
+SEARCH_MCTS = 'mcts'
+SEARCH_ISMCTS = 'ismcts'
+
+# the tree of the last search of the worker process, kept for reuse in the next search, and the id of the run of
+# MCTSParallel, in which it was searched
+_last_tree = None  # type: NodeStore or ISMCTSTree
+_last_search_id = None  # type: str
+
+# the transposition table of the worker process, shared by the solvers of all its searches
+_table = None  # type: TranspositionTable
+
+
+def search_root(player_rnd: PlayerRound, budget: SearchBudget, ucb_c: float, seed: int,
+                reuse_tree: bool = False, max_nodes: int = None, search: str = SEARCH_MCTS,
+                solver_threshold: int = 0, rollouts_per_child: int = 1,
+                early_stopping: EarlyStopping = None, recycle: bool = False,
+                search_id: str = None) -> (np.ndarray, np.ndarray, int, int):
+    """
+    Run one independent search in a worker process and return the statistics of the root.
+
+    The random generators are seeded explicitly, as forked processes would otherwise start with the same state
+    and run identical searches.
+
+    If reuse_tree is set, the worker keeps the tree of its search and continues the search in the subtree for the
+    cards played in the meantime, if the tree is consistent with them (see MCTS.find_subtree and
+    ISMCTS.find_subtree). The tree is discarded otherwise, for example when a new round starts. The executor
+    does not assign the jobs of a run to different processes, so a process can run several jobs of the same run
+    one after the other. The tree of a previous job of the same run (with the same search_id) is not reused, as the
+    visits of its root would be counted twice in the results of the run.
+
+    The solver results are kept in a transposition table of the worker for all its searches, as the endgames of
+    the sampled worlds recur in the searches for the following cards.
+
+    With early_stopping, the search runs in slices of early_stopping.check_interval iterations and ends when the
+    rule decides on the statistics of the root of this worker.
+
+    Args:
+        player_rnd: the round from the view of the player to move
+        budget: the budget of the search, the iterations are counted per worker
+        ucb_c: exploration constant of UCB
+        seed: seed for the random generators of the worker
+        reuse_tree: true if the tree of the previous search of the worker should be reused
+        max_nodes: maximal number of nodes of the tree
+        search: the search algorithm, SEARCH_MCTS or SEARCH_ISMCTS
+        solver_threshold: maximal number of remaining cards for which the simulations are replaced by the double
+        dummy solver, 0 to always use random simulations
+        rollouts_per_child: the number of random rollouts of each child of an expanded node, which are played
+        together (only used by MCTS, see MCTS.monte_carlo_tree_search)
+        early_stopping: the rule to end the search before the budget is exhausted, or None to use the full budget
+        recycle: true if the least visited subtrees should be removed when the tree reaches max_nodes, instead of
+        no longer expanding it
+        search_id: the id of the run of MCTSParallel the search belongs to
+
+    Returns:
+        the visit counts and the sums of the rewards (between 0 and 1, for MCTS the wins) of the cards at the root
+        as arrays of size 36, the number of simulations of this search and the peak memory of the tree in bytes
+    """
+    global _last_tree, _last_search_id, _table
+    np.random.seed(seed)
+    random.seed(seed)
+    last_tree = _last_tree if reuse_tree and (search_id is None or search_id != _last_search_id) else None
+    _last_tree = None
+    if _table is None and solver_threshold > 0:
+        _table = TranspositionTable()
+
+    if search == SEARCH_ISMCTS:
+        tree = ISMCTS.find_subtree(last_tree, player_rnd) if isinstance(last_tree, ISMCTSTree) else None
+        visits_before = tree.root.visit_count if tree is not None else 0
+    elif search == SEARCH_MCTS:
+        tree = MCTS.find_subtree(last_tree, player_rnd) if isinstance(last_tree, NodeStore) else None
+        visits_before = int(tree.visit_count[0]) if tree is not None else 0
+    else:
+        raise ValueError('Unknown search: {}'.format(search))
+
+    start_time = time.time()
+    valid_cards = np.flatnonzero(player_rnd.get_valid_cards())
+    nr_simulations = 0
+    while True:
+        slice_budget = budget
+        if early_stopping is not None:
+            max_iterations = early_stopping.check_interval
+            if budget.max_iterations is not None:
+                max_iterations = min(max_iterations, budget.max_iterations - nr_simulations)
+            slice_budget = SearchBudget(budget.deadline, max_iterations, budget.check_interval)
+
+        if search == SEARCH_ISMCTS:
+            tree = ISMCTS.search(player_rnd, slice_budget, ucb_c, tree, max_nodes, solver_threshold, _table, recycle)
+            nr_simulations = tree.root.visit_count - visits_before
+            visit_counts = ISMCTS.get_visit_counts(tree)
+            reward_sums = ISMCTS.get_reward_sums(tree)
+        else:
+            tree = MCTS.monte_carlo_tree_search(player_rnd, slice_budget, ucb_c, tree, max_nodes, solver_threshold,
+                                                _table, rollouts_per_child, recycle)
+            nr_simulations = int(tree.visit_count[0]) - visits_before
+            visit_counts = tree.get_child_visit_counts(0)
+            reward_sums = tree.get_child_win_counts(0).astype(np.float64)
+
+        if early_stopping is None:
+            break
+        if budget.max_iterations is not None and nr_simulations >= budget.max_iterations:
+            break
+        if budget.deadline is not None and budget.remaining_seconds <= 0:
+            break
+        remaining = EarlyStopping.remaining_iterations(budget, nr_simulations, time.time() - start_time)
+        if early_stopping.is_decided(valid_cards, visit_counts, reward_sums, remaining):
+            break
+
+    if reuse_tree:
+        _last_tree = tree
+        _last_search_id = search_id
+    tree_nbytes = tree.peak_nbytes if search == SEARCH_ISMCTS else tree.nbytes
+    return visit_counts, reward_sums, nr_simulations, tree_nbytes
+
+
+class MCTSParallel:
+    """
+    Root parallel MCTS using processes: each worker process runs an independent search (on its own sample of the
+    hands of the other players for MCTS, or its own sequence of samples for ISMCTS) and the visit counts of the
+    cards at the root are summed over all the searches. As the searches run in separate processes, they are not
+    serialized by the GIL.
+
+    The searches run until the budget is exhausted. If no budget is given, a deadline run_time_seconds after the
+    start of run is used. Besides the best card, the results contain statistics about the confidence in it: the
+    mean reward and its standard error for each card, and the share of the visits of the best card.
+
+    With early_stopping, each worker ends its search as soon as the rule decides on the statistics of its own root
+    (see EarlyStopping), and the search ends when all the workers have stopped. The time that remained until the
+    deadline of the budget is reported as saved_seconds.
+
+    The trees of the workers have at most max_nodes nodes each. When a tree is full, it is no longer expanded or,
+    if recycle is set, its least visited subtrees are removed. The sum of the peak memory of the trees of the
+    workers is reported as tree_nbytes.
+
+    The searches are run on the executor if one is given (so that the processes can be reused), otherwise a
+    process pool is created for the search and shut down afterwards. Trees can only be reused between searches
+    on the same executor, each worker process continues with the tree of its last search of a previous run.
+    """
+
+    def __init__(self, player_rnd: PlayerRound, processes: int = None, run_time_seconds: float = 9,
+                 ucb_c: float = 1, executor: Executor = None, reuse_tree: bool = False, max_nodes: int = None,
+                 search: str = SEARCH_MCTS, budget: SearchBudget = None, solver_threshold: int = 0,
+                 rollouts_per_child: int = 1, early_stopping: EarlyStopping = None, recycle: bool = False):
+        self.player_rnd = player_rnd
+        self.processes = processes if processes is not None else os.cpu_count()
+        self.run_time_seconds = run_time_seconds
+        self.ucb_c = ucb_c
+        self.executor = executor
+        self.reuse_tree = reuse_tree
+        self.max_nodes = max_nodes
+        self.search = search
+        self.budget = budget
+        self.solver_threshold = solver_threshold
+        self.rollouts_per_child = rollouts_per_child
+        self.early_stopping = early_stopping
+        self.recycle = recycle
+
+        # results of the search
+        self.best_card = None
+        self.visit_counts = np.zeros(36, dtype=np.int64)
+        self.reward_sums = np.zeros(36, dtype=np.float64)
+        self.simulated_rounds = 0
+        self.simulations_per_second = 0.0
+        self.saved_seconds = 0.0
+        self.tree_nbytes = 0
+        self._logger = logging.getLogger(__name__)
+
+    def run(self) -> int:
+        """
+        Run the searches and return the card with the highest number of visits over all the searches.
+
+        Returns:
+            the best card
+        """
+        seeds = np.random.randint(0, 2 ** 31, size=self.processes)
+        start_time = time.time()
+        budget = self.budget if self.budget is not None else SearchBudget(start_time + self.run_time_seconds)
+        if self.executor is not None:
+            results = self._run_searches(self.executor, budget, seeds)
+        else:
+            with self._create_executor() as executor:
+                results = self._run_searches(executor, budget, seeds)
+        elapsed_time = time.time() - start_time
+        if budget.deadline is not None:
+            self.saved_seconds = max(budget.remaining_seconds, 0.0)
+
+        for visit_counts, reward_sums, simulated_rounds, tree_nbytes in results:
+            self.visit_counts += visit_counts
+            self.reward_sums += reward_sums
+            self.simulated_rounds += simulated_rounds
+            self.tree_nbytes += tree_nbytes
+        self.simulations_per_second = self.simulated_rounds / elapsed_time
+
+        self.best_card = int(np.argmax(self.visit_counts))
+        self._logger.debug('winner from all processes: {} with visit_count {} after {} simulations '
+                           '({:.0f} per second)'.format(self.best_card, self.visit_counts[self.best_card],
+                                                        self.simulated_rounds, self.simulations_per_second))
+        return self.best_card
+
+    @property
+    def mean_rewards(self) -> np.ndarray:
+        """
+        The mean reward of each card at the root (0 for cards that were not visited).
+        """
+        return self.reward_sums / np.maximum(self.visit_counts, 1)
+
+    @property
+    def standard_errors(self) -> np.ndarray:
+        """
+        The standard error of the mean reward of each card. As the rewards are between 0 and 1, the variance is at
+        most m * (1 - m) for a mean reward m, which is used as estimate. The error is 1 for cards that were not
+        visited.
+        """
+        means = np.clip(self.mean_rewards, 0.0, 1.0)
+        return np.where(self.visit_counts > 0,
+                        np.sqrt(means * (1 - means) / np.maximum(self.visit_counts, 1)), 1.0)
+
+    @property
+    def confidence(self) -> float:
+        """
+        The share of the visits at the root that went to the best card.
+        """
+        total_visits = np.sum(self.visit_counts)
+        return self.visit_counts[self.best_card] / total_visits if total_visits > 0 else 0.0
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self.processes)
+
+    def _run_searches(self, executor: Executor, budget: SearchBudget, seeds: np.ndarray) -> list:
+        search_id = uuid.uuid4().hex
+        futures = [executor.submit(search_root, self.player_rnd, budget, self.ucb_c, int(seed),
+                                   self.reuse_tree, self.max_nodes, self.search, self.solver_threshold,
+                                   self.rollouts_per_child, self.early_stopping, self.recycle, search_id)
+                   for seed in seeds]
+        return [future.result() for future in futures]
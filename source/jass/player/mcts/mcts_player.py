@@ -2,24 +2,113 @@ from jass.base.const import *
 from jass.base.player_round import PlayerRound
 from jass.player.player import Player
 from jass.base.rule_schieber import RuleSchieber
-from jass.player.mcts.mcts_threaded import MCTSThreaded
+from jass.player.mcts.early_stopping import EarlyStopping
+from jass.player.mcts.mcts_worker_pool import MCTSWorkerPool
+from jass.player.mcts.mcts_parallel import SEARCH_ISMCTS
+from jass.player.mcts.trump_selection import TrumpSelection
+from jass.player.search_budget import SearchBudget
 import logging
 
 
 class MCTSPlayer(Player):
     """
     Implementation of a player to play Jass using Monte Carlo Tree Search.
+
+    The search runs root parallel on a pool of worker processes, that is started with the first search and kept
+    for the following moves. A pool can also be shared between several players, in which case it must be shut down
+    by its owner, otherwise the player shuts its pool down in close.
+
+    If reuse_tree is set, the workers continue the search in the trees of the previous move of the round. This
+    should only be used if the pool is not shared with other players. The trees have at most max_nodes nodes each,
+    when a tree is full its least visited subtrees are removed (or, if recycle is not set, the tree is no longer
+    expanded). The peak memory of the trees is logged for every move.
+
+    The search is information set MCTS by default (see mcts_parallel for the available searches).
+
+    The budget of a move is run_time_seconds (and at most max_iterations iterations per worker, if given), unless
+    a budget is passed with play_card_with_budget.
+
+    When at most solver_threshold cards remain in a simulation, its result is calculated exactly by the double dummy
+    solver instead of by random play. For MCTS, the children of an expanded node can be evaluated by a batch of
+    rollouts_per_child random rollouts each, which trades the depth of the tree for less overhead per rollout.
+
+    If stop_early is set, the search of a move ends early when the best card is settled by the rule
+    early_stopping (by default EarlyStopping with its default parameters). Moves with a single valid card are
+    played without a search. The time saved on the budgets of the moves is summed in saved_seconds.
+
+    If tree_parallel is set, the workers search one shared tree instead (see MCTSTreeParallel), which requires
+    the search SEARCH_MCTS.
+
+    The trump is selected by Monte Carlo evaluation of sampled deals for trump_run_time_seconds, with trump_rollouts
+    random rollouts for each deal and trump.
     """
 
-    def __init__(self, ucb_c=1, threads=10):
+    def __init__(self, ucb_c=1, processes=None, pool: MCTSWorkerPool = None,
+                 run_time_seconds=9, max_iterations=None, early_stopping: EarlyStopping = None, stop_early=True,
+                 search=SEARCH_ISMCTS, tree_parallel=False, solver_threshold=8, rollouts_per_child=1,
+                 reuse_tree=True, max_nodes=50000, recycle=True,
+                 trump_run_time_seconds=1.0, trump_rollouts=16):
+        """
+        Initialize the player, the arguments are grouped by the settings they belong to.
+
+        Args:
+            ucb_c: exploration constant of UCB
+
+            processes: the number of worker processes, if the player creates its own pool
+            pool: a pool shared with other players, or None to create a pool for the player
+
+            run_time_seconds: the time budget of a move
+            max_iterations: the maximal number of iterations per worker of a move, or None
+            early_stopping: the rule to end a search early, EarlyStopping() if None
+            stop_early: false to always use the full budget of a move
+
+            search: the search algorithm (see mcts_parallel)
+            tree_parallel: true to search one shared tree (only for SEARCH_MCTS)
+            solver_threshold: maximal number of remaining cards for which the double dummy solver is used
+            rollouts_per_child: the number of random rollouts of each child of an expanded node (for MCTS)
+
+            reuse_tree: true to continue with the trees of the previous move
+            max_nodes: maximal number of nodes of the tree of each worker
+            recycle: true to remove the least visited subtrees when a tree is full
+
+            trump_run_time_seconds: the time budget of the trump selection
+            trump_rollouts: the number of random rollouts for each deal and trump in the trump selection
+        """
         self._logger = logging.getLogger(__name__)
         self._rule = RuleSchieber()
         self.ucb_c = ucb_c
-        self.threads = threads
+
+        # worker pool
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else MCTSWorkerPool(processes)
+
+        # budget of a move
+        self.run_time_seconds = run_time_seconds
+        self.max_iterations = max_iterations
+        self.early_stopping = None
+        if stop_early:
+            self.early_stopping = early_stopping if early_stopping is not None else EarlyStopping()
+        self.saved_seconds = 0.0
+
+        # search
+        self.search = search
+        self.tree_parallel = tree_parallel
+        self.solver_threshold = solver_threshold
+        self.rollouts_per_child = rollouts_per_child
+
+        # trees of the workers
+        self.reuse_tree = reuse_tree
+        self.max_nodes = max_nodes
+        self.recycle = recycle
+
+        # trump selection
+        self.trump_run_time_seconds = trump_run_time_seconds
+        self.trump_rollouts = trump_rollouts
 
     def select_trump(self, rnd: PlayerRound) -> int:
         """
-        Player chooses a trump based on the given round information.
+        Player chooses a trump based on the given round information, by playing out sampled deals for every trump
+        for trump_run_time_seconds (see TrumpSelection).
 
         Args:
             rnd: current round
@@ -27,92 +116,11 @@ class MCTSPlayer(Player):
         Returns:
             selected trump
         """
-
-        # select the trump with best score according to jass experience
-        high_cards = []
-
-        for i in range(4):
-            for j in range(i * 9, i * 9 + 5):
-                high_cards.append(j)
-
-        best_trump = 0
-        max_points_in_trump = 0
-        max_score_in_trump = 0
-
-        for trump in trump_ints:
-            score_in_trump = 0
-
-            if trump < OBE_ABE:
-                cards_of_this_color = convert_one_hot_encoded_cards_to_int_encoded_list(np.split(rnd.hand, 4)[trump])
-                cards_of_other_colors = [card for card in convert_one_hot_encoded_cards_to_int_encoded_list(rnd.hand) if card not in convert_one_hot_encoded_cards_to_int_encoded_list(rnd.hand * color_masks[trump])]
-
-                has_bauer = J_offset in cards_of_this_color
-                has_ass = A_offset in cards_of_this_color
-                has_naell = Nine_offset in cards_of_this_color
-
-                if has_bauer and len(cards_of_this_color) >= 4:
-                    temp_score_in_trump = 50 + len(cards_of_this_color) - 4
-                    print(f"bauer und andere karten der farbe with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-                elif has_ass and has_naell and len(cards_of_this_color) >= 5:
-                    temp_score_in_trump = 50 + len(cards_of_this_color) - 5
-                    print(f"ass und näll und andere karten der farbe with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-                elif has_ass and has_naell and has_bauer:
-                    temp_score_in_trump = 50 + len(cards_of_this_color) - 3
-                    print(f"ass und näll und bauer with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-                elif has_bauer and has_naell and len(cards_of_this_color) >= 3 and rnd.hand[DA] + rnd.hand[HA] + rnd.hand[SA] + rnd.hand[CA] >= 2:
-                    temp_score_in_trump = 40 + len(cards_of_this_color) - 3 + rnd.hand[DA] + rnd.hand[HA] + rnd.hand[SA] + rnd.hand[CA] - 2
-                    print(f"bauer und näll und andere karten der farbe und andere asse with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-                elif has_bauer and has_naell and len(cards_of_this_color) >= 3 and len([i for i in cards_of_other_colors if i in high_cards]) >= 4:
-                    temp_score_in_trump = 40 + len(cards_of_this_color) - 3 + len([i for i in cards_of_other_colors if i in high_cards]) - 4
-                    print(f"bauer und näll und andere karten der farbe und andere gute karten with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-                else:
-                    points_in_trump = (rnd.hand * card_values[trump]).sum()
-                    if points_in_trump > max_points_in_trump:
-                        max_points_in_trump = points_in_trump
-                        best_trump = trump
-            elif trump == OBE_ABE:
-                high_cards_i_have = [i for i in high_cards if
-                                     i in convert_one_hot_encoded_cards_to_int_encoded_list(rnd.hand)]
-
-                if len(high_cards_i_have) > 5:
-                    temp_score_in_trump = 50 + len(high_cards_i_have) - 6
-                    print(f"hohe karten with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-            else:
-                low_cards = []
-                for i in range(0, 4):
-                    for j in range(i * 9 + 4, i * 9 + 9):
-                        low_cards.append(j)
-
-                low_cards_i_have = [i for i in low_cards if
-                                    i in convert_one_hot_encoded_cards_to_int_encoded_list(rnd.hand)]
-
-                if len(low_cards_i_have) > 5:
-                    temp_score_in_trump = 50 + len(low_cards_i_have) - 6
-                    print(f"tiefe karten with score {temp_score_in_trump}")
-                    if temp_score_in_trump > score_in_trump:
-                        score_in_trump = temp_score_in_trump
-
-            if score_in_trump > max_score_in_trump:
-                max_score_in_trump = score_in_trump
-                best_trump = trump
-        if max_score_in_trump == 0 and rnd.forehand is None:
-            best_trump = PUSH
-            print(f"Pushed trump selection to other player "
-                  f"with {max_points_in_trump} points in the cards for the best trump")
-        else:
-            print(f"Selected trump {trump_strings_german_long[best_trump]} with score {max_score_in_trump} and {max_points_in_trump} points in the cards. hand: {rnd.hand}")
+        values, nr_deals = TrumpSelection.evaluate(rnd, SearchBudget.from_time(self.trump_run_time_seconds),
+                                                   self.trump_rollouts)
+        best_trump = max(values, key=lambda action: values[action])
+        self._logger.debug('selected trump {} with mean point difference {:.1f} after {} deals'.format(
+            best_trump, values[best_trump], nr_deals))
         return best_trump
 
     def play_card(self, player_rnd: PlayerRound) -> int:
@@ -125,13 +133,40 @@ class MCTSPlayer(Player):
         Returns:
             card to play, int encoded
         """
-        #best_card = MCTS.monte_carlo_tree_search(player_rnd)
-        valid_cards = np.flatnonzero(player_rnd.get_valid_cards())
-        print(f"valid cards: {valid_cards}, standard probability: {1/len(valid_cards)}")
-        if len(valid_cards) == 1:
-            return valid_cards[0]
+        return self.play_card_with_budget(player_rnd,
+                                          SearchBudget.from_time(self.run_time_seconds, self.max_iterations))
+
+    def play_card_with_budget(self, player_rnd: PlayerRound, budget: SearchBudget) -> int:
+        """
+        Player returns a card to play, searching until the budget is exhausted.
 
-        mcts_threaded = MCTSThreaded(player_rnd, self.threads, self.ucb_c)
-        best_card = mcts_threaded.run()
+        Args:
+            player_rnd: current round
+            budget: the budget of the search
 
-        return best_card
+        Returns:
+            card to play, int encoded
+        """
+        valid_cards = np.flatnonzero(player_rnd.get_valid_cards())
+        if len(valid_cards) == 1:
+            if budget.deadline is not None:
+                self.saved_seconds += max(budget.remaining_seconds, 0.0)
+            return int(valid_cards[0])
+
+        mcts = self._pool.search(player_rnd, budget, self.ucb_c, self.reuse_tree, self.max_nodes, self.search,
+                                 self.solver_threshold, self.rollouts_per_child, self.tree_parallel,
+                                 early_stopping=self.early_stopping, recycle=self.recycle)
+        self._logger.debug('best card {} with mean reward {:.3f} +- {:.3f} and {:.0%} of the visits, '
+                           '{:.2f}s of the budget saved, {:.1f} MB peak tree memory'.format(
+                               mcts.best_card, mcts.mean_rewards[mcts.best_card],
+                               mcts.standard_errors[mcts.best_card], mcts.confidence, mcts.saved_seconds,
+                               mcts.tree_nbytes / 2 ** 20))
+        self.saved_seconds += mcts.saved_seconds
+        return mcts.best_card
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, if it is owned by the player.
+        """
+        if self._owns_pool:
+            self._pool.shutdown()
@@ -0,0 +1,160 @@
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import Lock
+
+import numpy as np
+
+from jass.base.player_round import PlayerRound
+from jass.base.round import Round
+from jass.player.double_dummy_solver import DoubleDummySolver
+from jass.player.mcts.mcts import MCTS
+from jass.player.mcts.mcts_parallel import MCTSParallel, SEARCH_MCTS
+from jass.player.mcts.node_store import NO_NODE
+from jass.player.mcts.sampler import Sampler
+from jass.player.mcts.shared_node_store import SharedNodeStore, start_resource_tracker
+from jass.player.search_budget import SearchBudget
+from jass.player.transposition_table import TranspositionTable
+
+# default capacity of the shared tree, if no maximal number of nodes is given
+_DEFAULT_CAPACITY = 200000
+
+# lock of the worker process for the expansion of the shared tree, set by init_tree_worker
+_lock = None
+
+# the transposition table of the worker process for the solver
+_table = None  # type: TranspositionTable
+
+
+def init_tree_worker(lock) -> None:
+    """
+    Initialize a worker process for tree parallel searches with the lock shared by all the workers. A lock can
+    only be passed to a process when it is started, so this must be called by the initializer of the executor.
+    """
+    global _lock
+    _lock = lock
+
+
+def search_shared_tree(name: str, capacity: int, world: Round, budget: SearchBudget, ucb_c: float, seed: int,
+                       virtual_loss: int = 1, solver_threshold: int = 0) -> int:
+    """
+    Run the search of a worker process on the shared tree, until the budget is exhausted.
+
+    Every iteration selects a path by UCB and adds virtual_loss visits without a win to its nodes, so that the
+    other workers see them as worse and prefer other paths. The leaf is expanded and each of its children is
+    simulated once, as in MCTS. The back propagation then replaces the virtual loss by the results of the
+    simulations.
+
+    The selection with the expansion and the back propagation are done under the lock of the workers, so that no
+    updates of the statistics are lost. The simulations, which take most of the time of an iteration, are run
+    outside of the lock.
+
+    Args:
+        name: the name of the shared memory of the tree
+        capacity: the capacity of the tree
+        world: the sampled world of the search
+        budget: the budget of the search, the iterations (simulations) are counted per worker and the budget is
+        checked before each expansion, so it can be exceeded by the simulations of one expansion
+        ucb_c: exploration constant of UCB
+        seed: seed for the random generators of the worker
+        virtual_loss: the number of visits added to the nodes of a path during the iteration
+        solver_threshold: maximal number of remaining cards for which the simulations are replaced by the double
+        dummy solver, 0 to always use random simulations
+
+    Returns:
+        the number of simulations of the worker
+    """
+    global _table
+    np.random.seed(seed)
+    random.seed(seed)
+    solver = None
+    if solver_threshold > 0:
+        if _table is None:
+            _table = TranspositionTable()
+        solver = DoubleDummySolver(world.trump, _table)
+
+    tree = SharedNodeStore.attach(name, capacity)
+    try:
+        nr_simulations = 0
+        while not budget.is_exhausted(nr_simulations):
+            rnd = world.clone()
+            first = NO_NODE
+            with _lock:
+                node = 0
+                path = [node]
+                while tree.nr_childs[node] != 0:
+                    node = tree.select_child_ucb(node, ucb_c)
+                    path.append(node)
+                tree.visit_count[path] += virtual_loss
+                for node in path[1:]:
+                    rnd.action_play_card(int(tree.card[node]))
+                if rnd.nr_played_cards < 36:
+                    valid_cards = np.flatnonzero(rnd.get_valid_cards())
+                    if tree.nr_nodes + len(valid_cards) <= capacity:
+                        first = tree.add_childs(node, valid_cards, rnd.player)
+
+            if first != NO_NODE:
+                childs = np.arange(first, first + len(valid_cards))
+                winning_teams = np.array([MCTS._simulate_round(rnd, card, solver, solver_threshold)
+                                          for card in valid_cards])
+            elif rnd.nr_played_cards == 36:
+                childs = None
+                winning_teams = np.array([MCTS._get_winning_team(rnd.points_team_0, rnd.points_team_1)])
+            else:
+                # the tree is full, simulate from the leaf without adding nodes
+                childs = None
+                winning_teams = np.array([MCTS._simulate_round(rnd, np.random.choice(valid_cards), solver,
+                                                               solver_threshold)])
+
+            nr_results = len(winning_teams)
+            nr_wins_team_0 = int(np.sum(winning_teams == 0))
+            with _lock:
+                tree.visit_count[path] -= virtual_loss
+                tree.back_propagate_results(path, nr_results, nr_wins_team_0)
+                if childs is not None:
+                    tree.back_propagate_results(childs, 1, (winning_teams == 0).astype(np.int32))
+            nr_simulations += nr_results
+    finally:
+        tree.close()
+    return nr_simulations
+
+
+class MCTSTreeParallel(MCTSParallel):
+    """
+    Tree parallel MCTS using processes: all the worker processes search the same tree, which is stored in shared
+    memory (see SharedNodeStore), on the same sampled world. Virtual loss during the selection makes the workers
+    descend into different parts of the tree. The best card is the one with the most visits at the root.
+
+    As only one world is sampled, this is the tree parallel version of MCTS (SEARCH_MCTS), the trees can not be
+    reused between searches. The capacity of the tree is max_nodes, when it is full the leaves are no longer
+    expanded.
+
+    The workers must have been initialized with init_tree_worker, which is done by the executor created by the
+    search if none is given (and by MCTSWorkerPool).
+    """
+
+    def __init__(self, player_rnd: PlayerRound, processes: int = None, run_time_seconds: float = 9,
+                 ucb_c: float = 1, executor: Executor = None, max_nodes: int = None, budget: SearchBudget = None,
+                 solver_threshold: int = 0, virtual_loss: int = 1):
+        super().__init__(player_rnd, processes, run_time_seconds, ucb_c, executor, max_nodes=max_nodes,
+                         search=SEARCH_MCTS, budget=budget, solver_threshold=solver_threshold)
+        self.virtual_loss = virtual_loss
+
+    def _create_executor(self) -> Executor:
+        start_resource_tracker()
+        return ProcessPoolExecutor(max_workers=self.processes, initializer=init_tree_worker, initargs=(Lock(),))
+
+    def _run_searches(self, executor: Executor, budget: SearchBudget, seeds: np.ndarray) -> list:
+        capacity = self.max_nodes if self.max_nodes is not None else _DEFAULT_CAPACITY
+        world = Sampler.sample(self.player_rnd)
+        tree = SharedNodeStore.create(capacity)
+        try:
+            tree.add_root(self.player_rnd.player)
+            futures = [executor.submit(search_shared_tree, tree.name, capacity, world, budget, self.ucb_c,
+                                       int(seed), self.virtual_loss, self.solver_threshold)
+                       for seed in seeds]
+            nr_simulations = sum(future.result() for future in futures)
+            return [(tree.get_child_visit_counts(0), tree.get_child_win_counts(0).astype(np.float64),
+                     nr_simulations, tree.nbytes)]
+        finally:
+            tree.close()
+            tree.unlink()
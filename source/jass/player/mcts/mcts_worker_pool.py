@@ -0,0 +1,142 @@
+import logging
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Lock
+
+from jass.base.player_round import PlayerRound
+from jass.player.mcts.early_stopping import EarlyStopping
+from jass.player.mcts.mcts_parallel import MCTSParallel, SEARCH_MCTS
+from jass.player.mcts.mcts_tree_parallel import MCTSTreeParallel
+from jass.player.mcts.shared_node_store import start_resource_tracker
+from jass.player.search_budget import SearchBudget
+
+
+def _init_worker(lock) -> None:
+    """
+    Initialize a worker process when it is started. The modules with the precomputed tables are imported and the
+    rule objects created, so that this is done once per process and not for every search. Interrupts are ignored
+    in the workers, the pool is shut down by the main process. The lock of the pool is used for the tree parallel
+    searches.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    import jass.base.const
+    import jass.base.rule_factory
+    import jass.player.mcts.mcts
+    import jass.player.mcts.ismcts
+    import jass.player.mcts.mcts_tree_parallel
+    import jass.player.double_dummy_solver
+    from jass.base.const import JASS_SCHIEBER_1000
+    jass.base.rule_factory.get_rule(JASS_SCHIEBER_1000)
+    jass.player.mcts.mcts_tree_parallel.init_tree_worker(lock)
+
+
+def _ping() -> int:
+    """
+    Empty job, used to start all the worker processes.
+    """
+    return os.getpid()
+
+
+class MCTSWorkerPool:
+    """
+    Long lived pool of worker processes for the root parallel MCTS (see MCTSParallel) and the tree parallel MCTS
+    (see MCTSTreeParallel). The processes are started once (by start or the first search) and are then used for all
+    the searches, so that the cost of creating the processes and initializing the modules is not paid on every move.
+
+    A search job consists of the player round (which is pickled to be sent to the workers) and the budget.
+    The pool must be shut down with shutdown (or by using it as context manager), which waits for running jobs
+    and stops the processes. The pool can be shared by several threads (for example the request threads of the
+    player service), start and shutdown are synchronized so that only one set of processes is created.
+    """
+
+    def __init__(self, processes: int = None):
+        self.processes = processes if processes is not None else os.cpu_count()
+        self._executor = None  # type: ProcessPoolExecutor
+        # lock for starting and stopping the executor
+        self._executor_lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """
+        Start the worker processes, if they are not running yet.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                return
+            start_resource_tracker()
+            executor = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker,
+                                           initargs=(Lock(),))
+            # the executor starts processes on demand, so submit one job per process to start all of them
+            pids = set(future.result() for future in [executor.submit(_ping) for _ in range(self.processes)])
+            self._executor = executor
+            self._logger.debug('Started MCTS worker pool with {} processes'.format(len(pids)))
+
+    def search(self, player_rnd: PlayerRound, budget: SearchBudget, ucb_c: float = 1,
+               reuse_tree: bool = False, max_nodes: int = None, search: str = SEARCH_MCTS,
+               solver_threshold: int = 0, rollouts_per_child: int = 1, tree_parallel: bool = False,
+               virtual_loss: int = 1, early_stopping: EarlyStopping = None, recycle: bool = False) -> MCTSParallel:
+        """
+        Run a root parallel search (or a tree parallel search, if tree_parallel is set) on all the processes of the
+        pool.
+
+        Args:
+            player_rnd: the round from the view of the player to move
+            budget: the budget of the search, the iterations are counted per worker
+            ucb_c: exploration constant of UCB
+            reuse_tree: true if the workers should continue with the trees of their previous searches
+            max_nodes: maximal number of nodes of the tree in each worker
+            search: the search algorithm (see mcts_parallel)
+            solver_threshold: maximal number of remaining cards for which the double dummy solver is used instead
+            of random simulations
+            rollouts_per_child: the number of random rollouts of each child of an expanded node (for MCTS)
+            tree_parallel: true for a tree parallel search, which is only available for MCTS and does not reuse
+            trees or use rollouts_per_child
+            virtual_loss: the virtual loss of the tree parallel search
+            early_stopping: the rule to end the search before the budget is exhausted (only used by the root
+            parallel search), or None to use the full budget
+            recycle: true if the least visited subtrees of the trees of the workers should be removed when a tree
+            reaches max_nodes (only used by the root parallel search)
+
+        Returns:
+            the search object after the run, containing the best card, the visit counts and the number of
+            simulations
+        """
+        self.start()
+        if tree_parallel:
+            if search != SEARCH_MCTS:
+                raise ValueError('Tree parallel search is only available for MCTS, not for: {}'.format(search))
+            mcts = MCTSTreeParallel(player_rnd, processes=self.processes, ucb_c=ucb_c, executor=self._executor,
+                                    max_nodes=max_nodes, budget=budget, solver_threshold=solver_threshold,
+                                    virtual_loss=virtual_loss)
+            mcts.run()
+            return mcts
+        mcts = MCTSParallel(player_rnd, processes=self.processes, ucb_c=ucb_c, executor=self._executor,
+                            reuse_tree=reuse_tree, max_nodes=max_nodes, search=search, budget=budget,
+                            solver_threshold=solver_threshold, rollouts_per_child=rollouts_per_child,
+                            early_stopping=early_stopping, recycle=recycle)
+        mcts.run()
+        return mcts
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running searches to complete and stop the worker processes. The pool can be started again
+        afterwards.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._logger.debug('Stopped MCTS worker pool')
+
+    def __enter__(self) -> 'MCTSWorkerPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
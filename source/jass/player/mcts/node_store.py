@@ -0,0 +1,264 @@
+import numpy as np
+
+from jass.base.round import Round
+
+# value of the index arrays for no node
+NO_NODE = -1
+
+# the arrays of the store with their initial values
+_ARRAYS = [('parent', NO_NODE), ('first_child', NO_NODE), ('nr_childs', 0), ('card', NO_NODE), ('player', NO_NODE),
+           ('visit_count', 0), ('win_count', 0)]
+
+
+class NodeStore:
+    """
+    Tree of the MCTS stored as struct of arrays: every node is an index into preallocated numpy arrays that hold
+    its parent, its first child, its number of children, the card played to reach it, the player who played that
+    card (the player to move for the root) and the visit and win counts. The children of a node are always added
+    together, so they occupy a contiguous range of indices starting at the first child, and the statistics of all
+    children can be accessed as array slices.
+
+    The arrays grow geometrically when the capacity is reached, they never shrink (so nbytes is also the peak
+    memory of the store). To keep the tree within a number of nodes, the subtrees of the least visited nodes can
+    be removed by recycle. The root of the tree is the node 0 and only the (sampled) round of the root is stored,
+    the rounds of the other nodes are obtained by playing the cards on the path from the root.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = capacity
+        self.nr_nodes = 0
+        self.parent = np.full(capacity, NO_NODE, dtype=np.int32)
+        self.first_child = np.full(capacity, NO_NODE, dtype=np.int32)
+        self.nr_childs = np.zeros(capacity, dtype=np.int8)
+        self.card = np.full(capacity, NO_NODE, dtype=np.int8)
+        self.player = np.full(capacity, NO_NODE, dtype=np.int8)
+        self.visit_count = np.zeros(capacity, dtype=np.int32)
+        self.win_count = np.zeros(capacity, dtype=np.int32)
+        # the round at the root node
+        self.round = None  # type: Round
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the arrays of the store.
+        """
+        return self.parent.nbytes + self.first_child.nbytes + self.nr_childs.nbytes + self.card.nbytes + \
+            self.player.nbytes + self.visit_count.nbytes + self.win_count.nbytes
+
+    def add_root(self, player: int) -> int:
+        """
+        Add the root node to the empty store.
+
+        Args:
+            player: the player of the root node
+
+        Returns:
+            the index of the root, which is 0
+        """
+        assert self.nr_nodes == 0
+        self.nr_nodes = 1
+        self.player[0] = player
+        return 0
+
+    def add_childs(self, node: int, cards: np.ndarray, player: int) -> int:
+        """
+        Add the children for the given cards to a node without children.
+
+        Args:
+            node: the index of the node
+            cards: the cards of the children
+            player: the player of the children
+
+        Returns:
+            the index of the first child
+        """
+        nr_childs = len(cards)
+        first = self.nr_nodes
+        if first + nr_childs > self.capacity:
+            self._grow(first + nr_childs)
+        last = first + nr_childs
+        self.parent[first:last] = node
+        self.card[first:last] = cards
+        self.player[first:last] = player
+        self.first_child[node] = first
+        self.nr_childs[node] = nr_childs
+        self.nr_nodes = last
+        return first
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = self.capacity
+        while capacity < min_capacity:
+            capacity *= 2
+        for name, fill_value in _ARRAYS:
+            old = getattr(self, name)
+            new = np.full(capacity, fill_value, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def recycle(self, nr_nodes: int) -> int:
+        """
+        Free at least nr_nodes nodes (if the tree has enough nodes besides the root and its children) by removing
+        the children of the least visited nodes. These nodes keep their statistics and become leaves, that are
+        expanded again when they are selected. The remaining nodes are compacted to the front of the arrays, so
+        their indices change.
+
+        As a node has at least as many visits as each of its children, removing the children of all the nodes with
+        less than a threshold of visits removes all the nodes whose parent has less visits than the threshold.
+
+        Args:
+            nr_nodes: the number of nodes to free
+
+        Returns:
+            the number of nodes removed
+        """
+        nr_nodes_before = self.nr_nodes
+        nr_nodes = min(nr_nodes, nr_nodes_before - 1)
+        if nr_nodes <= 0:
+            return 0
+        parent_visits = self.visit_count[self.parent[1:nr_nodes_before]]
+        threshold = np.partition(parent_visits, nr_nodes - 1)[nr_nodes - 1] + 1
+        collapse = self.visit_count[:nr_nodes_before] < threshold
+        collapse[0] = False
+        self.first_child[:nr_nodes_before][collapse] = NO_NODE
+        self.nr_childs[:nr_nodes_before][collapse] = 0
+
+        store = self.extract_subtree(0, self.round)
+        for name, fill_value in _ARRAYS:
+            array = getattr(self, name)
+            array[:store.nr_nodes] = getattr(store, name)[:store.nr_nodes]
+            array[store.nr_nodes:nr_nodes_before] = fill_value
+        self.nr_nodes = store.nr_nodes
+        return nr_nodes_before - self.nr_nodes
+
+    def select_child_ucb(self, node: int, ucb_c: float) -> int:
+        """
+        Select the child of a node with the highest UCB value, children that have not been visited are selected
+        first.
+
+        Args:
+            node: the index of the node, which must have children
+            ucb_c: exploration constant of UCB
+
+        Returns:
+            the index of the selected child
+        """
+        first = self.first_child[node]
+        last = first + self.nr_childs[node]
+        visits = self.visit_count[first:last]
+        if not np.all(visits):
+            return first + int(np.argmin(visits))
+        scores = self.win_count[first:last] / visits + \
+            ucb_c * np.sqrt(np.log(self.visit_count[node]) / visits)
+        return first + int(np.argmax(scores))
+
+    def back_propagate(self, path: np.ndarray or list, winning_team: int) -> None:
+        """
+        Update the statistics of the nodes on a path after a simulation. The simulation is counted as won for the
+        nodes whose player is in the winning team.
+
+        Args:
+            path: the indices of the nodes from the root to the simulated node
+            winning_team: the team that won the simulation
+        """
+        self.visit_count[path] += 1
+        self.win_count[path] += self.player[path] % 2 == winning_team
+
+    def back_propagate_results(self, nodes: np.ndarray or list, nr_simulations: np.ndarray or int,
+                               nr_wins_team_0: np.ndarray or int) -> None:
+        """
+        Update the statistics of nodes after a number of simulations each, for example after a batch of rollouts.
+
+        Args:
+            nodes: the indices of the nodes
+            nr_simulations: the number of simulations of each node (or one number for all nodes)
+            nr_wins_team_0: the number of simulations of each node won by team 0 (or one number for all nodes)
+        """
+        self.visit_count[nodes] += nr_simulations
+        self.win_count[nodes] += np.where(self.player[nodes] % 2 == 0, nr_wins_team_0,
+                                          nr_simulations - nr_wins_team_0)
+
+    def find_child(self, node: int, card: int) -> int:
+        """
+        Find the child of a node for the given card.
+
+        Returns:
+            the index of the child or NO_NODE if the node has no child for the card
+        """
+        first = self.first_child[node]
+        if first == NO_NODE:
+            return NO_NODE
+        index = np.flatnonzero(self.card[first:first + self.nr_childs[node]] == card)
+        return first + int(index[0]) if len(index) > 0 else NO_NODE
+
+    def get_child_visit_counts(self, node: int) -> np.ndarray:
+        """
+        Get the visit counts of the children of a node by card.
+
+        Returns:
+            array of size 36 with the visit count of the child for each card
+        """
+        visit_counts = np.zeros(36, dtype=np.int64)
+        first = self.first_child[node]
+        if first != NO_NODE:
+            last = first + self.nr_childs[node]
+            visit_counts[self.card[first:last]] = self.visit_count[first:last]
+        return visit_counts
+
+    def get_child_win_counts(self, node: int) -> np.ndarray:
+        """
+        Get the win counts of the children of a node by card.
+
+        Returns:
+            array of size 36 with the win count of the child for each card
+        """
+        win_counts = np.zeros(36, dtype=np.int64)
+        first = self.first_child[node]
+        if first != NO_NODE:
+            last = first + self.nr_childs[node]
+            win_counts[self.card[first:last]] = self.win_count[first:last]
+        return win_counts
+
+    def extract_subtree(self, node: int, rnd: Round) -> 'NodeStore':
+        """
+        Copy the subtree of a node into a new store, in which the node is the root.
+
+        Args:
+            node: the index of the node
+            rnd: the round at the node
+
+        Returns:
+            the new store
+        """
+        # collect the nodes breadth first, so that the children of every node remain contiguous
+        old_indices = [np.array([node], dtype=np.int32)]
+        level = old_indices[0]
+        while len(level) > 0:
+            has_childs = self.first_child[level] != NO_NODE
+            firsts = self.first_child[level][has_childs]
+            counts = self.nr_childs[level][has_childs].astype(np.int32)
+            if len(firsts) == 0:
+                break
+            # indices of all the children of the level, in order of their parents
+            level = np.repeat(firsts - np.cumsum(counts) + counts, counts) + np.arange(np.sum(counts))
+            old_indices.append(level.astype(np.int32))
+        old_indices = np.concatenate(old_indices)
+
+        nr_nodes = len(old_indices)
+        store = NodeStore(capacity=max(nr_nodes, 1024))
+        new_index = np.full(self.nr_nodes, NO_NODE, dtype=np.int32)
+        new_index[old_indices] = np.arange(nr_nodes, dtype=np.int32)
+
+        parents = self.parent[old_indices]
+        parents[0] = NO_NODE
+        store.parent[:nr_nodes] = np.where(parents == NO_NODE, NO_NODE, new_index[parents])
+        first_childs = self.first_child[old_indices]
+        store.first_child[:nr_nodes] = np.where(first_childs == NO_NODE, NO_NODE, new_index[first_childs])
+        store.nr_childs[:nr_nodes] = self.nr_childs[old_indices]
+        store.card[:nr_nodes] = self.card[old_indices]
+        store.player[:nr_nodes] = self.player[old_indices]
+        store.visit_count[:nr_nodes] = self.visit_count[old_indices]
+        store.win_count[:nr_nodes] = self.win_count[old_indices]
+        store.nr_nodes = nr_nodes
+        store.round = rnd
+        return store
@@ -0,0 +1,199 @@
+import random
+
+import numpy as np
+
+from jass.base.bitboard import card_bits, cards_to_bits, bits_to_int_list, color_masks_bits, higher_trump_bits, \
+    lower_trump_bits
+from jass.base.const import card_values, color_of_card, next_player, trick_card_strength, J_offset
+from jass.base.round import Round
+from jass.base.rule_schieber_bitboard import RuleSchieberBitboard
+
+# python list versions of the tables (indexing lists with python ints is faster than indexing numpy arrays)
+_color_of_card = color_of_card.tolist()
+_card_values = card_values.tolist()
+_trick_card_strength = trick_card_strength.tolist()
+
+_get_valid_cards_bits = RuleSchieberBitboard().get_valid_cards_bits
+
+# numpy versions of the bitboard tables for rollout_batch, the trump masks are 0 for obe and une
+_card_bits_array = np.array(card_bits, dtype=np.int64)
+_color_masks_array = np.array(color_masks_bits, dtype=np.int64)
+_trump_masks_array = np.array(color_masks_bits + [0, 0], dtype=np.int64)
+_trump_jack_bits_array = np.array([card_bits[trump * 9 + J_offset] for trump in range(4)] + [0, 0], dtype=np.int64)
+_higher_trump_bits_array = np.array(higher_trump_bits, dtype=np.int64)
+_lower_trump_bits_array = np.array(lower_trump_bits, dtype=np.int64)
+_card_shifts = np.arange(36, dtype=np.int64)
+_next_player_array = np.array(next_player, dtype=np.int64)
+
+
+def rollout(rnd: Round) -> (int, int):
+    """
+    Play a round of Schieber to the end with random valid cards and return the points of the teams.
+
+    The remaining cards are played on bitboards of the hands and a list for the current trick, so no objects are
+    created for the cards played, and the round itself is not changed. The random numbers are drawn from the
+    module random.
+
+    Args:
+        rnd: the round, in which the trump has been declared
+
+    Returns:
+        the points of team 0 and team 1 at the end of the round
+    """
+    points = [rnd.points_team_0, rnd.points_team_1]
+    nr_tricks = rnd.nr_tricks
+    if nr_tricks == 9:
+        return points[0], points[1]
+
+    trump = rnd.trump
+    values = _card_values[trump]
+    strength_by_color = _trick_card_strength[trump]
+    hands = [cards_to_bits(hand) for hand in rnd.hands]
+    trick = rnd.current_trick.tolist()
+    nr_cards_in_trick = rnd.nr_cards_in_trick
+    player = rnd.player
+    first_player = int(rnd.trick_first_player[nr_tricks]) if nr_cards_in_trick > 0 else player
+    rand = random.random
+
+    while True:
+        valid_cards = bits_to_int_list(_get_valid_cards_bits(hands[player], trick, nr_cards_in_trick, trump))
+        card = valid_cards[int(rand() * len(valid_cards))]
+        hands[player] ^= card_bits[card]
+        trick[nr_cards_in_trick] = card
+
+        if nr_cards_in_trick < 3:
+            nr_cards_in_trick += 1
+            player = next_player[player]
+            continue
+
+        # end of the trick, the winner is the player of the strongest card (see RuleSchieber.calc_winner)
+        strength = strength_by_color[_color_of_card[trick[0]]]
+        winner = 0
+        highest_strength = strength[trick[0]]
+        for i in range(1, 4):
+            if strength[trick[i]] > highest_strength:
+                highest_strength = strength[trick[i]]
+                winner = i
+        winner = (first_player - winner) % 4
+        nr_tricks += 1
+        points[winner % 2] += values[trick[0]] + values[trick[1]] + values[trick[2]] + values[trick[3]] + \
+            (5 if nr_tricks == 9 else 0)
+        if nr_tricks == 9:
+            return points[0], points[1]
+        nr_cards_in_trick = 0
+        player = first_player = winner
+
+
+def rollout_batch(rounds: [Round], nr_rollouts: int) -> (np.ndarray, np.ndarray):
+    """
+    Play a number of random rollouts of each of the rounds at once, with numpy operations on the bitboards of all
+    the rollouts, so that the overhead of the python code is paid once per card for all rollouts instead of once
+    per card of every rollout. The rollouts are played in lockstep, so the rounds must have the same number of
+    played cards, for example the rounds of the children of a node. The random numbers are drawn from np.random.
+
+    The valid cards are calculated as in RuleSchieberBitboard.get_valid_cards_bits and the winner of the tricks as
+    in RuleSchieber.calc_winner, the rounds are not changed.
+
+    Args:
+        rounds: the rounds, in which the trump has been declared
+        nr_rollouts: the number of rollouts of each round
+
+    Returns:
+        the points of team 0 and team 1 at the end of the rollouts as arrays of shape [len(rounds), nr_rollouts]
+    """
+    nr_played_cards = rounds[0].nr_played_cards
+    if any(rnd.nr_played_cards != nr_played_cards for rnd in rounds):
+        raise ValueError('All rounds of a batch rollout must have the same number of played cards')
+
+    # the rollouts of the same round are consecutive
+    def repeat(values) -> np.ndarray:
+        return np.repeat(np.array(values, dtype=np.int64), nr_rollouts, axis=0)
+
+    points = repeat([[rnd.points_team_0, rnd.points_team_1] for rnd in rounds])
+    nr_tricks = rounds[0].nr_tricks
+    if nr_tricks == 9:
+        return points[:, 0].reshape(len(rounds), nr_rollouts), points[:, 1].reshape(len(rounds), nr_rollouts)
+
+    nr_cards_in_trick = rounds[0].nr_cards_in_trick
+    trump = repeat([rnd.trump for rnd in rounds])
+    hands = repeat([[cards_to_bits(hand) for hand in rnd.hands] for rnd in rounds])
+    trick = repeat([rnd.current_trick for rnd in rounds])
+    player = repeat([rnd.player for rnd in rounds])
+    first_player = repeat([rnd.trick_first_player[nr_tricks] if nr_cards_in_trick > 0 else rnd.player
+                           for rnd in rounds])
+    nr_batch = len(player)
+    index = np.arange(nr_batch)
+
+    while True:
+        valid = _get_valid_cards_bits_batch(hands[index, player], trick, nr_cards_in_trick, trump)
+
+        # random valid card, with equal probability for each valid card
+        valid_cards = (valid[:, None] >> _card_shifts) & 1
+        card = np.argmax(np.random.random_sample((nr_batch, 36)) * valid_cards, axis=1)
+        hands[index, player] ^= _card_bits_array[card]
+        trick[:, nr_cards_in_trick] = card
+
+        if nr_cards_in_trick < 3:
+            nr_cards_in_trick += 1
+            player = _next_player_array[player]
+            continue
+
+        # end of the trick, the winner is the player of the strongest card (see RuleSchieber.calc_winner)
+        color_led = color_of_card[trick[:, 0]]
+        winner = np.argmax(trick_card_strength[trump[:, None], color_led[:, None], trick], axis=1)
+        winner = (first_player - winner) % 4
+        nr_tricks += 1
+        trick_points = np.sum(card_values[trump[:, None], trick], axis=1) + (5 if nr_tricks == 9 else 0)
+        points[index, winner % 2] += trick_points
+        if nr_tricks == 9:
+            return points[:, 0].reshape(len(rounds), nr_rollouts), points[:, 1].reshape(len(rounds), nr_rollouts)
+        nr_cards_in_trick = 0
+        player = first_player = winner
+
+
+def _get_valid_cards_bits_batch(hand: np.ndarray, trick: np.ndarray, nr_cards_in_trick: int,
+                                trump: np.ndarray) -> np.ndarray:
+    """
+    Get the valid cards for a number of positions with the same number of cards in the trick, as bitboards (see
+    RuleSchieberBitboard.get_valid_cards_bits, of which this is the version for numpy arrays).
+
+    Args:
+        hand: [N] bitboards of the hands of the players to move
+        trick: [N,4] the cards of the current tricks
+        nr_cards_in_trick: the number of cards in the current tricks
+        trump: [N] the trumps
+
+    Returns:
+        [N] bitboards of the valid cards
+    """
+    if nr_cards_in_trick == 0:
+        return hand
+    color_played = color_of_card[trick[:, 0]]
+    color_cards = hand & _color_masks_array[color_played]
+    trump_cards = hand & _trump_masks_array[trump]
+    has_color = color_cards != 0
+
+    # trump was played first: must give trump, unless we have none or just the trump jack
+    valid_trump_first = np.where((trump_cards == 0) | (trump_cards == _trump_jack_bits_array[trump]),
+                                 hand, trump_cards)
+
+    # the lowest trump played by player 1 or player 2 (as in RuleSchieber the one with the highest index)
+    lowest_trump_played = np.full(len(hand), -1, dtype=np.int64)
+    for i in range(1, min(nr_cards_in_trick, 3)):
+        is_lower_trump = (color_of_card[trick[:, i]] == trump) & (trick[:, i] > lowest_trump_played)
+        lowest_trump_played = np.where(is_lower_trump, trick[:, i], lowest_trump_played)
+    trump_played = lowest_trump_played >= 0
+    lowest_trump_played = np.maximum(lowest_trump_played, 0)
+
+    # nobody played a trump: must give a color or can give any trump
+    valid_no_trump_played = np.where(has_color, color_cards | trump_cards, hand)
+
+    # somebody played a trump: must give a color or a higher trump, or anything except a lower trump if we do not
+    # have the color, unless we have only trumps left
+    valid_trump_played = np.where(has_color,
+                                  color_cards | (trump_cards & _higher_trump_bits_array[lowest_trump_played]),
+                                  hand & ~(trump_cards & _lower_trump_bits_array[lowest_trump_played]))
+    valid_trump_played = np.where(trump_cards == hand, hand, valid_trump_played)
+
+    return np.where(color_played == trump, valid_trump_first,
+                    np.where(trump_played, valid_trump_played, valid_no_trump_played))
@@ -1,33 +1,171 @@
-from jass.base.const import *
-from jass.base.player_round_cheating import PlayerRound
-from jass.base.player_round_cheating import PlayerRoundCheating
+import numpy as np
+
+from jass.base.const import color_masks, color_of_card, J_offset
+from jass.base.player_round import PlayerRound
+from jass.base.round import Round
 from jass.base.round_factory import get_round_from_player_round
-import random
+
+# maximal number of times the samples that could not be completed are sampled again
+_MAX_ATTEMPTS = 100
 
 
 class Sampler:
+    """
+    Sample the hidden cards of the other players consistently with the information of a player round: the cards
+    that are neither in the own hand nor played are distributed so that every player gets the number of cards he
+    still holds, and no player gets a card of a color he is known to be void of (because he did not follow the
+    color of a trick).
+
+    The samples are generated for many deals at once, the cards are assigned one after the other (the most
+    constrained first) to the players allowed to hold them, with a probability proportional to the number of cards
+    the players still need. Without known voids, this gives a uniform distribution over all the deals.
+    """
+
+    @staticmethod
+    def sample(rnd: PlayerRound) -> Round:
+        """
+        Sample one deal of the hidden cards.
+
+        Args:
+            rnd: the round from the view of the player to move
+
+        Returns:
+            a round with all the information of the player round and the sampled hands
+        """
+        return get_round_from_player_round(rnd, Sampler.sample_hands(rnd, 1)[0])
+
     @staticmethod
-    def sample(rnd: PlayerRound) -> PlayerRoundCheating:
-        sampled_cards = np.ones(36, int)
-        np.ma.masked_where(rnd.hand == 1, sampled_cards).filled(0)
-        hands = np.zeros(shape=[4, 36], dtype=np.int)
+    def sample_hands(rnd: PlayerRound, nr_samples: int) -> np.ndarray:
+        """
+        Sample a number of deals of the hidden cards. The random numbers are drawn from np.random.
+
+        Args:
+            rnd: the round from the view of the player to move
+            nr_samples: the number of deals to sample
 
-        # give the own player the correct hand and the other players sampled hands
-        for i in range(0, 4):
-            if i == rnd.player:
-                hands[i] = rnd.hand
-            else:
-                new_hands, sampled_cards = Sampler.__get_hands(sampled_cards)
-                hands[i] = new_hands
+        Returns:
+            the hands of all players of every deal as array of shape [nr_samples, 4, 36], the hand of the player
+            of the round is the same in every deal
+        """
+        allowed = Sampler.get_allowed_cards(rnd)
+        nr_cards = Sampler.get_nr_cards(rnd)
+        others = np.array([p for p in range(4) if p != rnd.player])
+        hidden_cards = np.flatnonzero(np.any(allowed[others], axis=0))
 
-        return get_round_from_player_round(rnd, hands)
+        hands = np.zeros((nr_samples, 4, 36), dtype=np.int32)
+        hands[:, rnd.player, :] = rnd.hand
+        if len(hidden_cards) == 0:
+            return hands
+
+        # assign the cards that can be held by the fewest players first
+        allowed_hidden = allowed[others][:, hidden_cards].astype(bool)
+        order = np.argsort(np.sum(allowed_hidden, axis=0), kind='stable')
+        hidden_cards = hidden_cards[order]
+        allowed_hidden = allowed_hidden[:, order]
+
+        remaining = np.arange(nr_samples)
+        for _ in range(_MAX_ATTEMPTS):
+            owners, ok = Sampler._assign_cards(allowed_hidden, nr_cards[others], len(remaining))
+            done = remaining[ok]
+            hands[done[:, None], others[owners[ok]], hidden_cards[None, :]] = 1
+            remaining = remaining[~ok]
+            if len(remaining) == 0:
+                return hands
+        raise ValueError('No consistent deal of the hidden cards found')
 
     @staticmethod
-    def __get_hands(sampled_cards: np.array):
-        one_hand = np.zeros(shape=36, dtype=int)
-        for i in range(0, 9):
-            card = random.choice(np.flatnonzero(sampled_cards))
-            sampled_cards[card] = 0
-            one_hand[card] = 1
-
-        return one_hand, sampled_cards
+    def _assign_cards(allowed: np.ndarray, nr_cards: np.ndarray, nr_samples: int) -> (np.ndarray, np.ndarray):
+        """
+        Assign the cards to the players for a number of samples.
+
+        Args:
+            allowed: boolean array of shape [nr_players, nr_cards] of the cards each player may hold
+            nr_cards: the number of cards each player must get
+            nr_samples: the number of samples
+
+        Returns:
+            the index of the player of each card as array of shape [nr_samples, nr_cards] and a boolean array
+            that is true for the samples in which all players got the correct number of cards
+        """
+        nr_players, nr_hidden = allowed.shape
+        capacity = np.tile(nr_cards, (nr_samples, 1))
+        # number of the cards not assigned yet that each player may hold
+        nr_allowed = np.sum(allowed, axis=1)
+        owners = np.zeros((nr_samples, nr_hidden), dtype=np.int64)
+        ok = np.ones(nr_samples, dtype=bool)
+        rows = np.arange(nr_samples)
+        for i in range(nr_hidden):
+            # players that need all the remaining cards they may hold must get the card
+            forced = (capacity >= nr_allowed) & allowed[:, i]
+            weights = np.where(np.any(forced, axis=1, keepdims=True), forced, allowed[:, i] * capacity)
+            cumulative = np.cumsum(weights, axis=1)
+            total = cumulative[:, -1]
+            ok &= total > 0
+            r = np.random.random(nr_samples) * total
+            owner = np.minimum(np.sum(cumulative <= r[:, None], axis=1), nr_players - 1)
+            owners[:, i] = owner
+            capacity[rows, owner] -= 1
+            nr_allowed -= allowed[:, i]
+        ok &= np.all(capacity == 0, axis=1)
+        return owners, ok
+
+    @staticmethod
+    def get_nr_cards(rnd: PlayerRound) -> np.ndarray:
+        """
+        Get the number of cards each player holds.
+
+        Returns:
+            array of size 4 with the number of cards in the hands of the players
+        """
+        nr_cards = np.full(4, 9 - rnd.nr_tricks, dtype=np.int32)
+        # players that already played in the current trick hold one card less
+        if rnd.nr_cards_in_trick > 0:
+            first_player = rnd.trick_first_player[rnd.nr_tricks]
+            nr_cards[(first_player - np.arange(rnd.nr_cards_in_trick)) % 4] -= 1
+        return nr_cards
+
+    @staticmethod
+    def get_voids(rnd: PlayerRound) -> np.ndarray:
+        """
+        Get the colors the players are known to be void of: a player that did not follow the color of a trick
+        has no more cards of that color, except that he may still hold the trump jack if trump was played, and
+        that playing a trump is always allowed.
+
+        Returns:
+            boolean array of shape [4, 4] which is true if the player (first index) has no cards of the color
+        """
+        voids = np.zeros((4, 4), dtype=bool)
+        if rnd.nr_played_cards == 0:
+            return voids
+        moves = np.arange(rnd.nr_played_cards)
+        tricks = moves // 4
+        positions = moves % 4
+        players = (rnd.trick_first_player[tricks] - positions) % 4
+        colors = color_of_card[rnd.tricks[tricks, positions]]
+        colors_led = color_of_card[rnd.tricks[tricks, 0]]
+        not_followed = colors != colors_led
+        if rnd.trump is not None and 0 <= rnd.trump < 4:
+            not_followed &= colors != rnd.trump
+        voids[players[not_followed], colors_led[not_followed]] = True
+        return voids
+
+    @staticmethod
+    def get_allowed_cards(rnd: PlayerRound) -> np.ndarray:
+        """
+        Get the cards each player may hold: for the player of the round these are the cards of his hand, for the
+        other players the cards that are neither in that hand nor played, and not of a color the player is void of.
+
+        Returns:
+            one hot encoded array of shape [4, 36] of the cards each player may hold
+        """
+        hidden = np.ones(36, dtype=np.int32)
+        hidden[rnd.hand == 1] = 0
+        hidden[rnd.tricks[rnd.tricks >= 0]] = 0
+
+        voids = Sampler.get_voids(rnd)
+        allowed = hidden[None, :] * (1 - np.dot(voids.astype(np.int32), color_masks))
+        if rnd.trump is not None and 0 <= rnd.trump < 4:
+            trump_jack = rnd.trump * 9 + J_offset
+            allowed[:, trump_jack] = hidden[trump_jack]
+        allowed[rnd.player] = rnd.hand
+        return allowed
@@ -0,0 +1,119 @@
+import multiprocessing
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+from jass.player.mcts.node_store import NodeStore, NO_NODE
+
+# the arrays of the store in the shared memory block, with their types and initial values
+_ARRAYS = [('parent', np.int32, NO_NODE), ('first_child', np.int32, NO_NODE), ('nr_childs', np.int8, 0),
+           ('card', np.int8, NO_NODE), ('player', np.int8, NO_NODE), ('visit_count', np.int32, 0),
+           ('win_count', np.int32, 0)]
+
+# the number of nodes is stored in front of the arrays
+_HEADER_SIZE = 8
+
+
+def _get_offsets(capacity: int) -> (list, int):
+    # the arrays start at multiples of 8 bytes
+    offsets = []
+    offset = _HEADER_SIZE
+    for _, dtype, _ in _ARRAYS:
+        offsets.append(offset)
+        offset += (capacity * np.dtype(dtype).itemsize + 7) // 8 * 8
+    return offsets, offset
+
+
+def start_resource_tracker() -> None:
+    """
+    Start the resource tracker of the shared memory in this process, if it is not running yet. This must be called
+    before worker processes are forked, so that they use the same tracker instead of starting their own ones,
+    which would try to free the blocks of the stores again when the workers exit.
+    """
+    resource_tracker.ensure_running()
+
+
+class SharedNodeStore(NodeStore):
+    """
+    NodeStore with the arrays in a block of shared memory, so that the tree can be searched by several processes
+    at the same time (see mcts_tree_parallel). The store is created by one process and attached by the others
+    by the name of the block.
+
+    Worker processes that attach to the store must be started after start_resource_tracker has been called.
+
+    The capacity is fixed, as the block can not grow. The number of nodes is kept in the shared memory as well.
+    The processes must synchronize all the changes of the tree, both of its structure (add_childs) and of the
+    statistics, as the read-modify-write of the arrays is not atomic.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int) -> None:
+        # the arrays of the base class are replaced by views into the shared memory, so its __init__ is not called
+        self._shm = shm
+        self.capacity = capacity
+        self.round = None
+        self._header = np.ndarray(1, dtype=np.int64, buffer=shm.buf, offset=0)
+        offsets, _ = _get_offsets(capacity)
+        for (name, dtype, _), offset in zip(_ARRAYS, offsets):
+            setattr(self, name, np.ndarray(capacity, dtype=dtype, buffer=shm.buf, offset=offset))
+
+    @staticmethod
+    def create(capacity: int) -> 'SharedNodeStore':
+        """
+        Create a new empty store in a new block of shared memory.
+        """
+        _, size = _get_offsets(capacity)
+        store = SharedNodeStore(shared_memory.SharedMemory(create=True, size=size), capacity)
+        store.nr_nodes = 0
+        for name, _, fill_value in _ARRAYS:
+            getattr(store, name)[:] = fill_value
+        return store
+
+    @staticmethod
+    def attach(name: str, capacity: int) -> 'SharedNodeStore':
+        """
+        Attach to the store created in another process.
+
+        Args:
+            name: the name of the shared memory block of the store
+            capacity: the capacity of the store
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        if multiprocessing.get_start_method() != 'fork':
+            # the block is unlinked by the process that created it, so a process with its own resource tracker
+            # must not track it (forked processes share the tracker of the creating process)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return SharedNodeStore(shm, capacity)
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory block.
+        """
+        return self._shm.name
+
+    @property
+    def nr_nodes(self) -> int:
+        return int(self._header[0])
+
+    @nr_nodes.setter
+    def nr_nodes(self, value: int) -> None:
+        self._header[0] = value
+
+    def _grow(self, min_capacity: int) -> None:
+        raise ValueError('The shared node store is full: {} nodes'.format(self.capacity))
+
+    def close(self) -> None:
+        """
+        Release the arrays and close the access to the shared memory, the store can not be used afterwards.
+        """
+        self._header = None
+        for name, _, _ in _ARRAYS:
+            setattr(self, name, None)
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory, which must be done by the process that created the store once all processes
+        have closed it.
+        """
+        self._shm.unlink()
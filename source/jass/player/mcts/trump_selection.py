@@ -0,0 +1,85 @@
+import numpy as np
+
+from jass.base.const import MAX_TRUMP, PUSH, card_values, next_player, partner_player
+from jass.base.player_round import PlayerRound
+from jass.base.round_factory import get_round
+from jass.player.mcts.rollout import rollout_batch
+from jass.player.mcts.sampler import Sampler
+from jass.player.search_budget import SearchBudget
+
+
+class TrumpSelection:
+    """
+    Monte Carlo selection of the trump: deals of the hidden cards are sampled (see Sampler) and the round is played
+    out for every deal and every trump by a batch of random rollouts (see rollout_batch). The value of a trump is
+    the mean difference between the points of the own team and the points of the other team, the trump (or push)
+    with the highest value is selected.
+
+    The value of pushing is estimated from the same deals, with the partner selecting the trump in which the cards
+    of the partner's hand have the most points. The choice only depends on the partner's hand: choosing the best
+    trump for the whole deal would assume that the partner knows all the cards, and pushing would look at least as
+    good as the best own trump.
+    """
+
+    @staticmethod
+    def evaluate(rnd: PlayerRound, budget: SearchBudget, nr_rollouts: int = 16,
+                 nr_deals_per_batch: int = 16) -> (dict, int):
+        """
+        Calculate the values of the trump actions of the player to move, until the budget is exhausted.
+
+        Args:
+            rnd: the round from the view of the player who selects the trump
+            budget: the budget of the evaluation, an iteration of the budget is one deal
+            nr_rollouts: the number of random rollouts for every deal and trump
+            nr_deals_per_batch: the number of deals that are played out together
+
+        Returns:
+            dict of the mean point difference by action (the trumps and PUSH, if pushing is allowed) and the
+            number of deals
+        """
+        nr_trumps = MAX_TRUMP + 1
+        team = rnd.player % 2
+        # the first card is always played by the player after the dealer, also when trump is pushed
+        first_player = next_player[rnd.dealer]
+        partner = partner_player[rnd.player]
+
+        difference_sums = np.zeros(nr_trumps, dtype=np.float64)
+        push_sum = 0.0
+        nr_deals = 0
+        while not budget.is_exhausted(nr_deals):
+            rounds = []
+            deals = Sampler.sample_hands(rnd, nr_deals_per_batch)
+            for hands in deals:
+                for trump in range(nr_trumps):
+                    deal_round = get_round(rnd.jass_type, rnd.dealer)
+                    deal_round.set_hands(hands)
+                    deal_round.trump = trump
+                    deal_round.forehand = rnd.forehand is None
+                    deal_round.declared_trump = rnd.player
+                    deal_round.player = first_player
+                    deal_round.trick_first_player[0] = first_player
+                    rounds.append(deal_round)
+            points_team_0, points_team_1 = rollout_batch(rounds, nr_rollouts)
+            differences = points_team_0 - points_team_1 if team == 0 else points_team_1 - points_team_0
+            differences = differences.reshape(nr_deals_per_batch, nr_trumps, nr_rollouts)
+
+            difference_sums += np.sum(np.mean(differences, axis=2), axis=0)
+            partner_trumps = np.argmax(np.dot(deals[:, partner, :], card_values.T), axis=1)
+            push_sum += np.sum(np.mean(differences[np.arange(nr_deals_per_batch), partner_trumps, :], axis=1))
+            nr_deals += nr_deals_per_batch
+
+        values = {trump: difference_sums[trump] / nr_deals for trump in range(nr_trumps)}
+        if rnd.forehand is None:
+            values[PUSH] = push_sum / nr_deals
+        return values, nr_deals
+
+    @staticmethod
+    def select_trump(rnd: PlayerRound, budget: SearchBudget, nr_rollouts: int = 16) -> int:
+        """
+        Select the trump action with the highest value (see evaluate).
+
+        Returns:
+            the trump or PUSH
+        """
+        values, _ = TrumpSelection.evaluate(rnd, budget, nr_rollouts)
+        return max(values, key=lambda action: values[action])
@@ -1,4 +1,5 @@
 from jass.base.player_round import PlayerRound
+from jass.player.search_budget import SearchBudget
 
 
 class Player:
@@ -27,3 +28,25 @@ class Player:
             card to play, int encoded as defined in jass.base.const
         """
         raise NotImplementedError()
+
+    def play_card_with_budget(self, rnd: PlayerRound, budget: SearchBudget) -> int:
+        """
+        Player returns a card to play within the given budget, for example the time left for the move when playing
+        on a server. Players that search should override this method to respect the budget, the default
+        implementation ignores the budget and calls play_card.
+
+        Args:
+            rnd: current round
+            budget: the budget for the search of the card
+
+        Returns:
+            card to play, int encoded as defined in jass.base.const
+        """
+        return self.play_card(rnd)
+
+    def close(self) -> None:
+        """
+        Release the resources held by the player, like worker processes. Called when the player is no longer used,
+        for example when the arena or the player service is shut down. The default implementation does nothing.
+        """
+        pass
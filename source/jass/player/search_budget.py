@@ -0,0 +1,56 @@
+import time
+
+
+class SearchBudget:
+    """
+    Budget of an anytime search, given as an absolute deadline (in seconds since the epoch, as returned by
+    time.time), as a maximal number of iterations or both. The search ends as soon as one of the limits is reached.
+
+    The budget does not keep any state, the search passes the number of iterations done so far to is_exhausted.
+    The clock is only read every check_interval iterations, so the search can overrun the deadline by at most
+    that number of iterations. As the deadline is absolute, the same budget can be sent to several worker
+    processes.
+    """
+
+    def __init__(self, deadline: float = None, max_iterations: int = None, check_interval: int = 1):
+        if deadline is None and max_iterations is None:
+            raise ValueError('A search budget needs a deadline or a maximal number of iterations')
+        self.deadline = deadline
+        self.max_iterations = max_iterations
+        self.check_interval = check_interval
+
+    @staticmethod
+    def from_time(seconds: float, max_iterations: int = None, check_interval: int = 1) -> 'SearchBudget':
+        """
+        Create a budget with a deadline the given number of seconds from now.
+        """
+        return SearchBudget(time.time() + seconds, max_iterations, check_interval)
+
+    @property
+    def remaining_seconds(self) -> float or None:
+        """
+        The time until the deadline (negative if it has passed), or None if there is no deadline.
+        """
+        return self.deadline - time.time() if self.deadline is not None else None
+
+    def is_exhausted(self, nr_iterations: int) -> bool:
+        """
+        Check if the search must stop. At least one iteration is always allowed, so that the search has a result.
+
+        Args:
+            nr_iterations: the number of iterations done so far
+
+        Returns:
+            True if the search must stop
+        """
+        if nr_iterations == 0:
+            return False
+        if self.max_iterations is not None and nr_iterations >= self.max_iterations:
+            return True
+        if self.deadline is not None and nr_iterations % self.check_interval == 0:
+            return time.time() >= self.deadline
+        return False
+
+    def __repr__(self):
+        return 'SearchBudget(deadline={}, max_iterations={}, check_interval={})'.format(
+            self.deadline, self.max_iterations, self.check_interval)
@@ -0,0 +1,94 @@
+class TranspositionTable:
+    """
+    Transposition table of fixed size for the zobrist keys of states (see jass.base.zobrist), that can be shared
+    by the searches and solvers of a process.
+
+    The table has a power of two number of buckets, the bucket of a key is given by its lowest bits. Every bucket
+    holds two entries:
+        - the first one is only replaced by an entry with at least the same priority (for example the number of
+          remaining cards, i.e. the effort that was needed to calculate it), or by an entry for the same key,
+        - the second one is always replaced.
+    An entry that is pushed out of the first slot moves to the second one. This keeps the expensive results of
+    states close to the root, while the recent results of the many states close to the leaves are still found.
+
+    The full key is stored with the entry, so different states that fall in the same bucket are told apart. The
+    table only stores values, their meaning is defined by the users, which must make sure to use different keys
+    for different kinds of values (for example by xoring a constant to the key).
+    """
+
+    def __init__(self, nr_buckets: int = 2**18):
+        if nr_buckets <= 0 or nr_buckets & (nr_buckets - 1) != 0:
+            raise ValueError('The number of buckets must be a power of two: {}'.format(nr_buckets))
+        self.nr_buckets = nr_buckets
+        self._mask = nr_buckets - 1
+        # entries at 2 * bucket (by priority) and 2 * bucket + 1 (always replaced)
+        self._keys = [None] * (2 * nr_buckets)
+        self._values = [None] * (2 * nr_buckets)
+        self._priorities = [0] * (2 * nr_buckets)
+        self.nr_lookups = 0
+        self.nr_hits = 0
+
+    def get(self, key: int):
+        """
+        Get the value stored for a key.
+
+        Returns:
+            the value or None if no value is stored for the key
+        """
+        self.nr_lookups += 1
+        index = (key & self._mask) << 1
+        keys = self._keys
+        if keys[index] == key:
+            self.nr_hits += 1
+            return self._values[index]
+        if keys[index + 1] == key:
+            self.nr_hits += 1
+            return self._values[index + 1]
+        return None
+
+    def put(self, key: int, value, priority: int = 0) -> None:
+        """
+        Store the value for a key, replacing a previous value for the same key.
+
+        Args:
+            key: the key of the state
+            value: the value to store
+            priority: the priority of the entry for the replacement
+        """
+        index = (key & self._mask) << 1
+        keys = self._keys
+        if keys[index] == key or priority >= self._priorities[index]:
+            if keys[index] != key and keys[index] is not None:
+                # move the replaced entry to the second slot
+                keys[index + 1] = keys[index]
+                self._values[index + 1] = self._values[index]
+            elif keys[index + 1] == key:
+                keys[index + 1] = None
+                self._values[index + 1] = None
+            keys[index] = key
+            self._values[index] = value
+            self._priorities[index] = priority
+        else:
+            keys[index + 1] = key
+            self._values[index + 1] = value
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the statistics.
+        """
+        size = 2 * self.nr_buckets
+        self._keys = [None] * size
+        self._values = [None] * size
+        self._priorities = [0] * size
+        self.nr_lookups = 0
+        self.nr_hits = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The share of the lookups that found a value.
+        """
+        return self.nr_hits / self.nr_lookups if self.nr_lookups > 0 else 0.0
+
+    def __len__(self) -> int:
+        return 2 * self.nr_buckets - self._keys.count(None)
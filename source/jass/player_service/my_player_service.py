@@ -5,12 +5,14 @@
 """
 Example how to use flask to create a service for one or more players
 """
+import atexit
 import logging
 
 from jass.player_service.player_service_app import PlayerServiceApp
 from jass.player.random_player_schieber import RandomPlayerSchieber
 from jass.player.stdin_player_schieber import StdinPlayerSchieber
 from jass.player.mcts.mcts_player import MCTSPlayer
+from jass.player.mcts.mcts_worker_pool import MCTSWorkerPool
 
 
 def create_app():
@@ -30,12 +32,17 @@ def create_app():
     # you could use a configuration file to load additional variables
     # app.config.from_pyfile('my_player_service.cfg', silent=False)
 
-    # add some players
-    app.add_player('DeAentlibuecherUCB14', MCTSPlayer(ucb_c=1.4))
-    app.add_player('DeAentlibuecher', MCTSPlayer())
-    app.add_player('DeAentlibuecherUCB75', MCTSPlayer(ucb_c=0.75))
-    app.add_player('DeAentlibuecher2T', MCTSPlayer(threads=2))
+    # add some players, the MCTS players share one pool of worker processes (one per core), so that they do not
+    # compete for the cores. As the workers serve several games at the same time, the trees are not reused.
+    pool = MCTSWorkerPool()
+    app.add_player('DeAentlibuecherUCB14', MCTSPlayer(ucb_c=1.4, pool=pool, reuse_tree=False))
+    app.add_player('DeAentlibuecher', MCTSPlayer(pool=pool, reuse_tree=False))
+    app.add_player('DeAentlibuecherUCB75', MCTSPlayer(ucb_c=0.75, pool=pool, reuse_tree=False))
     # app.add_player('stdin', StdinPlayerSchieber())
     app.add_player('random', RandomPlayerSchieber())
 
+    # stop the worker processes when the service exits
+    atexit.register(app.close_players)
+    atexit.register(pool.shutdown)
+
     return app
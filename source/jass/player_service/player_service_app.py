@@ -39,3 +39,10 @@ class PlayerServiceApp(Flask):
 
     def get_players(self):
         return [name for name in self.players.keys()]
+
+    def close_players(self):
+        """
+        Close all the players, for example to stop their worker processes when the service is shut down.
+        """
+        for player in self.players.values():
+            player.close()
@@ -16,6 +16,7 @@ from flask import request, jsonify, Blueprint, current_app
 
 from jass.base.const import card_strings
 from jass.ion.round_serializer import RoundSerializer
+from jass.player.search_budget import SearchBudget
 from jass.player_service.request_parser import PlayerRoundParser
 
 
@@ -24,13 +25,17 @@ SELECT_TRUMP_PATH_PREFIX = '/select_trump'
 PLAY_CARD_PATH_PREFIX = '/play_card'
 SEND_INFO_PREFIX = '/game_info'
 
+# optional query parameter of play_card with the time in seconds the player may use for the card
+TIME_BUDGET_PARAMETER = 'time_budget'
+
 players = Blueprint(JASS_PATH_PREFIX, __name__)
 
 
 @players.route('/<string:player_name>' + PLAY_CARD_PATH_PREFIX, methods=['POST'])
 def play_card(player_name: str):
     """
-    Takes a play_card request, validates its data and returns the card to play.
+    Takes a play_card request, validates its data and returns the card to play. If the request has the query
+    parameter time_budget, the player must choose the card within that many seconds.
     Args:
         player_name: the name of the desired player
     Returns:
@@ -40,6 +45,7 @@ def play_card(player_name: str):
         return jsonify(error='json data expected'), HTTPStatus.UNSUPPORTED_MEDIA_TYPE
 
     request_dict = request.get_json()
+    time_budget = request.args.get(TIME_BUDGET_PARAMETER, type=float)
     parser = PlayerRoundParser(request_dict)
     if parser.is_valid_request():
         player = current_app.get_player_for_name(player_name)
@@ -47,7 +53,10 @@ def play_card(player_name: str):
             return jsonify(error='player not found'), HTTPStatus.BAD_REQUEST
         try:
             rnd = parser.get_parsed_round()
-            card = player.play_card(rnd)
+            if time_budget is not None:
+                card = player.play_card_with_budget(rnd, SearchBudget.from_time(time_budget))
+            else:
+                card = player.play_card(rnd)
             # card is returned as string
             data = dict(card=card_strings[card])
             return jsonify(data), HTTPStatus.OK
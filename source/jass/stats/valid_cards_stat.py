@@ -10,6 +10,7 @@ Statistics about valid cards that can be played, that will show the number of va
 import numpy as np
 from jass.base.player_round import PlayerRound
 from jass.base.round import Round
+from jass.base.round_utils import calculate_positions_from_round
 
 
 class ValidCardsStat:
@@ -27,11 +28,11 @@ class ValidCardsStat:
         Args:
             rnd: complete round
         """
-        player_rnds = PlayerRound.all_from_complete_round(rnd)
-        for i, player_rnd in enumerate(player_rnds):
-            valid_cards = player_rnd.get_valid_cards()
-            self.valid_moves_sum[i] += np.sum(valid_cards)
-            self.nr_total_moves[i] += 1
+        hands, tricks, move_nr = calculate_positions_from_round(rnd)
+        trump = np.full(36, -1 if rnd.trump is None else rnd.trump)
+        valid_cards = rnd.rule.get_valid_cards_batch(hands, tricks, move_nr, trump)
+        self.valid_moves_sum += np.sum(valid_cards, axis=1)
+        self.nr_total_moves += 1
 
     def add_player_round(self, player_rnd: PlayerRound) -> None:
         valid_cards = player_rnd.get_valid_cards()
@@ -6,6 +6,16 @@ from source.jass.arena.play_game_nr_rounds_strategy import PlayNrRoundsStrategy
 from source.jass.player.random_player_schieber import RandomPlayerSchieber
 
 
+class BudgetRecordingPlayer(RandomPlayerSchieber):
+    def __init__(self):
+        super().__init__()
+        self.budgets = []
+
+    def play_card_with_budget(self, rnd, budget):
+        self.budgets.append(budget)
+        return self.play_card(rnd)
+
+
 class ArenaNrRoundsTestCase(unittest.TestCase):
 
     def test_arena(self):
@@ -24,6 +34,22 @@ class ArenaNrRoundsTestCase(unittest.TestCase):
         print(arena.nr_wins_team_1)
         print(arena.delta_points)
 
+    def test_arena_time_budget(self):
+        arena = Arena(jass_type=JASS_SCHIEBER_1000,
+                      trump_strategy=TrumpPlayerStrategy(),
+                      play_game_strategy=PlayNrRoundsStrategy(1),
+                      time_budget=0.5)
+        player = BudgetRecordingPlayer()
+
+        arena.set_players(player, player, player, player)
+        arena.nr_games_to_play = 1
+        arena.play_all_games()
+
+        self.assertEqual(36, len(player.budgets))
+        for budget in player.budgets:
+            self.assertIsNone(budget.max_iterations)
+            self.assertLessEqual(budget.remaining_seconds, 0.5)
+
 
 if __name__ == '__main__':
     unittest.main()
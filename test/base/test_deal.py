@@ -0,0 +1,40 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.deal import deal_hands, deal_owners, deal_seeds, owners_from_seeds, hands_from_owners
+from source.jass.base.round_factory import get_round
+
+
+class DealTestCase(unittest.TestCase):
+
+    def test_deal_hands(self):
+        hands, seeds = deal_hands(1000, 42)
+        self.assertEqual((1000, 4, 36), hands.shape)
+        self.assertEqual((1000,), seeds.shape)
+        # every card is dealt once and every player has 9 cards
+        self.assertTrue(np.all(np.sum(hands, axis=1) == 1))
+        self.assertTrue(np.all(np.sum(hands, axis=2) == 9))
+        # the deals are different
+        self.assertEqual(1000, len(np.unique(hands.reshape(1000, -1), axis=0)))
+
+    def test_reproducible(self):
+        owners, seeds = deal_owners(100, np.random.default_rng(1))
+        owners_again, seeds_again = deal_owners(100, np.random.default_rng(1))
+        self.assertTrue(np.all(seeds == seeds_again))
+        self.assertTrue(np.all(owners == owners_again))
+
+        # a single deal only depends on its seed
+        self.assertTrue(np.all(owners_from_seeds(seeds[17]) == owners[17]))
+        self.assertTrue(np.all(owners_from_seeds(seeds[50:60]) == owners[50:60]))
+        self.assertTrue(np.all(hands_from_owners(owners[3]) == hands_from_owners(owners)[3]))
+
+    def test_round_deal_from_seed(self):
+        seed = int(deal_seeds(1, 7)[0])
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards(seed=seed)
+        self.assertTrue(np.all(rnd.hands == hands_from_owners(owners_from_seeds(seed))))
+        self.assertTrue(np.all(rnd.color_counts == np.dot(rnd.hands, color_masks.T)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.round_batch import RoundBatch
+from source.jass.base.round_factory import get_round
+from source.jass.base.rule_hearts import RuleHearts
+from source.jass.base.rule_utils import validate_round
+
+
+class RoundBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def _create_rounds(self, jass_type: str, nr_rounds: int) -> list:
+        rounds = []
+        for _ in range(nr_rounds):
+            rnd = get_round(jass_type, dealer=np.random.randint(4))
+            rnd.deal_cards()
+            if jass_type != JASS_HEARTS:
+                rnd.action_trump(np.random.randint(MAX_TRUMP + 1))
+            rounds.append(rnd)
+        return rounds
+
+    def _compare_with_rounds(self, jass_type: str):
+        rounds = self._create_rounds(jass_type, 20)
+        batch = RoundBatch.from_rounds(rounds)
+        for _ in range(36):
+            valid_cards = batch.valid_cards()
+            for i, rnd in enumerate(rounds):
+                self.assertTrue(np.all(valid_cards[i] == rnd.get_valid_cards()))
+            cards = batch.random_valid_cards()
+            batch.play_cards(cards)
+            for i, rnd in enumerate(rounds):
+                rnd.action_play_card(cards[i])
+
+        self.assertIsNone(batch.current_trick)
+        for i, rnd in enumerate(rounds):
+            self.assertEqual(rnd.points_team_0, batch.points_team_0[i])
+            self.assertEqual(rnd.points_team_1, batch.points_team_1[i])
+            self.assertTrue(np.all(rnd.trick_winner == batch.trick_winner[i]))
+            self.assertTrue(np.all(rnd.trick_points == batch.trick_points[i]))
+            self.assertTrue(np.all(rnd.trick_first_player == batch.trick_first_player[i]))
+
+    def test_schieber(self):
+        self._compare_with_rounds(JASS_SCHIEBER_1000)
+
+    def test_hearts(self):
+        self._compare_with_rounds(JASS_HEARTS)
+
+    def test_from_rounds_during_play(self):
+        rounds = self._create_rounds(JASS_SCHIEBER_1000, 5)
+        for rnd in rounds:
+            for _ in range(13):
+                rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        batch = RoundBatch.from_rounds(rounds)
+        self.assertEqual(3, batch.nr_tricks)
+        self.assertEqual(1, batch.nr_cards_in_trick)
+        batch.play_random_until_end()
+        for i, rnd in enumerate(rounds):
+            validate_round(batch.get_round(i, rnd))
+            self.assertEqual(157, rnd.points_team_0 + rnd.points_team_1)
+
+        self.assertRaises(ValueError, RoundBatch.from_rounds, self._create_rounds(JASS_SCHIEBER_1000, 1) + rounds)
+
+    def test_deal_cards(self):
+        batch = RoundBatch(100, RuleHearts())
+        batch.deal_cards()
+        self.assertTrue(np.all(np.sum(batch.hands, axis=1) == 1))
+        self.assertTrue(np.all(np.sum(batch.hands, axis=2) == 9))
+
+        batch.set_trump(-1, NORTH)
+        batch.play_random_until_end()
+        self.assertTrue(np.all(batch.points_team_0 + batch.points_team_1 == -18))
+
+
+if __name__ == '__main__':
+    unittest.main()
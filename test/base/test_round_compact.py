@@ -0,0 +1,56 @@
+import copy
+import pickle
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.round_factory import get_round
+
+
+class RoundCompactTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def _play_both(self, jass_type: str, trump: int or None, nr_cards: int):
+        rnd = get_round(jass_type, dealer=EAST)
+        rnd_compact = get_round(jass_type, dealer=EAST, compact=True)
+        rnd.deal_cards()
+        rnd_compact.set_hands(rnd.hands)
+        if trump is not None:
+            rnd.action_trump(trump)
+            rnd_compact.action_trump(trump)
+        for _ in range(nr_cards):
+            card = np.random.choice(np.flatnonzero(rnd.get_valid_cards()))
+            self.assertTrue(np.all(rnd.get_valid_cards() == rnd_compact.get_valid_cards()))
+            rnd.action_play_card(card)
+            rnd_compact.action_play_card(card)
+        return rnd, rnd_compact
+
+    def test_same_as_round(self):
+        for trump in trump_ints:
+            rnd, rnd_compact = self._play_both(JASS_SCHIEBER_1000, trump, 36)
+            rnd_compact.assert_invariants()
+            self.assertEqual(rnd, rnd_compact)
+        rnd, rnd_compact = self._play_both(JASS_HEARTS, None, 36)
+        rnd_compact.assert_invariants()
+        self.assertEqual(rnd, rnd_compact)
+
+    def test_no_dict(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=EAST, compact=True)
+        self.assertFalse(hasattr(rnd, '__dict__'))
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=EAST)
+        self.assertFalse(hasattr(rnd, '__dict__'))
+
+    def test_pickle_and_copy(self):
+        for nr_cards in [0, 5, 36]:
+            _, rnd_compact = self._play_both(JASS_SCHIEBER_1000, HEARTS, nr_cards)
+            for rnd_copy in [pickle.loads(pickle.dumps(rnd_compact)), copy.deepcopy(rnd_compact)]:
+                self.assertEqual(rnd_compact, rnd_copy)
+                # the arrays must again be views into the buffer of the copy
+                rnd_copy.hands[0, 0] = 7
+                self.assertEqual(7, rnd_copy._buffer[0])
+                if nr_cards < 36:
+                    self.assertTrue(np.shares_memory(rnd_copy.current_trick, rnd_copy.tricks))
+
+
+if __name__ == '__main__':
+    unittest.main()
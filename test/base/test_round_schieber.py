@@ -1,6 +1,8 @@
 import unittest
 
 from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
 from source.jass.base.round_schieber import RoundSchieber
 
 
@@ -110,6 +112,13 @@ class RoundTestCase(unittest.TestCase):
         rnd.trump = OBE_ABE
         self.assertEqual(rnd.rule.calc_winner(trick, first_player, trump=OBE_ABE), EAST)
 
+        # without trump, the highest card of the first color wins
+        #                 E   N   W   S
+        trick = np.array([DA, D6, DK, DQ])
+        self.assertEqual(rnd.rule.calc_winner(trick, first_player), EAST)
+        self.assertEqual(rnd.rule.calc_winner_by_rules(trick, first_player), EAST)
+        self.assertEqual(rnd.rule.calc_winner_batch(trick[None, :], [first_player], [-1])[0], EAST)
+
     # def test_calc_winner_profiling(self):
         # for profiling: call methods 1000 times
     #    for i in range(10000):
@@ -246,6 +255,125 @@ class RoundTestCase(unittest.TestCase):
 
         rnd.assert_invariants()
 
+    def test_clone_and_undo(self):
+        for compact in [False, True]:
+            rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH, compact=compact)
+            rnd.deal_cards()
+            rnd.action_trump(HEARTS)
+            states = []
+            cards = []
+            for _ in range(36):
+                states.append(rnd.clone())
+                card = np.random.choice(np.flatnonzero(rnd.get_valid_cards()))
+                cards.append(card)
+                rnd.action_play_card(card)
+                rnd.assert_invariants()
+
+            # the clones are independent of the round
+            self.assertEqual(0, states[0].nr_played_cards)
+            self.assertEqual(36, states[0].hands.sum())
+
+            # undo all the cards and compare to the stored states
+            for i in reversed(range(36)):
+                card = rnd.undo_play_card()
+                self.assertEqual(cards[i], card)
+                rnd.assert_invariants()
+                self.assertEqual(states[i], rnd)
+                self.assertTrue(np.shares_memory(rnd.current_trick, rnd.tricks))
+
+            # replay after undo gives the same result
+            for card in cards:
+                rnd.action_play_card(card)
+            self.assertEqual(157, rnd.points_team_0 + rnd.points_team_1)
+
+    def test_zobrist_key(self):
+        for compact in [False, True]:
+            rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH, compact=compact)
+            # hashing is only enabled by update_hash
+            self.assertIsNone(rnd.zobrist_key)
+            rnd.update_hash()
+            rnd.deal_cards()
+            rnd.action_trump(SPADES)
+            keys = [rnd.zobrist_key]
+            for _ in range(36):
+                rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+                # the incremental update gives the same key as the calculation from the state
+                key = rnd.zobrist_key
+                self.assertEqual(key, rnd.calc_hash())
+                rnd.update_hash()
+                self.assertEqual(key, rnd.zobrist_key)
+                self.assertEqual(key, rnd.clone().zobrist_key)
+                keys.append(key)
+            self.assertEqual(37, len(set(keys)))
+
+            for i in reversed(range(36)):
+                rnd.undo_play_card()
+                self.assertEqual(keys[i], rnd.zobrist_key)
+
+    def test_zobrist_key_transposition(self):
+        # the same cards played in a different order give the same state: the first two tricks are exchanged, in
+        # both tricks north leads and wins with the highest trump
+        hands = np.zeros((4, 36), dtype=np.int32)
+        hands[NORTH, [HJ, H9, DA, DK, DQ, DJ, D10, D9, D8]] = 1
+        hands[EAST, [H6, H7, SA, SK, SQ, SJ, S10, S9, S8]] = 1
+        hands[SOUTH, [HA, HK, CA, CK, CQ, CJ, C10, C9, C8]] = 1
+        hands[WEST, [HQ, H10, H8, D7, D6, S7, S6, C7, C6]] = 1
+        tricks = [[HJ, HQ, HA, H6], [H9, H10, HK, H7]]
+        rounds = []
+        for order in [tricks, list(reversed(tricks))]:
+            rnd = RoundSchieber(dealer=EAST)
+            rnd.set_hands(hands)
+            rnd.update_hash()
+            rnd.action_trump(HEARTS)
+            for trick in order:
+                for card in trick:
+                    self.assertEqual(1, rnd.get_valid_cards()[card])
+                    rnd.action_play_card(card)
+            rnd.assert_invariants()
+            self.assertEqual(NORTH, rnd.player)
+            rounds.append(rnd)
+        self.assertEqual(rounds[0].points_team_0, rounds[1].points_team_0)
+        self.assertEqual(rounds[0].zobrist_key, rounds[1].zobrist_key)
+
+    def test_color_counts(self):
+        for trump in range(MAX_TRUMP + 1):
+            rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+            rnd.deal_cards()
+            self.assertTrue(np.all(rnd.color_counts.sum(axis=1) == 9))
+            rnd.action_trump(trump)
+            for _ in range(36):
+                valid_cards = rnd.get_valid_cards()
+                player_rnd = PlayerRound()
+                player_rnd.set_from_round(rnd)
+                self.assertTrue(np.all(player_rnd.color_counts == rnd.color_counts[rnd.player]))
+                self.assertTrue(np.all(valid_cards == player_rnd.get_valid_cards()))
+                self.assertTrue(np.all(valid_cards == rnd.rule.get_valid_cards(rnd.hands[rnd.player],
+                                                                               rnd.current_trick,
+                                                                               rnd.nr_cards_in_trick,
+                                                                               rnd.trump)))
+                rnd.action_play_card(np.random.choice(np.flatnonzero(valid_cards)))
+                rnd.assert_invariants()
+            self.assertTrue(np.all(rnd.color_counts == 0))
+
+    def test_color_counts_hands_set_directly(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(OBE_ABE)
+        # one color for each player
+        rnd.hands = color_masks.astype(np.int32)
+        with self.assertRaises(AssertionError):
+            rnd.assert_invariants()
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        with self.assertRaises(AssertionError):
+            player_rnd.assert_invariants()
+
+        rnd.update_color_counts()
+        rnd.assert_invariants()
+        np.testing.assert_array_equal(rnd.hands[rnd.player], rnd.get_valid_cards())
+        player_rnd.update_color_counts()
+        player_rnd.assert_invariants()
+
 
 if __name__ == '__main__':
     unittest.main()
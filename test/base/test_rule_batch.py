@@ -0,0 +1,100 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.base.round_utils import calculate_positions_from_round, calculate_trick_results_from_tricks
+from source.jass.base.rule_hearts import RuleHearts
+from source.jass.base.rule_schieber import RuleSchieber
+from source.jass.base.rule_utils import validate_round
+
+
+def play_random_round(jass_type: str, trump: int or None) -> 'Round':
+    rnd = get_round(jass_type, dealer=np.random.randint(4))
+    rnd.deal_cards()
+    if trump is not None:
+        rnd.action_trump(trump)
+    for _ in range(36):
+        rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+    return rnd
+
+
+class RuleBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def test_positions_from_round(self):
+        rnd = play_random_round(JASS_SCHIEBER_1000, SPADES)
+        hands, tricks, move_nr = calculate_positions_from_round(rnd)
+        for i, player_rnd in enumerate(PlayerRound.all_from_complete_round(rnd)):
+            self.assertTrue(np.all(player_rnd.hand == hands[i]))
+            self.assertEqual(player_rnd.nr_cards_in_trick, move_nr[i])
+            self.assertTrue(np.all(player_rnd.current_trick == tricks[i]))
+
+    def _compare_batch(self, jass_type: str, trumps: list, nr_rounds: int):
+        for _ in range(nr_rounds):
+            trump = trumps[np.random.randint(len(trumps))]
+            rnd = play_random_round(jass_type, trump)
+            validate_round(rnd)
+
+            hands, tricks, move_nr = calculate_positions_from_round(rnd)
+
+            # add random hands from the cards not played yet to the positions
+            cards_played = rnd.tricks.reshape(-1)
+            random_hands = np.zeros_like(hands)
+            for i in range(36):
+                random_cards = np.random.permutation(cards_played[i:])[0:hands[i].sum()]
+                random_hands[i, random_cards] = 1
+            all_hands = np.concatenate([hands, random_hands])
+            all_tricks = np.tile(tricks, (2, 1))
+            all_move_nr = np.tile(move_nr, 2)
+            all_trump = np.full(all_move_nr.shape, -1 if trump is None else trump)
+            valid_batch = rnd.rule.get_valid_cards_batch(all_hands, all_tricks, all_move_nr, all_trump)
+            for i in range(all_hands.shape[0]):
+                expected = rnd.rule.get_valid_cards(all_hands[i], all_tricks[i], all_move_nr[i], all_trump[i])
+                self.assertTrue(np.all(expected == valid_batch[i]))
+
+    def test_schieber_batch(self):
+        self._compare_batch(JASS_SCHIEBER_1000, trump_ints, 100)
+
+    def test_hearts_batch(self):
+        self._compare_batch(JASS_HEARTS, [None], 20)
+
+    def test_schieber_winner_and_points_batch(self):
+        rule = RuleSchieber()
+        tricks = np.array([np.random.permutation(36)[0:4] for _ in range(3000)])
+        first_player = np.random.randint(4, size=3000)
+        # including tricks without trump
+        trump = np.random.randint(-1, 6, size=3000)
+        is_last = np.random.randint(2, size=3000) == 1
+        winner = rule.calc_winner_batch(tricks, first_player, trump)
+        points = rule.calc_points_batch(tricks, is_last, trump)
+        for i in range(3000):
+            self.assertEqual(rule.calc_winner_by_rules(tricks[i], first_player[i], trump[i]), winner[i])
+            self.assertEqual(rule.calc_winner(tricks[i], first_player[i], trump[i]), winner[i])
+            self.assertEqual(rule.calc_points(tricks[i], is_last[i], trump[i]), points[i])
+
+    def test_hearts_winner_and_points_batch(self):
+        rule = RuleHearts()
+        tricks = np.array([np.random.permutation(36)[0:4] for _ in range(1000)])
+        first_player = np.random.randint(4, size=1000)
+        winner = rule.calc_winner_batch(tricks, first_player, None)
+        points = rule.calc_points_batch(tricks, None, None)
+        for i in range(1000):
+            self.assertEqual(rule.calc_winner(tricks[i], first_player[i]), winner[i])
+            self.assertEqual(rule.calc_points(tricks[i], False), points[i])
+
+    def test_trick_results_from_tricks(self):
+        rnds = [play_random_round(JASS_SCHIEBER_1000, np.random.randint(6)) for _ in range(20)]
+        winner, points = calculate_trick_results_from_tricks(rnds[0].rule,
+                                                             np.array([rnd.tricks for rnd in rnds]),
+                                                             np.array([rnd.trick_first_player for rnd in rnds]),
+                                                             np.array([rnd.trump for rnd in rnds]))
+        for i, rnd in enumerate(rnds):
+            self.assertTrue(np.all(rnd.trick_winner == winner[i]))
+            self.assertTrue(np.all(rnd.trick_points == points[i]))
+            self.assertEqual(157, points[i].sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
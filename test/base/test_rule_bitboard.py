@@ -0,0 +1,68 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.bitboard import cards_to_bits, bits_to_cards, popcount, bits_to_int_list
+from source.jass.base.round_factory import get_round
+from source.jass.base.rule_factory import RULE_IMPL_BITBOARD
+from source.jass.base.rule_hearts import RuleHearts
+from source.jass.base.rule_hearts_bitboard import RuleHeartsBitboard
+from source.jass.base.rule_schieber import RuleSchieber
+from source.jass.base.rule_schieber_bitboard import RuleSchieberBitboard
+from source.jass.base.rule_schieber_table import RuleSchieberTable
+
+
+class RuleBitboardTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def test_conversion(self):
+        hand = get_cards_encoded([DA, H10, SJ, C6])
+        bits = cards_to_bits(hand)
+        self.assertEqual(4, popcount(bits))
+        self.assertEqual([DA, H10, SJ, C6], bits_to_int_list(bits))
+        self.assertTrue(np.all(hand == bits_to_cards(bits)))
+
+    def _compare_random_rounds(self, rule, rule_bitboard, trumps, nr_rounds):
+        for _ in range(nr_rounds):
+            hands = np.zeros([4, 36], np.int32)
+            cards = np.random.permutation(36)
+            for p in range(4):
+                hands[p, cards[p*9:(p+1)*9]] = 1
+            trump = np.random.choice(trumps)
+            tricks = cards.reshape(9, 4)
+            for trick in tricks:
+                for move_nr in range(4):
+                    for p in range(4):
+                        expected = rule.get_valid_cards(hands[p], trick, move_nr, trump)
+                        actual = rule_bitboard.get_valid_cards(hands[p], trick, move_nr, trump)
+                        self.assertTrue(np.all(expected == actual))
+                # remove the cards of the trick from the hands for the next trick
+                hands[:, trick] = 0
+
+    def test_schieber_same_as_array(self):
+        self._compare_random_rounds(RuleSchieber(), RuleSchieberBitboard(), trump_ints, 200)
+
+    def test_schieber_table_same_as_array(self):
+        self._compare_random_rounds(RuleSchieber(), RuleSchieberTable(), trump_ints, 200)
+
+    def test_hearts_same_as_array(self):
+        self._compare_random_rounds(RuleHearts(), RuleHeartsBitboard(), [None], 50)
+
+    def test_round_with_bitboard(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH, rule_impl=RULE_IMPL_BITBOARD)
+        self.assertEqual(RuleSchieberBitboard.__name__, type(rnd.rule).__name__)
+        rnd.deal_cards()
+        rnd.action_trump(SPADES)
+        for _ in range(36):
+            valid_cards = rnd.get_valid_cards()
+            self.assertTrue(np.all(valid_cards == RuleSchieber().get_valid_cards(
+                rnd.hands[rnd.player], rnd.current_trick, rnd.nr_cards_in_trick, rnd.trump)))
+            rnd.action_play_card(np.random.choice(np.flatnonzero(valid_cards)))
+        rnd.assert_invariants()
+
+        rnd = get_round(JASS_HEARTS, dealer=NORTH, rule_impl=RULE_IMPL_BITBOARD)
+        self.assertEqual(RuleHeartsBitboard.__name__, type(rnd.rule).__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.round_factory import get_round
+from source.jass.player.double_dummy_solver import DoubleDummySolver
+from source.jass.player.transposition_table import TranspositionTable
+
+
+def _minimax(rnd) -> int:
+    """
+    Points of team 0 at the end of the round with optimal play, by a search of all the valid cards.
+    """
+    if rnd.nr_played_cards == 36:
+        return rnd.points_team_0
+    maximize = rnd.player % 2 == 0
+    values = []
+    for card in np.flatnonzero(rnd.get_valid_cards()):
+        rnd.action_play_card(int(card))
+        values.append(_minimax(rnd))
+        rnd.undo_play_card()
+    return max(values) if maximize else min(values)
+
+
+class DoubleDummySolverTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    @staticmethod
+    def _create_endgame(trump: int, nr_remaining_cards: int):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(trump)
+        while 36 - rnd.nr_played_cards > nr_remaining_cards:
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        return rnd
+
+    def test_solve_minimax(self):
+        for i in range(40):
+            trump = i % (MAX_TRUMP + 1)
+            rnd = self._create_endgame(trump, 5 + i % 8)
+            points_team_0 = _minimax(rnd.clone())
+            solver = DoubleDummySolver(trump)
+            self.assertEqual((points_team_0, 157 - points_team_0), solver.solve(rnd))
+            # the round is not changed by the solver
+            rnd.assert_invariants()
+
+    def test_solve_cards_minimax(self):
+        for i in range(12):
+            trump = i % (MAX_TRUMP + 1)
+            rnd = self._create_endgame(trump, 6 + i % 5)
+            points_by_card = DoubleDummySolver(trump).solve_cards(rnd)
+            self.assertEqual(set(np.flatnonzero(rnd.get_valid_cards())), set(points_by_card))
+            for card, points in points_by_card.items():
+                rnd.action_play_card(card)
+                self.assertEqual(_minimax(rnd.clone()), points[0])
+                rnd.undo_play_card()
+                self.assertEqual(157, sum(points))
+
+    def test_solve_finished_round(self):
+        rnd = self._create_endgame(SPADES, 0)
+        self.assertEqual((rnd.points_team_0, rnd.points_team_1), DoubleDummySolver(SPADES).solve(rnd))
+
+    def test_shared_table(self):
+        table = TranspositionTable(nr_buckets=2**10)
+        rnd = self._create_endgame(HEARTS, 10)
+        expected = DoubleDummySolver(HEARTS).solve(rnd.clone())
+        solver = DoubleDummySolver(HEARTS, table)
+        self.assertEqual(expected, solver.solve(rnd))
+        # solve does not enable the hashing of the round
+        self.assertIsNone(rnd.zobrist_key)
+        # the result of the round is found in the table
+        nr_hits = table.nr_hits
+        self.assertEqual(expected, solver.solve(rnd))
+        self.assertEqual(nr_hits + 1, table.nr_hits)
+        # also with the key maintained by the round
+        rnd.update_hash()
+        self.assertEqual(expected, solver.solve(rnd))
+        self.assertEqual(nr_hits + 2, table.nr_hits)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from source.jass.base.const import *
+from source.jass.player.mcts.early_stopping import EarlyStopping
+from source.jass.player.search_budget import SearchBudget
+
+
+class EarlyStoppingTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.early_stopping = EarlyStopping(check_interval=100, min_visits=1000, z=2.58)
+        self.valid_cards = np.array([D6, H10, SA])
+
+    def _counts(self, visits: list, rewards: list) -> (np.ndarray, np.ndarray):
+        visit_counts = np.zeros(36, dtype=np.int64)
+        reward_sums = np.zeros(36, dtype=np.float64)
+        visit_counts[self.valid_cards] = visits
+        reward_sums[self.valid_cards] = rewards
+        return visit_counts, reward_sums
+
+    def test_single_card(self):
+        visit_counts, reward_sums = self._counts([0, 0, 0], [0, 0, 0])
+        self.assertTrue(self.early_stopping.is_decided(np.array([H10]), visit_counts, reward_sums, 1000))
+        self.assertTrue(self.early_stopping.is_decided(np.array([], dtype=np.int64), visit_counts, reward_sums,
+                                                       1000))
+
+    def test_min_visits(self):
+        # the lead can not be overtaken and the bounds are separated, but there are not enough visits
+        visit_counts, reward_sums = self._counts([900, 50, 49], [800, 10, 10])
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, 0))
+
+    def test_visit_lead(self):
+        # the same mean rewards, so only the lead in visits decides
+        visit_counts, reward_sums = self._counts([600, 400, 300], [300, 200, 150])
+        self.assertTrue(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, 199))
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, 200))
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, np.inf))
+
+    def test_confidence(self):
+        visit_counts, reward_sums = self._counts([500, 400, 400], [400, 200, 200])
+        self.assertTrue(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, np.inf))
+        # with close mean rewards, the bounds overlap
+        visit_counts, reward_sums = self._counts([500, 400, 400], [260, 200, 200])
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, np.inf))
+
+    def test_unvisited_card(self):
+        # a valid card without visits is never separated from the best card
+        visit_counts, reward_sums = self._counts([700, 600, 0], [600, 100, 0])
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, np.inf))
+        # but it can not overtake the best card, if not enough iterations remain
+        self.assertTrue(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, 99))
+
+    def test_invalid_cards(self):
+        # visits of cards that are not valid are ignored
+        visit_counts, reward_sums = self._counts([500, 400, 400], [260, 200, 200])
+        visit_counts[C6] = 5000
+        reward_sums[C6] = 5000
+        self.assertFalse(self.early_stopping.is_decided(self.valid_cards, visit_counts, reward_sums, np.inf))
+
+    def test_remaining_iterations(self):
+        budget = SearchBudget(max_iterations=1000)
+        self.assertEqual(600, EarlyStopping.remaining_iterations(budget, 400, 1.0))
+        self.assertEqual(np.inf, EarlyStopping.remaining_iterations(SearchBudget(deadline=time.time() + 10), 0, 0))
+
+        # 100 iterations per second and about 2 seconds left
+        remaining = EarlyStopping.remaining_iterations(SearchBudget(deadline=time.time() + 2), 100, 1.0)
+        self.assertTrue(150 < remaining <= 200)
+        remaining = EarlyStopping.remaining_iterations(SearchBudget(deadline=time.time() + 2, max_iterations=150),
+                                                       100, 1.0)
+        self.assertEqual(50, remaining)
+        # no iterations remain after the deadline
+        self.assertEqual(0, EarlyStopping.remaining_iterations(SearchBudget(deadline=time.time() - 1), 100, 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts.ismcts import ISMCTS, ISMCTSNode, ISMCTSTree
+from source.jass.player.search_budget import SearchBudget
+
+
+class ISMCTSTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        self.rnd.deal_cards()
+        self.rnd.action_trump(DIAMONDS)
+        for _ in range(24):
+            self.rnd.action_play_card(np.random.choice(np.flatnonzero(self.rnd.get_valid_cards())))
+        self.player_rnd = self._player_round(self.rnd)
+        self.tree = ISMCTS.search(self.player_rnd, SearchBudget(max_iterations=2000))
+
+    @staticmethod
+    def _player_round(rnd) -> PlayerRound:
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        return player_rnd
+
+    def _assert_links(self, root: ISMCTSNode):
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            for card, child in node.childs.items():
+                self.assertIs(node, child.parent)
+                self.assertEqual(card, child.card)
+                self.assertGreaterEqual(node.visit_count, child.visit_count)
+            nodes.extend(node.childs.values())
+
+    def test_search(self):
+        self.assertEqual(self.tree.nr_nodes, ISMCTS.count_nodes(self.tree.root))
+        self.assertEqual(2000, self.tree.root.visit_count)
+        self.assertEqual(2000, np.sum(ISMCTS.get_visit_counts(self.tree)))
+        self._assert_links(self.tree.root)
+
+    def test_recycle(self):
+        visit_counts = ISMCTS.get_visit_counts(self.tree)
+        reward_sums = ISMCTS.get_reward_sums(self.tree)
+        nr_nodes_before = self.tree.nr_nodes
+        nr_nodes = nr_nodes_before // 4
+        nr_removed = ISMCTS.recycle(self.tree, nr_nodes)
+        self.assertGreaterEqual(nr_removed, nr_nodes)
+        self.assertEqual(nr_nodes_before - nr_removed, self.tree.nr_nodes)
+        self.assertEqual(self.tree.nr_nodes, ISMCTS.count_nodes(self.tree.root))
+        self.assertEqual(nr_nodes_before, self.tree.peak_nr_nodes)
+        self._assert_links(self.tree.root)
+        # the children of the root keep their statistics
+        np.testing.assert_array_equal(visit_counts, ISMCTS.get_visit_counts(self.tree))
+        np.testing.assert_array_equal(reward_sums, ISMCTS.get_reward_sums(self.tree))
+
+    def test_recycle_nothing(self):
+        tree = ISMCTSTree(self.player_rnd)
+        self.assertEqual(0, ISMCTS.recycle(tree, 10))
+        self.assertEqual(1, tree.nr_nodes)
+
+    def test_search_recycle(self):
+        max_nodes = 200
+        tree = ISMCTS.search(self.player_rnd, SearchBudget(max_iterations=2000), max_nodes=max_nodes,
+                             recycle=True)
+        self.assertLessEqual(tree.nr_nodes, max_nodes)
+        self.assertLessEqual(tree.peak_nr_nodes, max_nodes)
+        self.assertEqual(tree.nr_nodes, ISMCTS.count_nodes(tree.root))
+        self.assertEqual(2000, np.sum(ISMCTS.get_visit_counts(tree)))
+        self._assert_links(tree.root)
+
+    def test_find_same_state(self):
+        visit_counts = ISMCTS.get_visit_counts(self.tree)
+        subtree = ISMCTS.find_subtree(self.tree, self._player_round(self.rnd))
+        self.assertIsNotNone(subtree)
+        self.assertEqual(self.tree.nr_nodes, subtree.nr_nodes)
+        np.testing.assert_array_equal(visit_counts, ISMCTS.get_visit_counts(subtree))
+
+    def test_find_after_cards(self):
+        # late in the round, the search expands the tree until the player is to move again
+        for _ in range(4):
+            self.rnd.action_play_card(np.random.choice(np.flatnonzero(self.rnd.get_valid_cards())))
+        self.player_rnd = self._player_round(self.rnd)
+        self.tree = ISMCTS.search(self.player_rnd, SearchBudget(max_iterations=5000))
+
+        # play the most visited cards of the tree that are valid in the round, until the player is to move again
+        node = self.tree.root
+        while True:
+            valid_cards = [card for card in np.flatnonzero(self.rnd.get_valid_cards()) if card in node.childs]
+            self.assertTrue(len(valid_cards) > 0)
+            node = max((node.childs[card] for card in valid_cards), key=lambda child: child.visit_count)
+            self.rnd.action_play_card(node.card)
+            if self.rnd.player == self.player_rnd.player:
+                break
+        visit_counts = {card: child.visit_count for card, child in node.childs.items()}
+
+        subtree = ISMCTS.find_subtree(self.tree, self._player_round(self.rnd))
+        self.assertIsNotNone(subtree)
+        self.assertIs(node, subtree.root)
+        self.assertIsNone(subtree.root.parent)
+        self.assertEqual(ISMCTS.count_nodes(node), subtree.nr_nodes)
+        self.assertEqual(self.rnd.nr_played_cards, subtree.nr_played_cards)
+        self.assertEqual(self.player_rnd.player, subtree.player)
+        np.testing.assert_array_equal(self.rnd.hands[self.rnd.player], subtree.hand)
+        self.assertEqual(visit_counts, {card: child.visit_count for card, child in subtree.root.childs.items()})
+
+    def test_find_other_hand(self):
+        # the same cards played, but another hand of the player
+        player_rnd = self._player_round(self.rnd)
+        card = np.flatnonzero(player_rnd.hand)[0]
+        other_card = np.flatnonzero(self.rnd.hands[next_player[self.rnd.player]])[0]
+        player_rnd.hand[card] = 0
+        player_rnd.hand[other_card] = 1
+        self.assertIsNone(ISMCTS.find_subtree(self.tree, player_rnd))
+
+    def test_find_other_player(self):
+        card = int(np.flatnonzero(self.rnd.get_valid_cards())[0])
+        self.rnd.action_play_card(card)
+        self.assertIn(card, self.tree.root.childs)
+        self.assertIsNone(ISMCTS.find_subtree(self.tree, self._player_round(self.rnd)))
+
+    def test_find_other_round(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(DIAMONDS)
+        for _ in range(20):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        self.assertIsNone(ISMCTS.find_subtree(self.tree, self._player_round(rnd)))
+
+        player_rnd = self._player_round(self.rnd)
+        player_rnd.trump = HEARTS
+        self.assertIsNone(ISMCTS.find_subtree(self.tree, player_rnd))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts.mcts import MCTS
+from source.jass.player.mcts.node_store import NO_NODE
+from source.jass.player.search_budget import SearchBudget
+
+
+class MCTSTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(SPADES)
+        for _ in range(6):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        self.player_rnd = self._player_round(rnd)
+        self.tree = MCTS.monte_carlo_tree_search(self.player_rnd, SearchBudget(max_iterations=3000))
+
+    @staticmethod
+    def _player_round(rnd) -> PlayerRound:
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        return player_rnd
+
+    def _play_along_tree(self):
+        """
+        Play the most visited cards of the tree in its sampled world, until the player of the search is to move
+        again, and return the node and the round reached.
+        """
+        node = 0
+        world = self.tree.round.clone()
+        while True:
+            node = self.tree.first_child[node] + int(np.argmax(self.tree.visit_count[
+                self.tree.first_child[node]:self.tree.first_child[node] + self.tree.nr_childs[node]]))
+            world.action_play_card(int(self.tree.card[node]))
+            if world.player == self.player_rnd.player:
+                return node, world
+
+    def test_find_same_state(self):
+        subtree = MCTS.find_subtree(self.tree, self.player_rnd)
+        self.assertIsNotNone(subtree)
+        self.assertEqual(self.tree.nr_nodes, subtree.nr_nodes)
+        np.testing.assert_array_equal(self.tree.get_child_visit_counts(0), subtree.get_child_visit_counts(0))
+
+    def test_find_after_cards(self):
+        node, world = self._play_along_tree()
+        self.assertGreater(world.nr_played_cards, self.player_rnd.nr_played_cards)
+        subtree = MCTS.find_subtree(self.tree, self._player_round(world))
+        self.assertIsNotNone(subtree)
+        self.assertEqual(world.nr_played_cards, subtree.round.nr_played_cards)
+        np.testing.assert_array_equal(world.hands, subtree.round.hands)
+        self.assertEqual(self.tree.visit_count[node], subtree.visit_count[0])
+        np.testing.assert_array_equal(self.tree.get_child_visit_counts(node), subtree.get_child_visit_counts(0))
+        # the tree is not changed
+        self.assertEqual(self.tree.round.nr_played_cards, self.player_rnd.nr_played_cards)
+
+    def test_find_other_hand(self):
+        _, world = self._play_along_tree()
+        player_rnd = self._player_round(world)
+        # exchange a card of the hand with a card of another player
+        card = np.flatnonzero(player_rnd.hand)[0]
+        other_card = np.flatnonzero(world.hands[next_player[world.player]])[0]
+        player_rnd.hand[card] = 0
+        player_rnd.hand[other_card] = 1
+        self.assertIsNone(MCTS.find_subtree(self.tree, player_rnd))
+
+    def test_find_missing_node(self):
+        # a tree with the children of the root only
+        tree = MCTS.monte_carlo_tree_search(self.player_rnd, SearchBudget(max_iterations=1))
+        world = tree.round.clone()
+        for _ in range(4):
+            world.action_play_card(np.random.choice(np.flatnonzero(world.get_valid_cards())))
+        self.assertEqual(NO_NODE, tree.first_child[tree.first_child[0]])
+        self.assertIsNone(MCTS.find_subtree(tree, self._player_round(world)))
+
+    def test_find_other_round(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(SPADES)
+        for _ in range(10):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        self.assertIsNone(MCTS.find_subtree(self.tree, self._player_round(rnd)))
+
+        # the same cards with another trump
+        world = self.tree.round.clone()
+        world.trump = HEARTS
+        self.assertIsNone(MCTS.find_subtree(self.tree, self._player_round(world)))
+
+        # an earlier state of the round
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(SPADES)
+        self.assertIsNone(MCTS.find_subtree(self.tree, self._player_round(rnd)))
+
+
+if __name__ == '__main__':
+    unittest.main()
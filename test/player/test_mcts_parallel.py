@@ -0,0 +1,51 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts import mcts_parallel
+from source.jass.player.mcts.mcts_parallel import MCTSParallel, SEARCH_ISMCTS, SEARCH_MCTS, search_root
+from source.jass.player.search_budget import SearchBudget
+
+
+class MCTSParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        mcts_parallel._last_tree = None
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(CLUBS)
+        for _ in range(8):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        self.player_rnd = PlayerRound()
+        self.player_rnd.set_from_round(rnd)
+
+    def test_reuse_tree(self):
+        budget = SearchBudget(max_iterations=200)
+        for search in [SEARCH_MCTS, SEARCH_ISMCTS]:
+            search_root(self.player_rnd, budget, 1, 1, reuse_tree=True, search=search, search_id='first')
+            # the tree of a previous run is continued
+            visit_counts, _, nr_simulations, _ = search_root(self.player_rnd, budget, 1, 2, reuse_tree=True,
+                                                             search=search, search_id='second')
+            self.assertEqual(200, nr_simulations)
+            self.assertEqual(400, visit_counts.sum())
+            # but not the tree of another job of the same run
+            visit_counts, _, nr_simulations, _ = search_root(self.player_rnd, budget, 1, 3, reuse_tree=True,
+                                                             search=search, search_id='second')
+            self.assertEqual(200, nr_simulations)
+            self.assertEqual(200, visit_counts.sum())
+
+    def test_jobs_in_one_process(self):
+        # both jobs of a run are executed by the same process one after the other
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            for search in [SEARCH_MCTS, SEARCH_ISMCTS]:
+                mcts = MCTSParallel(self.player_rnd, processes=2, executor=executor, reuse_tree=True,
+                                    search=search, budget=SearchBudget(max_iterations=100))
+                mcts.run()
+                self.assertEqual(200, mcts.simulated_rounds)
+                self.assertEqual(mcts.simulated_rounds, mcts.visit_counts.sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
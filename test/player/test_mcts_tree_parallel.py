@@ -0,0 +1,42 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts.mcts_tree_parallel import MCTSTreeParallel
+from source.jass.player.search_budget import SearchBudget
+
+
+class MCTSTreeParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(SPADES)
+        for _ in range(4):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        self.player_rnd = PlayerRound()
+        self.player_rnd.set_from_round(rnd)
+
+    def test_counts(self):
+        for solver_threshold in [0, 8]:
+            mcts = MCTSTreeParallel(self.player_rnd, processes=2, budget=SearchBudget(max_iterations=300),
+                                    max_nodes=5000, solver_threshold=solver_threshold)
+            best_card = mcts.run()
+            # no updates of the statistics of the shared tree are lost
+            self.assertEqual(mcts.simulated_rounds, mcts.visit_counts.sum())
+            self.assertGreaterEqual(mcts.simulated_rounds, 600)
+            self.assertTrue(np.all(mcts.reward_sums <= mcts.visit_counts))
+            self.assertTrue(np.all(np.isfinite(mcts.standard_errors)))
+            self.assertEqual(1, self.player_rnd.get_valid_cards()[best_card])
+
+    def test_full_tree(self):
+        # the search continues without expanding the leaves when the tree is full
+        mcts = MCTSTreeParallel(self.player_rnd, processes=2, budget=SearchBudget(max_iterations=200),
+                                max_nodes=50)
+        mcts.run()
+        self.assertEqual(mcts.simulated_rounds, mcts.visit_counts.sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import multiprocessing
+import threading
+import time
+import unittest
+from unittest import mock
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts import mcts_worker_pool
+from source.jass.player.mcts.mcts_worker_pool import MCTSWorkerPool
+from source.jass.player.search_budget import SearchBudget
+
+
+class MCTSWorkerPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def test_start_from_threads(self):
+        pool = MCTSWorkerPool(processes=2)
+        try:
+            # the requests of the player service are served by several threads, that share the pool, the start
+            # is slowed down so that the threads start at the same time
+            with mock.patch.object(mcts_worker_pool, 'start_resource_tracker', lambda: time.sleep(0.2)):
+                threads = [threading.Thread(target=pool.start) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            self.assertTrue(pool.is_running)
+            self.assertEqual(2, len(multiprocessing.active_children()))
+        finally:
+            pool.shutdown()
+        self.assertFalse(pool.is_running)
+        self.assertEqual(0, len(multiprocessing.active_children()))
+
+    def test_search(self):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(HEARTS)
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        with MCTSWorkerPool(processes=2) as pool:
+            mcts = pool.search(player_rnd, SearchBudget(max_iterations=100))
+            self.assertEqual(1, player_rnd.get_valid_cards()[mcts.best_card])
+            self.assertEqual(200, mcts.visit_counts.sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
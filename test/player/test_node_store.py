@@ -0,0 +1,138 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts.mcts import MCTS
+from source.jass.player.mcts.node_store import NodeStore, NO_NODE, _ARRAYS
+from source.jass.player.search_budget import SearchBudget
+
+
+class NodeStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(CLUBS)
+        self.player_rnd = PlayerRound()
+        self.player_rnd.set_from_round(rnd)
+        self.tree = MCTS.monte_carlo_tree_search(self.player_rnd, SearchBudget(max_iterations=2000))
+
+    def _assert_links(self, tree: NodeStore):
+        nr_nodes = tree.nr_nodes
+        self.assertEqual(NO_NODE, tree.parent[0])
+        self.assertEqual(nr_nodes - 1, np.sum(tree.nr_childs[:nr_nodes]))
+        for node in range(nr_nodes):
+            first = tree.first_child[node]
+            if first == NO_NODE:
+                self.assertEqual(0, tree.nr_childs[node])
+                continue
+            # the children are contiguous and point back to the node
+            last = first + tree.nr_childs[node]
+            self.assertTrue(0 < first < last <= nr_nodes)
+            np.testing.assert_array_equal(np.full(last - first, node), tree.parent[first:last])
+            self.assertGreaterEqual(tree.visit_count[node], np.sum(tree.visit_count[first:last]))
+        for node in range(1, nr_nodes):
+            parent = tree.parent[node]
+            self.assertTrue(tree.first_child[parent] <= node < tree.first_child[parent] + tree.nr_childs[parent])
+
+    def _assert_same_subtree(self, tree: NodeStore, node: int, other: NodeStore, other_node: int) -> int:
+        """
+        Assert that the subtrees of the nodes have the same children and statistics and return their size.
+        """
+        self.assertEqual(tree.visit_count[node], other.visit_count[other_node])
+        self.assertEqual(tree.win_count[node], other.win_count[other_node])
+        self.assertEqual(tree.nr_childs[node], other.nr_childs[other_node])
+        size = 1
+        for i in range(tree.nr_childs[node]):
+            child = tree.first_child[node] + i
+            card = tree.card[child]
+            other_child = other.find_child(other_node, card)
+            self.assertNotEqual(NO_NODE, other_child)
+            self.assertEqual(tree.player[child], other.player[other_child])
+            size += self._assert_same_subtree(tree, child, other, other_child)
+        return size
+
+    def _assert_pruned_subtree(self, tree: NodeStore, node: int, other: NodeStore, other_node: int):
+        """
+        Assert that the subtree of the node is the subtree of the other node with some children removed.
+        """
+        self.assertEqual(tree.visit_count[node], other.visit_count[other_node])
+        self.assertEqual(tree.win_count[node], other.win_count[other_node])
+        if tree.nr_childs[node] == 0:
+            return
+        self.assertEqual(tree.nr_childs[node], other.nr_childs[other_node])
+        for i in range(tree.nr_childs[node]):
+            child = tree.first_child[node] + i
+            other_child = other.find_child(other_node, tree.card[child])
+            self.assertNotEqual(NO_NODE, other_child)
+            self._assert_pruned_subtree(tree, child, other, other_child)
+
+    def test_tree(self):
+        self.assertGreater(self.tree.nr_nodes, 100)
+        self._assert_links(self.tree)
+
+    def test_extract_subtree(self):
+        visit_counts = self.tree.get_child_visit_counts(0)
+        card = int(np.argmax(visit_counts))
+        node = self.tree.find_child(0, card)
+        rnd = self.tree.round.clone()
+        rnd.action_play_card(card)
+
+        subtree = self.tree.extract_subtree(node, rnd)
+        self.assertIs(rnd, subtree.round)
+        self._assert_links(subtree)
+        self.assertEqual(self.tree.player[node], subtree.player[0])
+        self.assertEqual(subtree.nr_nodes, self._assert_same_subtree(subtree, 0, self.tree, node))
+        self.assertEqual(visit_counts[card], subtree.visit_count[0])
+
+    def test_extract_root(self):
+        subtree = self.tree.extract_subtree(0, self.tree.round)
+        self._assert_links(subtree)
+        self.assertEqual(self.tree.nr_nodes, subtree.nr_nodes)
+        self._assert_same_subtree(subtree, 0, self.tree, 0)
+
+    def test_extract_leaf(self):
+        leaf = int(np.flatnonzero(self.tree.first_child[:self.tree.nr_nodes] == NO_NODE)[0])
+        subtree = self.tree.extract_subtree(leaf, None)
+        self.assertEqual(1, subtree.nr_nodes)
+        self.assertEqual(NO_NODE, subtree.first_child[0])
+        self.assertEqual(self.tree.visit_count[leaf], subtree.visit_count[0])
+
+    def test_recycle(self):
+        original = self.tree.extract_subtree(0, self.tree.round)
+        nr_nodes_before = self.tree.nr_nodes
+        for nr_nodes in [1, 50, nr_nodes_before // 4, nr_nodes_before]:
+            tree = original.extract_subtree(0, original.round)
+            nr_removed = tree.recycle(nr_nodes)
+            self.assertGreaterEqual(nr_removed, min(nr_nodes, nr_nodes_before - 1 - original.nr_childs[0]))
+            self.assertEqual(nr_nodes_before - nr_removed, tree.nr_nodes)
+            self._assert_links(tree)
+            self._assert_pruned_subtree(tree, 0, original, 0)
+            # the children of the root are never removed
+            self.assertEqual(original.nr_childs[0], tree.nr_childs[0])
+            np.testing.assert_array_equal(original.get_child_visit_counts(0), tree.get_child_visit_counts(0))
+            np.testing.assert_array_equal(original.get_child_win_counts(0), tree.get_child_win_counts(0))
+            # the freed nodes are reset, so they can be added again
+            for name, fill_value in _ARRAYS:
+                np.testing.assert_array_equal(np.full(nr_removed, fill_value),
+                                              getattr(tree, name)[tree.nr_nodes:nr_nodes_before])
+
+    def test_recycle_nothing(self):
+        tree = NodeStore()
+        tree.add_root(NORTH)
+        self.assertEqual(0, tree.recycle(10))
+        self.assertEqual(1, tree.nr_nodes)
+        self.assertEqual(0, self.tree.recycle(0))
+
+    def test_search_recycle(self):
+        max_nodes = 300
+        tree = MCTS.monte_carlo_tree_search(self.player_rnd, SearchBudget(max_iterations=3000),
+                                            max_nodes=max_nodes, recycle=True)
+        self.assertLessEqual(tree.nr_nodes, max_nodes)
+        self._assert_links(tree)
+        self.assertEqual(3000, np.sum(tree.get_child_visit_counts(0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.round_factory import get_round
+from source.jass.player.mcts.rollout import rollout, rollout_batch
+
+
+class RolloutTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    @staticmethod
+    def _create_round(trump: int, nr_played_cards: int):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(trump)
+        for _ in range(nr_played_cards):
+            rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+        return rnd
+
+    def test_rollout(self):
+        for trump in range(MAX_TRUMP + 1):
+            for nr_played_cards in [0, 5, 18, 35]:
+                rnd = self._create_round(trump, nr_played_cards)
+                hands = rnd.hands.copy()
+                points_team_0, points_team_1 = rollout(rnd)
+                self.assertEqual(157, points_team_0 + points_team_1)
+                self.assertGreaterEqual(points_team_0, rnd.points_team_0)
+                self.assertGreaterEqual(points_team_1, rnd.points_team_1)
+                np.testing.assert_array_equal(hands, rnd.hands)
+                self.assertEqual(nr_played_cards, rnd.nr_played_cards)
+
+    def test_rollout_finished(self):
+        rnd = self._create_round(HEARTS, 36)
+        self.assertEqual((rnd.points_team_0, rnd.points_team_1), rollout(rnd))
+
+    def test_rollout_batch(self):
+        for nr_played_cards in [0, 7, 20, 35]:
+            # the rounds of a batch may have different trumps
+            rounds = [self._create_round(trump, nr_played_cards) for trump in range(MAX_TRUMP + 1)]
+            hands = [rnd.hands.copy() for rnd in rounds]
+            points_team_0, points_team_1 = rollout_batch(rounds, 20)
+            self.assertEqual((len(rounds), 20), points_team_0.shape)
+            self.assertEqual((len(rounds), 20), points_team_1.shape)
+            np.testing.assert_array_equal(np.full((len(rounds), 20), 157), points_team_0 + points_team_1)
+            for i, rnd in enumerate(rounds):
+                self.assertTrue(np.all(points_team_0[i] >= rnd.points_team_0))
+                self.assertTrue(np.all(points_team_1[i] >= rnd.points_team_1))
+                np.testing.assert_array_equal(hands[i], rnd.hands)
+
+    def test_rollout_batch_finished(self):
+        rounds = [self._create_round(trump, 36) for trump in [DIAMONDS, OBE_ABE]]
+        points_team_0, points_team_1 = rollout_batch(rounds, 3)
+        for i, rnd in enumerate(rounds):
+            np.testing.assert_array_equal(np.full(3, rnd.points_team_0), points_team_0[i])
+            np.testing.assert_array_equal(np.full(3, rnd.points_team_1), points_team_1[i])
+
+    def test_rollout_batch_played_cards(self):
+        rounds = [self._create_round(SPADES, 4), self._create_round(SPADES, 5)]
+        with self.assertRaises(ValueError):
+            rollout_batch(rounds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
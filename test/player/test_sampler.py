@@ -0,0 +1,103 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_factory import get_round
+from source.jass.base.round_schieber import RoundSchieber
+from source.jass.player.mcts.sampler import Sampler
+
+
+class SamplerTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def _play_tricks(self, tricks: list) -> RoundSchieber:
+        # north holds the trump jack as only trump, so north does not need to follow trump
+        hands = np.zeros((4, 36), dtype=np.int32)
+        hands[NORTH, [HJ, DA, DK, DQ, DJ, D10, D9, D8, D7]] = 1
+        hands[EAST, [H6, H7, H8, SA, SK, SQ, SJ, S10, S9]] = 1
+        hands[SOUTH, [HA, HK, HQ, CA, CK, CQ, CJ, C10, C9]] = 1
+        hands[WEST, [H10, H9, D6, S8, S7, S6, C8, C7, C6]] = 1
+        rnd = RoundSchieber(dealer=WEST)
+        rnd.set_hands(hands)
+        rnd.action_trump(HEARTS)
+        for trick in tricks:
+            for card in trick:
+                self.assertEqual(1, rnd.get_valid_cards()[card])
+                rnd.action_play_card(card)
+        return rnd
+
+    @staticmethod
+    def _player_round(rnd) -> PlayerRound:
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        return player_rnd
+
+    def _assert_consistent(self, player_rnd: PlayerRound, hands: np.ndarray):
+        nr_cards = Sampler.get_nr_cards(player_rnd)
+        played = np.zeros(36, dtype=np.int32)
+        played[player_rnd.tricks[player_rnd.tricks >= 0]] = 1
+        for sample in hands:
+            np.testing.assert_array_equal(player_rnd.hand, sample[player_rnd.player])
+            np.testing.assert_array_equal(nr_cards, sample.sum(axis=1))
+            # every card is either played or in exactly one hand
+            np.testing.assert_array_equal(np.ones(36), sample.sum(axis=0) + played)
+
+    def test_hand_sizes(self):
+        for nr_played_cards in range(0, 36, 3):
+            rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+            rnd.deal_cards()
+            rnd.action_trump(nr_played_cards % (MAX_TRUMP + 1))
+            for _ in range(nr_played_cards):
+                rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+            player_rnd = self._player_round(rnd)
+            hands = Sampler.sample_hands(player_rnd, 50)
+            self.assertEqual((50, 4, 36), hands.shape)
+            self._assert_consistent(player_rnd, hands)
+            # the actual deal is one of the possible deals
+            allowed = Sampler.get_allowed_cards(player_rnd)
+            self.assertTrue(np.all(allowed >= rnd.hands))
+
+    def test_voids(self):
+        # south and east do not follow diamonds in the second trick
+        rnd = self._play_tricks([[HA, H6, DA, H9], [D6, C9, S9, DK]])
+        self.assertEqual(NORTH, rnd.player)
+        player_rnd = self._player_round(rnd)
+        voids = Sampler.get_voids(player_rnd)
+        self.assertTrue(voids[SOUTH, DIAMONDS])
+        self.assertTrue(voids[EAST, DIAMONDS])
+        self.assertFalse(voids[WEST, DIAMONDS])
+        self.assertEqual(3, np.sum(voids))
+
+        hands = Sampler.sample_hands(player_rnd, 200)
+        self._assert_consistent(player_rnd, hands)
+        diamonds = color_masks[DIAMONDS] == 1
+        self.assertEqual(0, np.sum(hands[:, SOUTH, diamonds]))
+        self.assertEqual(0, np.sum(hands[:, EAST, diamonds]))
+
+    def test_trump_jack(self):
+        # north does not follow the trump lead by south, but may still hold the trump jack
+        rnd = self._play_tricks([[HA, H6, DA, H9]])
+        self.assertEqual(WEST, rnd.player)
+        player_rnd = self._player_round(rnd)
+        self.assertTrue(Sampler.get_voids(player_rnd)[NORTH, HEARTS])
+
+        hands = Sampler.sample_hands(player_rnd, 200)
+        self._assert_consistent(player_rnd, hands)
+        hearts = color_masks[HEARTS] == 1
+        hearts[HJ] = False
+        self.assertEqual(0, np.sum(hands[:, NORTH, hearts]))
+        self.assertGreater(np.sum(hands[:, NORTH, HJ]), 0)
+        self.assertLess(np.sum(hands[:, NORTH, HJ]), 200)
+
+    def test_sample(self):
+        rnd = self._play_tricks([[HA, H6, DA, H9]])
+        player_rnd = self._player_round(rnd)
+        world = Sampler.sample(player_rnd)
+        world.assert_invariants()
+        self.assertEqual(player_rnd.nr_played_cards, world.nr_played_cards)
+        np.testing.assert_array_equal(player_rnd.hand, world.hands[WEST])
+
+
+if __name__ == '__main__':
+    unittest.main()
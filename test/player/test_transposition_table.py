@@ -0,0 +1,64 @@
+import unittest
+
+from source.jass.player.transposition_table import TranspositionTable
+
+
+class TranspositionTableTestCase(unittest.TestCase):
+    def test_get_put(self):
+        table = TranspositionTable(nr_buckets=16)
+        self.assertIsNone(table.get(5))
+        table.put(5, 'a')
+        table.put(6, 'b')
+        self.assertEqual('a', table.get(5))
+        self.assertEqual('b', table.get(6))
+        table.put(5, 'c')
+        self.assertEqual('c', table.get(5))
+        self.assertEqual(2, len(table))
+        self.assertAlmostEqual(0.75, table.hit_rate)
+
+    def test_replacement(self):
+        # all keys fall into the same bucket
+        table = TranspositionTable(nr_buckets=1)
+        table.put(1, 'a', priority=5)
+        # lower priority goes to the second slot
+        table.put(2, 'b', priority=1)
+        self.assertEqual('a', table.get(1))
+        self.assertEqual('b', table.get(2))
+        # the second slot is always replaced
+        table.put(3, 'c', priority=2)
+        self.assertEqual('a', table.get(1))
+        self.assertIsNone(table.get(2))
+        self.assertEqual('c', table.get(3))
+        # at least the same priority replaces the first slot, whose entry moves to the second slot
+        table.put(4, 'd', priority=5)
+        self.assertEqual('d', table.get(4))
+        self.assertEqual('a', table.get(1))
+        self.assertIsNone(table.get(3))
+        # an entry for the same key is replaced regardless of the priority
+        table.put(4, 'e', priority=0)
+        self.assertEqual('e', table.get(4))
+        self.assertEqual('a', table.get(1))
+        # a key in the second slot that moves to the first slot is not kept twice
+        table.put(1, 'f', priority=9)
+        self.assertEqual('f', table.get(1))
+        self.assertEqual(2, len(table))
+
+    def test_clear(self):
+        table = TranspositionTable(nr_buckets=4)
+        for key in range(8):
+            table.put(key, key)
+        table.get(0)
+        table.clear()
+        self.assertEqual(0, len(table))
+        self.assertEqual(0.0, table.hit_rate)
+        self.assertIsNone(table.get(0))
+
+    def test_nr_buckets(self):
+        with self.assertRaises(ValueError):
+            TranspositionTable(nr_buckets=3)
+        with self.assertRaises(ValueError):
+            TranspositionTable(nr_buckets=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
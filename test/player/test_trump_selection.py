@@ -0,0 +1,62 @@
+import unittest
+
+from source.jass.base.const import *
+from source.jass.base.player_round import PlayerRound
+from source.jass.base.round_schieber import RoundSchieber
+from source.jass.player.mcts.trump_selection import TrumpSelection
+from source.jass.player.search_budget import SearchBudget
+
+
+class TrumpSelectionTestCase(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.rnd = RoundSchieber(dealer=NORTH)
+        self.rnd.deal_cards()
+
+    @staticmethod
+    def _player_round(rnd) -> PlayerRound:
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        return player_rnd
+
+    def test_forehand(self):
+        player_rnd = self._player_round(self.rnd)
+        self.assertIsNone(player_rnd.forehand)
+        values, nr_deals = TrumpSelection.evaluate(player_rnd, SearchBudget(max_iterations=32), nr_rollouts=4,
+                                                   nr_deals_per_batch=16)
+        self.assertEqual(32, nr_deals)
+        self.assertEqual(set(range(MAX_TRUMP + 1)) | {PUSH}, set(values.keys()))
+        for value in values.values():
+            self.assertTrue(-157 <= value <= 157)
+
+        trump = TrumpSelection.select_trump(player_rnd, SearchBudget(max_iterations=16), nr_rollouts=4)
+        self.assertIn(trump, list(range(MAX_TRUMP + 1)) + [PUSH])
+
+    def test_rearhand(self):
+        self.rnd.action_trump(PUSH)
+        player_rnd = self._player_round(self.rnd)
+        self.assertEqual(partner_player[next_player[NORTH]], player_rnd.player)
+        values, _ = TrumpSelection.evaluate(player_rnd, SearchBudget(max_iterations=16), nr_rollouts=4)
+        # pushing is only allowed forehand
+        self.assertEqual(set(range(MAX_TRUMP + 1)), set(values.keys()))
+
+        trump = TrumpSelection.select_trump(player_rnd, SearchBudget(max_iterations=16), nr_rollouts=4)
+        self.assertIn(trump, range(MAX_TRUMP + 1))
+
+    def test_strong_hand(self):
+        hands = np.zeros((4, 36), dtype=np.int32)
+        hands[WEST, [HJ, H9, HA, HK, HQ, H10, DA, CA, C6]] = 1
+        hands[NORTH, [H8, H7, H6, DK, DQ, DJ, D10, D9, D8]] = 1
+        hands[EAST, [D7, D6, SA, SK, SQ, SJ, S10, S9, S8]] = 1
+        hands[SOUTH, [S7, S6, CK, CQ, CJ, C10, C9, C8, C7]] = 1
+        self.rnd.set_hands(hands)
+        player_rnd = self._player_round(self.rnd)
+        self.assertEqual(WEST, player_rnd.player)
+
+        values, _ = TrumpSelection.evaluate(player_rnd, SearchBudget(max_iterations=64), nr_rollouts=8)
+        for trump in [DIAMONDS, SPADES, CLUBS]:
+            self.assertGreater(values[HEARTS], values[trump])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Benchmark of the number of simulations per second of the root parallel MCTS for different numbers of processes.
+The player modules import the package jass, so the directory source must be on the PYTHONPATH.
+"""
+import argparse
+import os
+
+import numpy as np
+
+from jass.base.const import JASS_SCHIEBER_1000, NORTH, SPADES
+from jass.base.player_round import PlayerRound
+from jass.base.round_factory import get_round
+from jass.player.mcts.mcts_parallel import MCTSParallel, SEARCH_MCTS, SEARCH_ISMCTS
+
+
+def _create_player_round(nr_cards_played: int) -> PlayerRound:
+    rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+    rnd.deal_cards()
+    rnd.action_trump(SPADES)
+    for _ in range(nr_cards_played):
+        rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+    player_rnd = PlayerRound()
+    player_rnd.set_from_round(rnd)
+    return player_rnd
+
+
+def benchmark(max_processes: int, run_time_seconds: float, nr_cards_played: int, search: str):
+    player_rnd = _create_player_round(nr_cards_played)
+    print('{:>10} {:>14} {:>10}'.format('processes', 'simulations/s', 'speedup'))
+    base = None
+    for processes in range(1, max_processes + 1):
+        mcts = MCTSParallel(player_rnd, processes=processes, run_time_seconds=run_time_seconds,
+                            search=search)
+        mcts.run()
+        if base is None:
+            base = mcts.simulations_per_second
+        print('{:10d} {:14.0f} {:10.2f}'.format(processes, mcts.simulations_per_second,
+                                                mcts.simulations_per_second / base))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scaling of the root parallel MCTS')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Maximal number of processes')
+    parser.add_argument('--time', type=float, default=2.0, help='Search time in seconds for each measurement')
+    parser.add_argument('--cards', type=int, default=4, help='Number of cards played before the search')
+    parser.add_argument('--search', choices=[SEARCH_MCTS, SEARCH_ISMCTS], default=SEARCH_MCTS,
+                        help='Search algorithm')
+    args = parser.parse_args()
+    benchmark(args.processes, args.time, args.cards, args.search)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Benchmark of the random rollouts used in the MCTS simulations: playing the round with a random player, which
+creates a player round for every card, compared to the rollout on bitboards and to batches of rollouts played
+together. The player modules import the package jass, so the directory source must be on the PYTHONPATH.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from jass.base.const import JASS_SCHIEBER_1000, NORTH
+from jass.base.player_round import PlayerRound
+from jass.base.round import Round
+from jass.base.round_factory import get_round
+from jass.player.mcts.rollout import rollout, rollout_batch
+from jass.player.random_player_schieber import RandomPlayerSchieber
+
+
+def rollout_random_player(rnd: Round) -> (int, int):
+    """
+    Rollout as it was done in the MCTS before the rollout on bitboards.
+    """
+    rnd = rnd.clone()
+    random_player = RandomPlayerSchieber()
+    while rnd.nr_played_cards < 36:
+        player_rnd = PlayerRound()
+        player_rnd.set_from_round(rnd)
+        rnd.action_play_card(random_player.play_card(player_rnd))
+    return rnd.points_team_0, rnd.points_team_1
+
+
+def _run(rollout_function, rounds: list, run_time_seconds: float) -> float:
+    nr_rollouts = 0
+    start_time = time.time()
+    while time.time() - start_time < run_time_seconds:
+        rollout_function(rounds[nr_rollouts % len(rounds)])
+        nr_rollouts += 1
+    return nr_rollouts / (time.time() - start_time)
+
+
+def _run_batch(rounds: list, batch_size: int, run_time_seconds: float) -> float:
+    # a batch of rollouts of one round at a time, cycling through the rounds
+    nr_batches = 0
+    start_time = time.time()
+    while time.time() - start_time < run_time_seconds:
+        rollout_batch([rounds[nr_batches % len(rounds)]], batch_size)
+        nr_batches += 1
+    return nr_batches * batch_size / (time.time() - start_time)
+
+
+def benchmark(nr_rounds: int, run_time_seconds: float, batch_sizes: list):
+    rounds = []
+    for i in range(nr_rounds):
+        rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+        rnd.deal_cards()
+        rnd.action_trump(i % 6)
+        rounds.append(rnd)
+
+    before = _run(rollout_random_player, rounds, run_time_seconds)
+    after = _run(rollout, rounds, run_time_seconds)
+    print('{:>14} {:>14}'.format('implementation', 'rollouts/s'))
+    print('{:>14} {:14.0f}'.format('random player', before))
+    print('{:>14} {:14.0f}'.format('bitboard', after))
+    print('speedup: {:.1f}'.format(after / before))
+    for batch_size in batch_sizes:
+        print('{:>14} {:14.0f}'.format('batch {}'.format(batch_size),
+                                       _run_batch(rounds, batch_size, run_time_seconds)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the random rollouts of the MCTS')
+    parser.add_argument('--rounds', type=int, default=100, help='Number of different rounds to play')
+    parser.add_argument('--time', type=float, default=2.0, help='Time in seconds for each measurement')
+    parser.add_argument('--batch', type=int, nargs='*', default=[16, 64, 256, 1024],
+                        help='Sizes of the batches of rollouts played together')
+    args = parser.parse_args()
+    np.random.seed(1)
+    benchmark(args.rounds, args.time, args.batch)
+
+
+if __name__ == '__main__':
+    main()
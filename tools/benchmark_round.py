@@ -0,0 +1,68 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Benchmark of the costs to allocate, copy and pickle round objects for the different round implementations.
+"""
+import argparse
+import copy
+import pickle
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from source.jass.base.const import JASS_SCHIEBER_1000, NORTH, SPADES
+from source.jass.base.round_factory import get_round
+
+
+def _create_round(compact: bool):
+    rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH, compact=compact)
+    rnd.deal_cards()
+    rnd.action_trump(SPADES)
+    for _ in range(10):
+        rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+    return rnd
+
+
+def _memory_per_round(compact: bool, nr_rounds: int) -> float:
+    tracemalloc.start()
+    rounds = [get_round(JASS_SCHIEBER_1000, dealer=NORTH, compact=compact) for _ in range(nr_rounds)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rounds
+    return size / nr_rounds
+
+
+def benchmark(number: int):
+    print('{:10} {:>12} {:>12} {:>12} {:>12} {:>12} {:>12}'.format(
+        'round', 'alloc [us]', 'copy [us]', 'clone [us]', 'pickle [us]', 'pickle [B]', 'memory [B]'))
+    for compact in [False, True]:
+        rnd = _create_round(compact)
+        time_alloc = timeit.timeit(lambda: get_round(JASS_SCHIEBER_1000, dealer=NORTH, compact=compact),
+                                   number=number)
+        time_copy = timeit.timeit(lambda: copy.deepcopy(rnd), number=number)
+        time_clone = timeit.timeit(lambda: rnd.clone(), number=number)
+        time_pickle = timeit.timeit(lambda: pickle.loads(pickle.dumps(rnd)), number=number)
+        pickle_size = len(pickle.dumps(rnd))
+        memory = _memory_per_round(compact, number)
+        print('{:10} {:12.2f} {:12.2f} {:12.2f} {:12.2f} {:12d} {:12.0f}'.format(
+            'compact' if compact else 'standard',
+            1e6 * time_alloc / number,
+            1e6 * time_copy / number,
+            1e6 * time_clone / number,
+            1e6 * time_pickle / number,
+            pickle_size,
+            memory))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark allocation, copying and pickling of rounds')
+    parser.add_argument('--number', type=int, default=10000, help='Number of repetitions for each measurement')
+    args = parser.parse_args()
+    benchmark(args.number)
+
+
+if __name__ == '__main__':
+    main()
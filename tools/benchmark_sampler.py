@@ -0,0 +1,54 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Benchmark of the throughput of the sampler of the hidden cards for MCTS, sampling one deal per call and many deals
+per call. The player modules import the package jass, so the directory source must be on the PYTHONPATH.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from jass.base.const import JASS_SCHIEBER_1000, NORTH, SPADES
+from jass.base.player_round import PlayerRound
+from jass.base.round_factory import get_round
+from jass.player.mcts.sampler import Sampler
+
+
+def _create_player_round(nr_cards_played: int) -> PlayerRound:
+    rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+    rnd.deal_cards()
+    rnd.action_trump(SPADES)
+    for _ in range(nr_cards_played):
+        rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+    player_rnd = PlayerRound()
+    player_rnd.set_from_round(rnd)
+    return player_rnd
+
+
+def benchmark(nr_cards_played: int, batch_sizes: list, run_time_seconds: float):
+    player_rnd = _create_player_round(nr_cards_played)
+    print('voids:\n{}'.format(Sampler.get_voids(player_rnd).astype(int)))
+    print('{:>10} {:>14}'.format('batch', 'samples/s'))
+    for batch_size in batch_sizes:
+        nr_samples = 0
+        start_time = time.time()
+        while time.time() - start_time < run_time_seconds:
+            Sampler.sample_hands(player_rnd, batch_size)
+            nr_samples += batch_size
+        print('{:10d} {:14.0f}'.format(batch_size, nr_samples / (time.time() - start_time)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the sampling of the hidden cards')
+    parser.add_argument('--cards', type=int, default=12, help='Number of cards played before sampling')
+    parser.add_argument('--batch', type=int, nargs='+', default=[1, 16, 256, 4096], help='Samples per call')
+    parser.add_argument('--time', type=float, default=1.0, help='Time in seconds for each measurement')
+    args = parser.parse_args()
+    benchmark(args.cards, args.batch, args.time)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# HSLU
+#
+# Created on 18.10.26
+#
+"""
+Comparison of the root parallel and the tree parallel MCTS with the same number of processes and the same search
+time. The quality of a decision is measured by its regret: for each position, the hidden cards are sampled a number
+of times and the points of every card are calculated exactly with the double dummy solver for each sample. The
+regret of a card is the difference between the mean points of the best card and the mean points of the card. The
+positions are taken late in the round, so that the solver is fast. The player modules import the package jass, so
+the directory source must be on the PYTHONPATH.
+"""
+import argparse
+import os
+
+import numpy as np
+
+from jass.base.const import JASS_SCHIEBER_1000, NORTH
+from jass.base.player_round import PlayerRound
+from jass.base.round_factory import get_round
+from jass.player.double_dummy_solver import DoubleDummySolver
+from jass.player.mcts.mcts_parallel import SEARCH_ISMCTS, SEARCH_MCTS
+from jass.player.mcts.mcts_worker_pool import MCTSWorkerPool
+from jass.player.mcts.sampler import Sampler
+from jass.player.search_budget import SearchBudget
+
+
+def _create_player_round(nr_cards_played: int, trump: int) -> PlayerRound:
+    rnd = get_round(JASS_SCHIEBER_1000, dealer=NORTH)
+    rnd.deal_cards()
+    rnd.action_trump(trump)
+    for _ in range(nr_cards_played):
+        rnd.action_play_card(np.random.choice(np.flatnonzero(rnd.get_valid_cards())))
+    player_rnd = PlayerRound()
+    player_rnd.set_from_round(rnd)
+    return player_rnd
+
+
+def _mean_points_by_card(player_rnd: PlayerRound, nr_worlds: int) -> np.ndarray:
+    """
+    Mean points of the team of the player for each valid card over sampled worlds, with optimal play afterwards.
+    """
+    solver = DoubleDummySolver(player_rnd.trump)
+    team = player_rnd.player % 2
+    points = np.zeros(36, dtype=np.float64)
+    for _ in range(nr_worlds):
+        for card, team_points in solver.solve_cards(Sampler.sample(player_rnd)).items():
+            points[card] += team_points[team]
+    return points / nr_worlds
+
+
+def benchmark(processes: int, run_time_seconds: float, nr_positions: int, nr_cards_played: int, nr_worlds: int):
+    searches = [('root ' + SEARCH_MCTS, SEARCH_MCTS, False),
+                ('root ' + SEARCH_ISMCTS, SEARCH_ISMCTS, False),
+                ('tree ' + SEARCH_MCTS, SEARCH_MCTS, True)]
+    regrets = {name: [] for name, _, _ in searches}
+    simulations = {name: [] for name, _, _ in searches}
+    with MCTSWorkerPool(processes) as pool:
+        for i in range(nr_positions):
+            player_rnd = _create_player_round(nr_cards_played, i % 6)
+            valid_cards = np.flatnonzero(player_rnd.get_valid_cards())
+            if len(valid_cards) == 1:
+                continue
+            mean_points = _mean_points_by_card(player_rnd, nr_worlds)
+            best_points = np.max(mean_points[valid_cards])
+            for name, search, tree_parallel in searches:
+                mcts = pool.search(player_rnd, SearchBudget.from_time(run_time_seconds), search=search,
+                                   tree_parallel=tree_parallel)
+                regrets[name].append(best_points - mean_points[mcts.best_card])
+                simulations[name].append(mcts.simulations_per_second)
+
+    print('{:>14} {:>12} {:>14}'.format('search', 'mean regret', 'simulations/s'))
+    for name, _, _ in searches:
+        print('{:>14} {:12.2f} {:14.0f}'.format(name, np.mean(regrets[name]), np.mean(simulations[name])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the root parallel and the tree parallel MCTS')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of processes')
+    parser.add_argument('--time', type=float, default=1.0, help='Search time in seconds for each position')
+    parser.add_argument('--positions', type=int, default=20, help='Number of positions')
+    parser.add_argument('--cards', type=int, default=20, help='Number of cards played before the search')
+    parser.add_argument('--worlds', type=int, default=20, help='Number of sampled worlds to rate the cards')
+    args = parser.parse_args()
+    np.random.seed(1)
+    benchmark(args.processes, args.time, args.positions, args.cards, args.worlds)
+
+
+if __name__ == '__main__':
+    main()